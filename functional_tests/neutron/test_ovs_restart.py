@@ -278,6 +278,7 @@ def test_restart_adds_new_flows(
     #. Restart ovs-agents
     #. Get list of flows for br_int on server's compute
     #. Check that all cookies are changed
+    #. Check that flows without timeouts are the same except cookies
 
     **Teardown:**
 
@@ -293,7 +294,9 @@ def test_restart_adds_new_flows(
     compute_fqdn = getattr(server, config.SERVER_HOST_ATTR)
     compute_node = os_faults_steps.get_node(fqdns=[compute_fqdn])
 
-    old_cookies = os_faults_steps.get_ovs_flows_cookies(compute_node)
+    old_flows = os_faults_steps.get_ovs_flows(compute_node)
+    old_cookies = os_faults_steps.get_ovs_flows_cookies(compute_node,
+                                                        flows=old_flows)
 
     os_faults_steps.restart_services([config.NEUTRON_OVS_SERVICE])
     agent_steps.check_alive(ovs_agents,
@@ -301,6 +304,7 @@ def test_restart_adds_new_flows(
 
     os_faults_steps.check_ovs_flow_cookies(compute_node,
                                            not_contain=old_cookies)
+    os_faults_steps.check_ovs_flows_diff(old_flows)
 
 
 @pytest.mark.requires("vlan")
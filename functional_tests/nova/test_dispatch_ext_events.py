@@ -58,7 +58,7 @@ def test_dispatch_external_event(
     network_name = next(utils.generate_ids('network'))
     network = create_network(network_name)
     subnet_name = next(utils.generate_ids('subnet'))
-    create_subnet(subnet_name, network=network, cidr='192.168.1.0/24')
+    create_subnet(subnet_name, network=network)
 
     server = server_steps.create_servers(
         image=cirros_image,
@@ -81,7 +81,9 @@ def volume_steps(unexpected_volumes_cleanup,
         VolumeSteps: instantiated volume steps
     """
     _volume_steps = get_volume_steps(config.CURRENT_CINDER_VERSION)
-    volumes = _volume_steps.get_volumes(all_projects=True, check=False)
+    volumes = _volume_steps.get_volumes(all_projects=True,
+                                        fields=config.CLEANUP_FIELDS,
+                                        check=False)
     volume_ids_before = {volume.id for volume in volumes}
 
     yield _volume_steps
@@ -104,7 +106,9 @@ def primary_volumes(get_volume_steps,
     """
     volume_ids_before = set()
     volume_steps = get_volume_steps(config.CURRENT_CINDER_VERSION)
-    for volume in volume_steps.get_volumes(all_projects=True, check=False):
+    for volume in volume_steps.get_volumes(all_projects=True,
+                                           fields=config.CLEANUP_FIELDS,
+                                           check=False):
         uncleanable.volume_ids.add(volume.id)
         volume_ids_before.add(volume.id)
 
@@ -128,6 +132,7 @@ def cleanup_volumes(uncleanable):
         deleting_volumes = []
 
         for volume in _volume_steps.get_volumes(all_projects=True,
+                                                fields=config.CLEANUP_FIELDS,
                                                 check=False):
             if volume.id not in uncleanable_ids:
                 deleting_volumes.append(volume)
@@ -24,6 +24,7 @@ from hamcrest import (assert_that, calling, empty, equal_to, has_entries,
 
 from stepler import base
 from stepler import config
+from stepler.third_party import pagination
 from stepler.third_party import steps_checker
 from stepler.third_party import utils
 from stepler.third_party import waiter
@@ -228,9 +229,14 @@ class VolumeSteps(base.BaseSteps):
                     metadata=None,
                     all_projects=False,
                     search_opts=None,
+                    limit=None,
+                    fields=None,
                     check=True):
         """Step to retrieve volumes.
 
+        Volumes are requested page by page, so only required volumes are
+        fetched if ``limit`` is passed.
+
         Args:
             name_prefix (str, optional): Prefix to filter volumes by name.
             metadata (dict, optional): Data to filter volume by metadata
@@ -239,6 +245,9 @@ class VolumeSteps(base.BaseSteps):
                 from all available projects or not.
             search_opts (dict: optional): API filter options to retrieve
                 volumes.
+            limit (int, optional): Max count of volumes to retrieve.
+            fields (tuple, optional): Fields of lightweight records to
+                project volumes to.
             check (bool, optional): Flag whether to check step or not.
 
         Returns:
@@ -247,26 +256,23 @@ class VolumeSteps(base.BaseSteps):
         Raises:
             AssertionError: If volumes collection is empty.
         """
+        search_opts = dict(search_opts or {})
         if all_projects:
-            search_opts = search_opts or {}
             search_opts['all_tenants'] = 1
 
-        volumes = self._client.list(search_opts=search_opts)
-
-        if name_prefix:
-            volumes = [volume for volume in volumes
-                       if (volume.name or '').startswith(name_prefix)]
+        volumes = pagination.iter_pages(self._client.list,
+                                        config.LIST_PAGE_SIZE,
+                                        search_opts=search_opts)
+        volumes = pagination.filter_by_name_prefix(volumes, name_prefix)
 
         if metadata:
-            filtered_volumes = []
             metaset = set(metadata.items())
+            volumes = (volume for volume in volumes
+                       if metaset.issubset(set(volume.metadata.items())))
 
-            for volume in volumes:
-                volume_metaset = set(volume.metadata.items())
-                if metaset.issubset(volume_metaset):
-                    filtered_volumes.append(volume)
-
-            volumes = filtered_volumes
+        if fields:
+            volumes = pagination.project(volumes, fields)
+        volumes = pagination.take(volumes, limit)
 
         if check:
             assert_that(volumes, is_not(empty()))
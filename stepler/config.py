@@ -61,10 +61,25 @@ FEDORA_QCOW2_URL = 'https://download.fedoraproject.org/pub/fedora/linux/releases
 CIRROS_QCOW2_URL = 'http://download.cirros-cloud.net/0.3.4/cirros-0.3.4-x86_64-disk.img'  # noqa E501
 UBUNTU_ISO_URL = 'http://archive.ubuntu.com/ubuntu/dists/trusty/main/installer-amd64/current/images/netboot/mini.iso'  # noqa E501
 
+# Expected checksums of images with fixed content, keyed by URL. Other images
+# are checked by checksum from server headers, if server provides it.
+IMAGE_CHECKSUMS = {
+    CIRROS_QCOW2_URL: 'md5:ee1eca47dc88f4879d8a229cc70a07c6',
+}
+
 # TODO(schipiga): copied from mos-integration-tests, need refactor.
 TEST_IMAGE_PATH = os.environ.get("TEST_IMAGE_PATH",
                                  os.path.expanduser('~/images'))
 
+# Count of parallel range requests to download large image
+IMAGE_DOWNLOAD_THREADS = int(os.environ.get('IMAGE_DOWNLOAD_THREADS', 4))
+
+# Count of objects requested per page by list steps
+LIST_PAGE_SIZE = int(os.environ.get('LIST_PAGE_SIZE', 500))
+
+# Fields of objects which cleanup fixtures keep in memory
+CLEANUP_FIELDS = ('id', 'name', 'status')
+
 TEST_REPORTS_DIR = os.environ.get(
     "TEST_REPORTS_DIR",
     os.path.join(os.getcwd(),  # put results to folder where tests are launched
@@ -74,6 +89,12 @@ TEST_REPORTS_DIR = os.path.abspath(os.path.expanduser(TEST_REPORTS_DIR))
 if not os.path.exists(TEST_REPORTS_DIR):
     os.mkdir(TEST_REPORTS_DIR)
 
+# Path to file to persist environment facts (used by skip predicates) to
+# between test sessions. Facts aren't persisted if it's not set.
+ENV_FACTS_CACHE_PATH = os.environ.get('ENV_FACTS_CACHE_PATH')
+# Lifetime of persisted environment facts (in seconds)
+ENV_FACTS_CACHE_TTL = int(os.environ.get('ENV_FACTS_CACHE_TTL', 60 * 60))
+
 GOOGLE_DNS_IP = '8.8.8.8'
 
 # IMAGE / SERVER CREDENTIALS
@@ -123,6 +144,8 @@ STATUS_SHUTOFF = 'shutoff'
 # TIMEOUTS (in seconds)
 # TODO(kromanenko): Investigate less intensive good polling interval value.
 POLLING_TIME = 1
+# Polling of nodes state via persistent SSH sessions is cheap
+SSH_EXECUTOR_POLLING_TIME = 0.1
 
 # Cinder
 VOLUME_AVAILABLE_TIMEOUT = 5 * 60
@@ -147,6 +170,15 @@ TRANSFER_SHOW_TIMEOUT = 60
 # Glance
 IMAGE_AVAILABLE_TIMEOUT = 5 * 60
 IMAGE_QUEUED_TIMEOUT = 30
+# Max count of parallel image uploads
+GLANCE_UPLOAD_THREADS = int(os.environ.get('GLANCE_UPLOAD_THREADS', 4))
+# Keep session images in glance between tests launchings and reuse them
+GLANCE_KEEP_WARM = bool(os.environ.get('GLANCE_KEEP_WARM', False))
+# Lifetime of kept images since last usage (in seconds)
+GLANCE_KEEP_WARM_LEASE = int(
+    os.environ.get('GLANCE_KEEP_WARM_LEASE', 7 * 24 * 60 * 60))
+# Image property with expiration time of image lease (unix time)
+IMAGE_LEASE_PROPERTY = 'stepler_lease'
 
 # Nova
 CREDENTIALS_PREFIX = 'stepler_credentials_'
@@ -172,7 +204,7 @@ ROUTER_NAMESPACE_TIMEOUT = 15
 SSH_CLIENT_TIMEOUT = 60
 SSH_CONNECT_TIMEOUT = 8 * 60
 LIVE_MIGRATE_TIMEOUT = 5 * 60
-LIVE_MIGRATION_PING_MAX_LOSS = 20
+LIVE_MIGRATION_MAX_OUTAGE = 0.5
 VERIFY_RESIZE_TIMEOUT = 3 * 60
 SOFT_DELETED_TIMEOUT = 30
 SERVER_DELETE_TIMEOUT = 3 * 60
@@ -215,6 +247,8 @@ NOVA_INSTANCES_PATH = "/var/lib/nova/instances/"
 
 FIXED_IP = 'fixed'
 FLOATING_IP = 'floating'
+# Count of threads to create, attach and delete floating IPs in bulk
+FLOATING_IP_THREADS = int(os.environ.get('FLOATING_IP_THREADS', 8))
 
 SERVER_ATTR_HOST = 'OS-EXT-SRV-ATTR:host'
 SERVER_ATTR_INSTANCE_NAME = 'OS-EXT-SRV-ATTR:instance_name'
@@ -260,6 +294,11 @@ CLEANUP_UNEXPECTED_AFTER_ALL = bool(
 UNEXPECTED_VOLUMES_LIMIT = int(
     os.environ.get('UNEXPECTED_VOLUMES_LIMIT', 0))
 
+# Reuse network, subnet and router of fixtures among tests until test changes
+# them. Tests must not rely on absence of other ports in reused network.
+REUSE_NEUTRON_RESOURCES = bool(
+    os.environ.get('REUSE_NEUTRON_RESOURCES', False))
+
 
 # Neutron
 NEUTRON_L3_SERVICE = 'neutron-l3-agent'
@@ -268,13 +307,29 @@ NEUTRON_OVS_SERVICE = 'neutron-openvswitch-agent'
 NEUTRON_METADATA_SERVICE = 'neutron-metadata-agent'
 NEUTRON_SERVER_SERVICE = 'neutron-server'
 
+# Max count of parallel delete requests of neutron client wrapper
+NEUTRON_DELETE_THREADS = int(os.environ.get('NEUTRON_DELETE_THREADS', 8))
+# Lifetime of cached neutron lookups which aren't changed by tests
+NEUTRON_READ_CACHE_TTL = int(os.environ.get('NEUTRON_READ_CACHE_TTL', 60))
+# Lifetime of cached network DHCP hosts, it's short as DHCP agents may be
+# rescheduled by tests
+NEUTRON_DHCP_HOST_CACHE_TTL = int(
+    os.environ.get('NEUTRON_DHCP_HOST_CACHE_TTL', 10))
+
 NEUTRON_AGENT_DIE_TIMEOUT = 60
 NEUTRON_AGENT_ALIVE_TIMEOUT = 60
+# Interval of agents and routers hosting states polling by watcher
+NEUTRON_AGENTS_WATCHER_INTERVAL = float(
+    os.environ.get('NEUTRON_AGENTS_WATCHER_INTERVAL', 1))
 NEUTRON_OVS_RESTART_MAX_PING_LOSS = 50
 NEUTRON_OVS_RESTART_MAX_ARPING_LOSS = 50
 NEUTRON_OVS_RESTART_MAX_IPERF_LOSS = 50
 NEUTRON_L3_HA_RESTART_MAX_PING_LOSS = 100
 
+# Interval between downtime meter probes (in seconds)
+DOWNTIME_PROBE_INTERVAL = float(
+    os.environ.get('DOWNTIME_PROBE_INTERVAL', 0.01))
+
 SERVICE_TERMINATE_TIMEOUT = 60
 SERVICE_START_TIMEOUT = 60
 AGENT_RESCHEDULING_TIMEOUT = 3 * 60
@@ -309,6 +364,9 @@ HA_STATE_ACTIVE_ATTRS = {'ha_state': 'active'}
 ROUTER_AVAILABLE_TIMEOUT = 60
 
 LOCAL_CIDR = '192.168.3.0/24'
+# IPv4 range to allocate non-overlapping subnets CIDRs from
+NEUTRON_CIDR_POOL = os.environ.get('NEUTRON_CIDR_POOL', '10.0.0.0/16')
+NEUTRON_CIDR_PREFIX_LEN = int(os.environ.get('NEUTRON_CIDR_PREFIX_LEN', 24))
 
 # Volume creating constants
 IMAGE_SOURCE = 'Image'
@@ -19,8 +19,11 @@ Includes fixtures available in global scope among all tests.
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pytest
+
 from stepler.cinder.conftest import *  # noqa
 from stepler.fixtures import *  # noqa
+from stepler.fixtures import skip
 from stepler.glance.conftest import *  # noqa
 from stepler.heat.conftest import *  # noqa
 from stepler.keystone.conftest import *  # noqa
@@ -34,6 +37,9 @@ __all__ = sorted([  # sort for documentation
     'ip_by_host',
     'get_session',
     'session',
+    'resource_cache',
+    'shared_resources',
+    'env_facts',
     'skip_test',
     'uncleanable',
     'report_log',
@@ -112,6 +118,7 @@ __all__ = sorted([  # sort for documentation
     'public_network',
     'create_port',
     'port',
+    'cidr_allocator',
     'create_subnet',
     'subnet',
     'create_router',
@@ -133,6 +140,7 @@ __all__ = sorted([  # sort for documentation
     'neutron_2_servers_diff_nets_with_floating',
     'neutron_2_servers_same_network',
     'neutron_2_servers_iperf_different_networks',
+    'agents_watcher',
     'get_agent_steps',
     'agent_steps',
     'reschedule_router_active_l3_agent',
@@ -151,7 +159,9 @@ __all__ = sorted([  # sort for documentation
     'tiny_flavor',
 
     'nova_create_floating_ip',
+    'nova_create_floating_ips',
     'nova_floating_ip',
+    'nova_floating_ip_pool',
     'nova_floating_ip_steps',
 
     'host_steps',
@@ -182,6 +192,7 @@ __all__ = sorted([  # sort for documentation
     'create_servers_context',
     'get_server_steps',
     'get_ssh_proxy_cmd',
+    'get_ssh_proxy_cmds',
     'server',
     'server_steps',
     'live_migration_server',
@@ -207,3 +218,25 @@ _plugins = [
 ]
 
 pytest_plugins = map(lambda plugin: 'stepler.third_party.' + plugin, _plugins)
+
+
+def pytest_configure(config):
+    """Hook to load environment facts for tests deselection."""
+    # xdist workers get facts from master to collect the same tests
+    if not hasattr(config, 'slaveinput'):
+        config.env_facts = skip.get_cached_env_facts(config)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hook to pass environment facts to xdist worker."""
+    node.slaveinput['env_facts'] = node.config.env_facts
+
+
+def pytest_collection_modifyitems(config, items):
+    """Hook to deselect tests with ``requires`` mismatched to environment."""
+    if hasattr(config, 'slaveinput'):
+        facts = config.slaveinput['env_facts']
+    else:
+        facts = config.env_facts
+    skip.deselect_by_requires(config, items, facts)
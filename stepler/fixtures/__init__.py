@@ -29,10 +29,13 @@ __all__ = sorted([  # sort for documentation
 
     'get_session',
     'session',
+    'resource_cache',
+    'shared_resources',
     'uncleanable',
 
     'report_log',
     'report_dir',
 
+    'env_facts',
     'skip_test',
 ])
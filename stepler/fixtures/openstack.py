@@ -17,16 +17,22 @@ Openstack fixtures
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
 import attrdict
 from keystoneauth1 import identity
 from keystoneauth1 import session as _session
 import pytest
 
 from stepler import config
+from stepler.third_party import resource_cache as _resource_cache
+from stepler.third_party import shared_resources as _shared_resources
 
 __all__ = [
     'get_session',
+    'resource_cache',
     'session',
+    'shared_resources',
     'uncleanable',
 ]
 
@@ -111,3 +117,31 @@ def uncleanable():
     data.transfer_ids = set()
     data.volume_ids = set()
     return data
+
+
+@pytest.yield_fixture(scope='session')
+def resource_cache():
+    """Session fixture to get cache of resources reused by tests.
+
+    Cached resources are deleted at the end of session.
+
+    Yields:
+        stepler.third_party.resource_cache.ResourceCache: resources cache
+    """
+    cache = _resource_cache.ResourceCache()
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture(scope='session')
+def shared_resources():
+    """Session fixture to get registry of resources shared among workers.
+
+    Registry file is placed to test reports folder, which is cleaned before
+    tests launching, so resources are shared inside one tests launching only.
+
+    Returns:
+        stepler.third_party.shared_resources.SharedResources: registry
+    """
+    return _shared_resources.SharedResources(
+        os.path.join(config.TEST_REPORTS_DIR, 'shared_resources.json'))
@@ -23,8 +23,10 @@ import functools
 import pytest
 
 from stepler import config
+from stepler.third_party import facts_cache
 
 __all__ = [
+    'env_facts',
     'skip_test',
 ]
 
@@ -32,6 +34,35 @@ __all__ = [
 PREDICATES = 'predicates'
 
 
+def _make_env_facts(pytest_config):
+    snapshot_name = pytest_config.getoption('snapshot_name', None)
+    return facts_cache.FactsCache(
+        path=config.ENV_FACTS_CACHE_PATH,
+        key='{} {}'.format(config.AUTH_URL, snapshot_name),
+        ttl=config.ENV_FACTS_CACHE_TTL)
+
+
+@pytest.fixture(scope='session')
+def env_facts(request):
+    """Session fixture to get cache of environment facts.
+
+    Facts are calculated once per session. If ``ENV_FACTS_CACHE_PATH`` is
+    set, they are persisted to file and reused by next sessions during
+    ``ENV_FACTS_CACHE_TTL``. Facts are persisted per cloud (keystone URL) and
+    snapshot name, because after revert cloud returns to snapshot state.
+
+    In destructive scenarios this fixture is re-created after each revert,
+    so facts are not kept in memory between reverts.
+
+    Args:
+        request (object): pytest request
+
+    Returns:
+        stepler.third_party.facts_cache.FactsCache: facts cache
+    """
+    return _make_env_facts(request.config)
+
+
 @pytest.fixture(autouse=True)
 def skip_test(request):
     """Autouse function fixture to skip test by predicate.
@@ -53,17 +84,11 @@ def skip_test(request):
     if not marker:
         return
 
-    predicates = Predicates(request)
+    predicates = Predicates(request, request.getfixturevalue('env_facts'))
 
     for requires in marker.args:
 
-        tree = ast.parse(requires, mode='eval')
-
-        tree = RewritePredicates().visit(tree)
-        tree = ast.fix_missing_locations(tree)
-        code = compile(tree, '<ast>', mode='eval')
-
-        if not eval(code, {PREDICATES: predicates}):
+        if not _evaluate(requires, predicates):
             pytest.skip('Skipped due to a mismatch to condition: {!r}\n'
                         'Calculated conditions: {}'.format(
                             requires, predicates._get_calculated_conditions()))
@@ -71,6 +96,72 @@ def skip_test(request):
         predicates._clear_calls()
 
 
+def get_cached_env_facts(pytest_config):
+    """Get environment facts persisted by previous test sessions.
+
+    Args:
+        pytest_config (object): pytest config
+
+    Returns:
+        dict: facts values, keyed by fact name
+    """
+    return _make_env_facts(pytest_config).get_cached()
+
+
+def deselect_by_requires(pytest_config, items, facts):
+    """Deselect tests which ``requires`` markers mismatch to known facts.
+
+    Only already known facts are used, so no fixture is created. If condition
+    can't be calculated without unknown facts, test is kept and it's checked
+    by ``skip_test`` fixture.
+
+    Args:
+        pytest_config (object): pytest config
+        items (list): collected tests
+        facts (dict): known facts values, keyed by fact name
+    """
+    predicates = Predicates(None, facts_cache.FactsCache(facts=facts))
+    selected = []
+    deselected = []
+
+    for item in items:
+        marker = item.get_marker('requires')
+        is_selected = True
+
+        for requires in (marker.args if marker else []):
+            try:
+                is_selected = _evaluate(requires, predicates)
+            except UnknownFact:
+                pass
+            finally:
+                predicates._clear_calls()
+            if not is_selected:
+                break
+
+        if is_selected:
+            selected.append(item)
+        else:
+            deselected.append(item)
+
+    if deselected:
+        pytest_config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def _evaluate(requires, predicates):
+    tree = ast.parse(requires, mode='eval')
+
+    tree = RewritePredicates().visit(tree)
+    tree = ast.fix_missing_locations(tree)
+    code = compile(tree, '<ast>', mode='eval')
+
+    return eval(code, {PREDICATES: predicates})
+
+
+class UnknownFact(Exception):
+    """Fact can't be calculated without fixtures."""
+
+
 class RewritePredicates(ast.NodeTransformer):
     """Class to rewrite requires to predicate instance attributes."""
 
@@ -87,11 +178,25 @@ class RewritePredicates(ast.NodeTransformer):
 class Predicates(object):
     """Namespace for predicates to skip a test."""
 
-    def __init__(self, request):
-        """Initialize."""
+    def __init__(self, request, facts):
+        """Initialize.
+
+        Args:
+            request (object|None): pytest request. If None - only facts
+                from cache are available.
+            facts (FactsCache): environment facts cache
+        """
         self._request = request
+        self._facts = facts
         self._calls = []
 
+    def _cache_fact(f):
+        """Decorator to calculate fact once per session."""
+        @functools.wraps(f)
+        def wrapper(self):
+            return self._facts.get(f.__name__, lambda: f(self))
+        return wrapper
+
     def _store_call(f):
         """Decorator to store each method call with result."""
         @functools.wraps(f)
@@ -114,15 +219,19 @@ class Predicates(object):
         return ', '.join(['{}={}'.format(*call) for call in self._calls])
 
     def _get_fixture(self, fixture_name):
+        if self._request is None:
+            raise UnknownFact()
         return self._request.getfixturevalue(fixture_name)
 
     @property
+    @_cache_fact
     def _network_type(self):
         os_faults_steps = self._get_fixture('os_faults_steps')
         return os_faults_steps.get_network_type()
 
     @property
     @_store_call
+    @_cache_fact
     def computes_count(self):
         """Returns computes count."""
         hypervisor_steps = self._get_fixture('hypervisor_steps')
@@ -135,6 +244,7 @@ class Predicates(object):
 
     @property
     @_store_call
+    @_cache_fact
     def dhcp_agent_nodes_count(self):
         """Get DHCP agents nodes count."""
         os_faults_steps = self._get_fixture('os_faults_steps')
@@ -144,6 +254,7 @@ class Predicates(object):
 
     @property
     @_store_call
+    @_cache_fact
     def l3_agent_nodes_count(self):
         """Get L3 agents nodes count."""
         os_faults_steps = self._get_fixture('os_faults_steps')
@@ -153,6 +264,7 @@ class Predicates(object):
 
     @property
     @_store_call
+    @_cache_fact
     def l3_agent_nodes_with_snat_count(self):
         """Get count of L3 agent nodes with SNAT."""
         os_faults_steps = self._get_fixture('os_faults_steps')
@@ -162,23 +274,27 @@ class Predicates(object):
 
     @property
     @_store_call
+    @_cache_fact
     def ceph_enabled(self):
         """Define whether CEPH enabled."""
 
     @property
     @_store_call
+    @_cache_fact
     def vlan(self):
         """Define whether neutron configures with vlan."""
         return self._network_type == config.NETWORK_TYPE_VLAN
 
     @property
     @_store_call
+    @_cache_fact
     def vxlan(self):
         """Define whether neutron configures with vxlan."""
         return self._network_type == config.NETWORK_TYPE_VXLAN
 
     @property
     @_store_call
+    @_cache_fact
     def l3_ha(self):
         """Define whether neutron configures with l3 ha."""
         os_faults_steps = self._get_fixture('os_faults_steps')
@@ -186,6 +302,7 @@ class Predicates(object):
 
     @property
     @_store_call
+    @_cache_fact
     def dvr(self):
         """Define whether neutron configures with DVR."""
         os_faults_steps = self._get_fixture('os_faults_steps')
@@ -59,6 +59,7 @@ def unexpected_images_cleanup():
         _glance_steps[0] = glance_steps  # inject glance steps for finalizer
         # check=False because in best case no images will be present
         images = glance_steps.get_images(name_prefix=config.STEPLER_PREFIX,
+                                         fields=config.CLEANUP_FIELDS,
                                          check=False)
         if SKIPPED_IMAGES:
             image_names = [image.name for image in SKIPPED_IMAGES]
@@ -67,7 +68,9 @@ def unexpected_images_cleanup():
                 "SKIPPED_IMAGES contains images {!r}. They will not be "
                 "removed in cleanup procedure.".format(image_names))
 
-            images = [image for image in images if image not in SKIPPED_IMAGES]
+            skipped_ids = {image.id for image in SKIPPED_IMAGES}
+            images = [image for image in images
+                      if image.id not in skipped_ids]
 
         if images:
             glance_steps.delete_images(images)
@@ -160,9 +163,10 @@ def images_cleanup(uncleanable):
         def _get_images():
             # check=False because in best case no servers will be
             return glance_steps.get_images(
-                name_prefix=config.STEPLER_PREFIX, check=False)
+                name_prefix=config.STEPLER_PREFIX,
+                fields=config.CLEANUP_FIELDS, check=False)
 
-        image_ids_before = [image.id for image in _get_images()]
+        image_ids_before = {image.id for image in _get_images()}
 
         yield
 
@@ -179,32 +183,66 @@ def images_cleanup(uncleanable):
 
 
 @pytest.fixture(scope='session')
-def create_images_context(get_glance_steps, uncleanable):
+def create_images_context(get_glance_steps, uncleanable, shared_resources):
     """Session callable fixture to create image.
 
+    If ``shared_name`` is passed, images are shared among xdist workers:
+    first worker creates them and others use them by ids.
+
+    If ``GLANCE_KEEP_WARM`` is set, existing leased stepler images with the
+    same content are reused and images are not deleted after tests, but they
+    get lease for ``GLANCE_KEEP_WARM_LEASE`` seconds. Images with expired
+    lease are deleted.
+
     Args:
         get_glance_steps (function): function to get glance steps
         uncleanable (AttrDict): data structure with skipped resources
+        shared_resources (SharedResources): registry of shared resources
 
     Returns:
-        object: ubuntu glance image
+        function: function to create images as context
     """
     @context.context
-    def _create_images_context(image_names, image_url, **kwargs):
-        images = get_glance_steps(
-            version=config.CURRENT_GLANCE_VERSION).create_images(
-            image_names=image_names,
-            image_path=utils.get_file_path(image_url),
-            **kwargs)
-
-        for image in images:
-            uncleanable.image_ids.add(image.id)
-
-        yield images
-
-        get_glance_steps(
-            version=config.CURRENT_GLANCE_VERSION,
-        ).delete_images(images)
+    def _create_images_context(image_names, image_url, shared_name=None,
+                               **kwargs):
+        glance_steps = get_glance_steps(version=config.CURRENT_GLANCE_VERSION)
+
+        if config.GLANCE_KEEP_WARM:
+            glance_steps.delete_expired_images()
+            kwargs.setdefault('reuse', True)
+            kwargs.setdefault('lease', config.GLANCE_KEEP_WARM_LEASE)
+            delete_images = lambda images: None
+        else:
+            delete_images = glance_steps.delete_images
+
+        def _create_images():
+            return glance_steps.create_images(
+                image_names=image_names,
+                image_path=utils.get_file_path(image_url),
+                **kwargs)
+
+        def _find_images(image_ids):
+            images = {image.id: image
+                      for image in glance_steps.get_images(check=False)}
+            if set(image_ids).issubset(images):
+                return [images[image_id] for image_id in image_ids]
+
+        if shared_name:
+            images_context = shared_resources.share(
+                shared_name,
+                create=_create_images,
+                delete=delete_images,
+                dump=lambda images: [image.id for image in images],
+                load=_find_images)
+        else:
+            images_context = _own_resource_context(
+                create=_create_images, delete=delete_images)
+
+        with images_context as images:
+            for image in images:
+                uncleanable.image_ids.add(image.id)
+
+            yield images
 
         for image in images:
             uncleanable.image_ids.remove(image.id)
@@ -212,6 +250,13 @@ def create_images_context(get_glance_steps, uncleanable):
     return _create_images_context
 
 
+@context.context
+def _own_resource_context(create, delete):
+    resource = create()
+    yield resource
+    delete(resource)
+
+
 @pytest.fixture(scope='session')
 def ubuntu_image(create_images_context):
     """Session fixture to create ubuntu image.
@@ -225,7 +270,8 @@ def ubuntu_image(create_images_context):
         object: ubuntu glance image
     """
     with create_images_context(utils.generate_ids('ubuntu'),
-                               config.UBUNTU_QCOW2_URL) as images:
+                               config.UBUNTU_QCOW2_URL,
+                               shared_name='ubuntu_image') as images:
         yield images[0]
 
 
@@ -242,7 +288,8 @@ def ubuntu_xenial_image(create_images_context):
         object: ubuntu xenial glance image
     """
     with create_images_context(utils.generate_ids('ubuntu-xenial'),
-                               config.UBUNTU_XENIAL_QCOW2_URL) as images:
+                               config.UBUNTU_XENIAL_QCOW2_URL,
+                               shared_name='ubuntu_xenial_image') as images:
         yield images[0]
 
 
@@ -257,5 +304,6 @@ def cirros_image(create_images_context):
         object: cirros glance image
     """
     with create_images_context(utils.generate_ids('cirros'),
-                               config.CIRROS_QCOW2_URL) as images:
+                               config.CIRROS_QCOW2_URL,
+                               shared_name='cirros_image') as images:
         yield images[0]
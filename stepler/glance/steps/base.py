@@ -22,6 +22,7 @@ from hamcrest import assert_that, equal_to  # noqa
 import warlock.model
 
 from stepler import base
+from stepler.third_party import pagination
 from stepler.third_party import steps_checker
 
 __all__ = [
@@ -41,6 +42,9 @@ class BaseGlanceSteps(base.BaseSteps):
             data = getattr(fresh, '_info', fresh)
             getattr(image, '_info', image).update(data)
 
+        elif isinstance(image, pagination.Record):
+            image.update(self._client.images.get(image.id))
+
         else:  # stepler.base.Resource
             image.get()
 
@@ -17,11 +17,19 @@ Glance steps v2
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import logging
+from multiprocessing.pool import ThreadPool
+import os
+import time
+
 from hamcrest import assert_that, empty, is_not, equal_to, is_in  # noqa
 from glanceclient import exc
+import six
 
 from stepler import config
+from stepler.third_party import pagination
 from stepler.third_party import steps_checker
+from stepler.third_party import transfer_meter
 from stepler.third_party import utils
 from stepler.third_party import waiter
 
@@ -31,10 +39,32 @@ __all__ = [
     'GlanceStepsV2',
 ]
 
+LOGGER = logging.getLogger(__name__)
+
+# image attributes which glance API can filter by exact value
+SERVER_FILTERS = ('checksum', 'container_format', 'disk_format', 'name',
+                  'owner', 'status', 'visibility')
+
+# max count of images to request one by one instead of listing
+MAX_IMAGES_TO_GET = 5
+
 
 class GlanceStepsV2(BaseGlanceSteps):
     """Glance steps for v2."""
 
+    def _upload_image(self, image, image_path=None, image_chunks=None):
+        meter = transfer_meter.TransferMeter(
+            'Upload of image {!r}'.format(image.name),
+            total=os.path.getsize(image_path) if image_path else None)
+        if image_path:
+            with open(image_path, 'rb') as f:
+                self._client.images.upload(image.id, meter.wrap_file(f))
+        else:
+            self._client.images.upload(image.id,
+                                       meter.wrap_chunks(image_chunks()))
+        meter.finish()
+        return meter
+
     @steps_checker.step
     def create_images(self,
                       image_path,
@@ -43,12 +73,19 @@ class GlanceStepsV2(BaseGlanceSteps):
                       container_format='bare',
                       visibility='private',
                       upload=True,
+                      reuse=False,
+                      lease=None,
+                      image_chunks=None,
                       check=True,
                       **kwargs):
         """Step to create images.
 
+        Images are uploaded in parallel, with ``GLANCE_UPLOAD_THREADS``
+        uploads at most.
+
         Args:
-            image_path (str): path to image at local machine
+            image_path (str|None): path to image at local machine. It may be
+                None if ``image_chunks`` is passed.
             image_names (list): names of created images, if not specified
                 one image name will be generated
             disk_format (str): format of image disk
@@ -57,6 +94,13 @@ class GlanceStepsV2(BaseGlanceSteps):
                 private.
             upload (bool): flag whether to upload image after creation or not
                 (upload=False is used in some negative tests)
+            reuse (bool): flag whether to reuse existing leased stepler images
+                with the same content and formats instead of creating new ones
+            lease (int|None): seconds to keep images in cloud. Images with
+                expired lease are deleted by ``delete_expired_images``.
+            image_chunks (function|None): function without arguments which
+                returns iterable of image data chunks. It's used to upload
+                generated data without temporary file.
             check (bool): flag whether to check step or not
             **kwargs: Optional. A dictionary containing the attributes
                         of the resource
@@ -64,10 +108,26 @@ class GlanceStepsV2(BaseGlanceSteps):
         Returns:
             list: glance images
         """
-        image_names = image_names or utils.generate_ids()
+        image_names = list(image_names or utils.generate_ids())
 
         images = []
+        if reuse and upload and image_path:
+            images = self.get_reusable_images(
+                image_path,
+                disk_format=disk_format,
+                container_format=container_format,
+                visibility=visibility,
+                check=False)[:len(image_names)]
+            image_names = image_names[len(images):]
+
+        if lease:
+            lease_kwargs = {
+                config.IMAGE_LEASE_PROPERTY: str(int(time.time() + lease))}
+            for image in images:
+                self._client.images.update(image.id, **lease_kwargs)
+            kwargs.update(lease_kwargs)
 
+        new_images = []
         for image_name in image_names:
 
             image = self._client.images.create(
@@ -76,26 +136,103 @@ class GlanceStepsV2(BaseGlanceSteps):
                 container_format=container_format,
                 visibility=visibility,
                 **kwargs)
+            new_images.append(image)
 
+        if upload and new_images:
+            start_time = time.time()
+            pool = ThreadPool(min(len(new_images),
+                                  config.GLANCE_UPLOAD_THREADS))
+            try:
+                meters = pool.map(
+                    lambda image: self._upload_image(
+                        image, image_path=image_path,
+                        image_chunks=image_chunks),
+                    new_images)
+            finally:
+                pool.close()
+            duration = time.time() - start_time
+            transferred = sum(meter.transferred for meter in meters)
+            LOGGER.info('Uploaded {} image(s), {:.1f} MB in {:.1f} s, '
+                        '{:.1f} MB/s'.format(
+                            len(new_images),
+                            float(transferred) / transfer_meter.MB, duration,
+                            transferred / (duration or 1.) /
+                            transfer_meter.MB))
+
+        images.extend(new_images)
+
+        if check:
             if upload:
-                self._client.images.upload(image.id, open(image_path, 'rb'))
-            images.append(image)
+                self.check_images_status(
+                    images,
+                    config.STATUS_ACTIVE,
+                    timeout=config.IMAGE_AVAILABLE_TIMEOUT)
+            else:
+                self.check_images_status(
+                    images,
+                    config.STATUS_QUEUED,
+                    timeout=config.IMAGE_QUEUED_TIMEOUT)
+
+        return images
+
+    @steps_checker.step
+    def get_reusable_images(self, image_path, disk_format='qcow2',
+                            container_format='bare', visibility='private',
+                            check=True):
+        """Step to find active stepler images with content of local file.
+
+        Only images created with lease (keep-warm images) are found. Other
+        stepler images belong to tests, which delete them on teardown.
+
+        Args:
+            image_path (str): path to image at local machine
+            disk_format (str): format of image disk
+            container_format (str): format of image container
+            visibility (str): image visibility
+            check (bool): flag whether to check step or not
+
+        Returns:
+            list: glance images
+
+        Raises:
+            AssertionError: if no images are found
+        """
+        images = self.get_images(name_prefix=config.STEPLER_PREFIX,
+                                 checksum=utils.get_md5sum(image_path),
+                                 size=os.path.getsize(image_path),
+                                 disk_format=disk_format,
+                                 container_format=container_format,
+                                 visibility=visibility,
+                                 status=config.STATUS_ACTIVE,
+                                 check=False)
+        # image with expired lease may be deleted at any moment
+        now = time.time()
+        images = [image for image in images
+                  if config.IMAGE_LEASE_PROPERTY in image and
+                  float(image[config.IMAGE_LEASE_PROPERTY]) > now]
 
         if check:
-            for image in images:
-                if upload:
-                    self.check_image_status(
-                        image,
-                        config.STATUS_ACTIVE,
-                        timeout=config.IMAGE_AVAILABLE_TIMEOUT)
-                else:
-                    self.check_image_status(
-                        image,
-                        config.STATUS_QUEUED,
-                        timeout=config.IMAGE_QUEUED_TIMEOUT)
+            assert_that(images, is_not(empty()))
 
         return images
 
+    @steps_checker.step
+    def delete_expired_images(self, check=True):
+        """Step to delete stepler images with expired lease.
+
+        Args:
+            check (bool): flag whether to check step or not
+
+        Raises:
+            TimeoutExpired: if images are not deleted
+        """
+        now = time.time()
+        images = [image for image in self.get_images(
+            name_prefix=config.STEPLER_PREFIX, check=False)
+            if config.IMAGE_LEASE_PROPERTY in image and
+            float(image[config.IMAGE_LEASE_PROPERTY]) < now]
+        self.delete_images(images, check=check)
+
     @steps_checker.step
     def delete_images(self, images, check=True):
         """Step to delete images.
@@ -141,11 +278,19 @@ class GlanceStepsV2(BaseGlanceSteps):
             self.check_image_bind_status(image, project, must_bound=False)
 
     @steps_checker.step
-    def get_images(self, name_prefix=None, check=True, **kwargs):
+    def get_images(self, name_prefix=None, limit=None, fields=None,
+                   check=True, **kwargs):
         """Step to retrieve images from glance.
 
+        Images are requested page by page and filters supported by glance
+        API are applied on server side, so only required images are
+        fetched.
+
         Args:
             name_prefix (str): name prefix to filter images
+            limit (int|None): max count of images to get
+            fields (tuple|None): if passed, images are projected to
+                lightweight records with these fields only
             check (bool): flag whether to check step or not
             **kwargs: like: {'name': 'TestVM', 'status': 'active'}
 
@@ -155,21 +300,21 @@ class GlanceStepsV2(BaseGlanceSteps):
         Raises:
             AssertionError: if check triggered an error
         """
-        images = list(self._client.images.list())
-
-        if name_prefix:
-            images = [image for image in images
-                      if (image.name or '').startswith(name_prefix)]
+        filters = {key: value for key, value in kwargs.items()
+                   if key in SERVER_FILTERS and
+                   isinstance(value, six.string_types)}
+        images = self._client.images.list(filters=filters,
+                                          page_size=config.LIST_PAGE_SIZE)
+        images = pagination.filter_by_name_prefix(images, name_prefix)
 
         if kwargs:
-            matched_images = []
-            for image in images:
-                for key, value in kwargs.items():
-                    if not (key in image and image[key] == value):
-                        break
-                else:
-                    matched_images.append(image)
-            images = matched_images
+            images = (image for image in images
+                      if all(key in image and image[key] == value
+                             for key, value in kwargs.items()))
+
+        if fields:
+            images = pagination.project(images, fields)
+        images = pagination.take(images, limit)
 
         if check:
             assert_that(images, is_not(empty()))
@@ -238,6 +383,51 @@ class GlanceStepsV2(BaseGlanceSteps):
 
         waiter.wait(_check_image_status, timeout_seconds=timeout)
 
+    @steps_checker.step
+    def check_images_status(self, images, status, timeout=0):
+        """Check step images status.
+
+        Few images are requested one by one. Statuses of many images are
+        requested with one images listing per poll, filtered by images owner.
+
+        Args:
+            images (list): glance images to check status
+            status (str): image status name to check
+            timeout (int): seconds to wait a result of check
+
+        Raises:
+            TimeoutExpired: if check failed after timeout
+        """
+        image_ids = [image.id for image in images]
+        fresh_images = {}
+        filters = {}
+        owners = {getattr(image, 'owner', None) for image in images}
+        if len(owners) == 1 and None not in owners:
+            filters['owner'] = owners.pop()
+
+        def _get_images():
+            if len(image_ids) <= MAX_IMAGES_TO_GET:
+                return [self._client.images.get(image_id)
+                        for image_id in image_ids]
+            return self._client.images.list(filters=filters,
+                                            page_size=config.LIST_PAGE_SIZE)
+
+        def _check_images_status():
+            fresh_images.clear()
+            fresh_images.update((image.id, image) for image in _get_images()
+                                if image.id in image_ids)
+            statuses = {image_id: image.status.lower()
+                        for image_id, image in fresh_images.items()}
+            return waiter.expect_that(
+                statuses, equal_to(dict.fromkeys(image_ids, status.lower())))
+
+        waiter.wait(_check_images_status, timeout_seconds=timeout)
+
+        for image in images:
+            fresh = fresh_images[image.id]
+            getattr(image, '_info', image).update(
+                getattr(fresh, '_info', fresh))
+
     @steps_checker.step
     def check_image_bind_status(self,
                                 image,
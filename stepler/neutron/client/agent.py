@@ -17,8 +17,12 @@ Neutron agent manager
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from stepler import config
 from stepler.neutron.client import base
 
+# state of agent which hosts resource without HA state
+HOSTING = 'hosting'
+
 
 class AgentManager(base.BaseNeutronManager):
     """Agent (neutron) manager."""
@@ -52,6 +56,40 @@ class AgentManager(base.BaseNeutronManager):
             network_id)
         return dhcp_agents['agents']
 
+    def get_dhcp_host(self, network_id):
+        """Get host of alive DHCP agent of network.
+
+        Result is cached for short time, see
+        ``config.NEUTRON_DHCP_HOST_CACHE_TTL``.
+
+        Args:
+            network_id (str): network id
+
+        Returns:
+            str: host name
+
+        Raises:
+            LookupError: if network has no alive DHCP agents
+        """
+        def _get_host():
+            for agent in self.get_dhcp_agents_for_network(network_id):
+                if agent['alive'] is True:
+                    return agent['host']
+            raise LookupError(
+                'Network {} has no alive DHCP agents'.format(network_id))
+
+        return self.client.read_cache.get(
+            (self.NAME, 'dhcp_host', network_id), _get_host,
+            ttl=config.NEUTRON_DHCP_HOST_CACHE_TTL)
+
+    def invalidate_dhcp_host(self, network_id):
+        """Drop cached DHCP host of network.
+
+        Args:
+            network_id (str): network id
+        """
+        self.client.read_cache.invalidate((self.NAME, 'dhcp_host', network_id))
+
     def get_l3_agents_for_router(self, router_id):
         """Get router L3 agents list.
 
@@ -63,3 +101,38 @@ class AgentManager(base.BaseNeutronManager):
         """
         l3_agents = self._rest_client.list_l3_agent_hosting_routers(router_id)
         return l3_agents['agents']
+
+    def get_alive_states(self):
+        """Get aliveness of agents.
+
+        Returns:
+            dict: aliveness flags, keyed by agent id
+        """
+        return {agent['id']: agent['alive'] for agent in self.list_agents()}
+
+    def get_network_hosting_states(self, network_id):
+        """Get DHCP agents hosting network.
+
+        Args:
+            network_id (str): network id
+
+        Returns:
+            dict: ``HOSTING`` values, keyed by agent id
+        """
+        return dict.fromkeys(
+            [agent['id']
+             for agent in self.get_dhcp_agents_for_network(network_id)],
+            HOSTING)
+
+    def get_router_hosting_states(self, router_id):
+        """Get L3 agents hosting router.
+
+        Args:
+            router_id (str): router id
+
+        Returns:
+            dict: HA states (or ``HOSTING`` for not HA router), keyed by
+                agent id
+        """
+        return {agent['id']: agent.get('ha_state') or HOSTING
+                for agent in self.get_l3_agents_for_router(router_id)}
@@ -11,6 +11,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from stepler import config
+from stepler.third_party import utils
+
+# max count of ids in one list request to not exceed URL length limit
+IDS_PER_REQUEST = 100
+
 
 class BaseNeutronManager(object):
     """Base Neutron components manager."""
@@ -26,36 +32,17 @@ class BaseNeutronManager(object):
         """
         self.client = client
         self._rest_client = self.client._rest_client
-
-    @property
-    def _create_method(self):
-        """Returns resource create callable."""
-        methodname = 'create_{}'.format(self.NAME)
-        return getattr(self._rest_client, methodname)
-
-    @property
-    def _delete_method(self):
-        """Returns resource delete callable."""
-        methodname = 'delete_{}'.format(self.NAME)
-        return getattr(self._rest_client, methodname)
-
-    @property
-    def _list_method(self):
-        """Returns resource list callable."""
-        methodname = 'list_{}s'.format(self.NAME)
-        return getattr(self._rest_client, methodname)
-
-    @property
-    def _show_method(self):
-        """Returns resource show callable."""
-        methodname = 'show_{}'.format(self.NAME)
-        return getattr(self._rest_client, methodname)
-
-    @property
-    def _update_method(self):
-        """Returns resource update callable."""
-        methodname = 'update_{}'.format(self.NAME)
-        return getattr(self._rest_client, methodname)
+        # bind resource callables once, managers don't support some of them
+        self._create_method = self._get_rest_method('create_{}')
+        self._delete_method = self._get_rest_method('delete_{}')
+        self._list_method = self._get_rest_method('list_{}s')
+        self._show_method = self._get_rest_method('show_{}')
+        self._update_method = self._get_rest_method('update_{}')
+
+    def _get_rest_method(self, name_template):
+        """Returns resource callable of rest client or None."""
+        return getattr(self._rest_client, name_template.format(self.NAME),
+                       None)
 
     def create(self, **kwargs):
         """Base create."""
@@ -63,6 +50,20 @@ class BaseNeutronManager(object):
         obj = self._create_method(query)[self.NAME]
         return obj
 
+    def create_many(self, objs):
+        """Base bulk create.
+
+        All objects are created with one request in one transaction.
+
+        Args:
+            objs (list): attributes of objects to create
+
+        Returns:
+            list: created objects
+        """
+        query = {self.NAME + 's': list(objs)}
+        return self._create_method(query)[self.NAME + 's']
+
     def update(self, obj_id, **kwargs):
         """Base update."""
         query = {self.NAME: kwargs}
@@ -84,6 +85,37 @@ class BaseNeutronManager(object):
         objs = self._list_method(**kwargs)[self.NAME + 's']
         return objs
 
+    def iter_all(self, page_size=None, **kwargs):
+        """Yields objects by conditions requesting them page by page.
+
+        Next page is requested only when previous one is consumed.
+        """
+        pages = self._list_method(retrieve_all=False, limit=page_size,
+                                  **kwargs)
+        for page in pages:
+            for obj in page[self.NAME + 's']:
+                yield obj
+
+    def find_by_ids(self, obj_ids, **kwargs):
+        """Returns a list of objects with ids from ``obj_ids``.
+
+        Ids are requested by chunks, so many objects cost few requests.
+        """
+        obj_ids = list(obj_ids)
+        objs = []
+        for i in range(0, len(obj_ids), IDS_PER_REQUEST):
+            objs.extend(self.find_all(id=obj_ids[i:i + IDS_PER_REQUEST],
+                                      **kwargs))
+        return objs
+
+    def get_present_ids(self, obj_ids):
+        """Returns set of ids from ``obj_ids`` of existing objects."""
+        return {obj['id'] for obj in self.find_by_ids(obj_ids, fields=['id'])}
+
+    def _map_parallel(self, func, items):
+        """Call func for each item in parallel threads."""
+        return utils.map_parallel(func, items, config.NEUTRON_DELETE_THREADS)
+
     def find(self, **kwargs):
         """Returns one found object.
 
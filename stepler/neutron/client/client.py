@@ -17,39 +17,30 @@ Neutron client wrapper
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from stepler import config
 from stepler.neutron.client import agent
 from stepler.neutron.client import network
 from stepler.neutron.client import port
 from stepler.neutron.client import quota
 from stepler.neutron.client import router
 from stepler.neutron.client import subnet
+from stepler.third_party import ttl_cache
 
 
 class NeutronClient(object):
-    """Wrapper for python-neutronclient."""
-    def __init__(self, client):
-        self._rest_client = client
-
-    @property
-    def agents(self):
-        return agent.AgentManager(self)
-
-    @property
-    def networks(self):
-        return network.NetworkManager(self)
-
-    @property
-    def ports(self):
-        return port.PortManager(self)
+    """Wrapper for python-neutronclient.
 
-    @property
-    def quotas(self):
-        return quota.QuotaManager(self)
-
-    @property
-    def routers(self):
-        return router.RouterManager(self)
-
-    @property
-    def subnets(self):
-        return subnet.SubnetManager(self)
+    Managers are created once per wrapper. ``read_cache`` keeps results of
+    lookups which aren't changed by tests, it may be shared among wrappers.
+    """
+    def __init__(self, client, read_cache=None):
+        self._rest_client = client
+        self.read_cache = read_cache or ttl_cache.TtlCache(
+            config.NEUTRON_READ_CACHE_TTL)
+
+        self.agents = agent.AgentManager(self)
+        self.networks = network.NetworkManager(self)
+        self.ports = port.PortManager(self)
+        self.quotas = quota.QuotaManager(self)
+        self.routers = router.RouterManager(self)
+        self.subnets = subnet.SubnetManager(self)
@@ -30,14 +30,50 @@ class NetworkManager(base.BaseNeutronManager):
         Returns:
             dict: created network
         """
+        return super(NetworkManager, self).create(
+            **self._get_query(name, project_id))
+
+    def create_many(self, names, project_id=None):
+        """Create neutron networks with one request.
+
+        Args:
+            names (list): names of networks
+            project_id (str|None): project id to create networks in it. If
+                None - networks will be created on current project
+
+        Returns:
+            list: created networks
+        """
+        return super(NetworkManager, self).create_many(
+            [self._get_query(name, project_id) for name in names])
+
+    def get_public_network(self):
+        """Get active external network.
+
+        Result is cached, because public network isn't changed by tests.
+
+        Returns:
+            dict: public network
+
+        Raises:
+            LookupError: if public network is absent or isn't single
+        """
+        return self.client.read_cache.get(
+            (self.NAME, 'public'),
+            lambda: self.find(**{'router:external': True,
+                                 'status': 'ACTIVE'}))
+
+    def _get_query(self, name, project_id=None):
         kwargs = dict(name=name, admin_state_up=True)
         if project_id:
             kwargs['tenant_id'] = project_id
-        return super(NetworkManager, self).create(**kwargs)
+        return kwargs
 
     def delete(self, network_id):
-        """Delete network."""
+        """Delete network.
+
+        Network subnets are deleted in parallel before network.
+        """
         network = self.get(network_id)
-        for subnet_id in network['subnets']:
-            self.client.subnets.delete(subnet_id)
+        self._map_parallel(self.client.subnets.delete, network['subnets'])
         super(NetworkManager, self).delete(network_id)
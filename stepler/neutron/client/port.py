@@ -11,20 +11,68 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from neutronclient.common import exceptions
+
 from stepler.neutron.client import base
 
+ROUTER_INTERFACE_OWNERS = ('network:router_interface',
+                           'network:router_interface_distributed')
+# port fields required to delete it
+DELETE_FIELDS = ['id', 'device_owner', 'device_id']
+
 
 class PortManager(base.BaseNeutronManager):
     """Port (neutron) manager."""
 
     NAME = 'port'
 
-    def delete(self, port_id):
-        """Delete port."""
-        port = self.get(port_id)
-        if port['device_owner'] == 'network:router_interface':
-            self.client.routers.remove_port_interface(
-                port['device_id'], port_id)
-        # If port wasn't deleted - delete it
-        if self.find_all(id=port_id):
-            super(PortManager, self).delete(port_id)
+    def delete(self, port_id, port=None):
+        """Delete port.
+
+        Router interface port is deleted by removing router interface.
+        Already deleted port is skipped.
+
+        Args:
+            port_id (str): port id
+            port (dict, optional): port with ``DELETE_FIELDS``, if it's
+                already retrieved
+        """
+        try:
+            port = port or self.get(port_id)
+            if port['device_owner'] in ROUTER_INTERFACE_OWNERS:
+                self.client.routers.remove_port_interface(
+                    port['device_id'], port_id)
+            else:
+                super(PortManager, self).delete(port_id)
+        except exceptions.NotFound:
+            pass
+
+    def get_network_ids_by_macs(self, macs):
+        """Get networks ids of ports with MAC addresses.
+
+        MACs are requested by chunks, so many MACs cost few requests.
+
+        Args:
+            macs (list): MAC addresses
+
+        Returns:
+            dict: network ids, keyed by MAC address
+        """
+        macs = list(macs)
+        network_ids = {}
+        for i in range(0, len(macs), base.IDS_PER_REQUEST):
+            ports = self.find_all(
+                mac_address=macs[i:i + base.IDS_PER_REQUEST],
+                fields=['mac_address', 'network_id'])
+            for port in ports:
+                network_ids[port['mac_address']] = port['network_id']
+        return network_ids
+
+    def delete_many(self, ports):
+        """Delete ports in parallel.
+
+        Args:
+            ports (list): ports with ``DELETE_FIELDS``
+        """
+        self._map_parallel(lambda port: self.delete(port['id'], port=port),
+                           ports)
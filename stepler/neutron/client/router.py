@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from stepler.neutron.client import base
+from stepler.neutron.client import port as port_manager
 
 
 class RouterManager(base.BaseNeutronManager):
@@ -51,9 +52,9 @@ class RouterManager(base.BaseNeutronManager):
 
     def get_interfaces_ports(self, router_id):
         """Get router interface ports."""
-        router_ports = self.client.ports.find_all(device_id=router_id)
-        dev_owner_values = ('network:router_interface',
-                            'network:router_interface_distributed')
+        dev_owner_values = port_manager.ROUTER_INTERFACE_OWNERS
+        router_ports = self.client.ports.find_all(
+            device_id=router_id, device_owner=list(dev_owner_values))
         return [
             port for port in router_ports
             if port['device_owner'] in dev_owner_values
@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from stepler.neutron.client import base
+from stepler.neutron.client import port as port_manager
 
 
 class SubnetManager(base.BaseNeutronManager):
@@ -40,6 +41,30 @@ class SubnetManager(base.BaseNeutronManager):
         Returns:
             dict: created subnet
         """
+        return super(SubnetManager, self).create(**self._get_query(
+            name, network_id, cidr, ip_version, dns_nameservers, project_id))
+
+    def create_many(self, subnets):
+        """Create subnets with one request.
+
+        Args:
+            subnets (list): dicts with arguments of ``create`` for each
+                subnet, like ``{'name': 'subnet', 'network_id': '...',
+                'cidr': '10.0.0.0/24'}``
+
+        Returns:
+            list: created subnets
+        """
+        return super(SubnetManager, self).create_many(
+            [self._get_query(**subnet) for subnet in subnets])
+
+    def _get_query(self,
+                   name,
+                   network_id,
+                   cidr,
+                   ip_version=4,
+                   dns_nameservers=('8.8.8.8', '8.8.4.4'),
+                   project_id=None):
         query = {
             "network_id": network_id,
             "ip_version": ip_version,
@@ -50,22 +75,32 @@ class SubnetManager(base.BaseNeutronManager):
             query['dns_nameservers'] = dns_nameservers
         if project_id is not None:
             query['tenant_id'] = project_id
-        return super(SubnetManager, self).create(**query)
+        return query
 
-    def get_ports(self, subnet_id):
-        """Return ports with interface to subnet."""
-        for port in self.client.ports.list():
-            for ip in port['fixed_ips']:
-                if subnet_id == ip['subnet_id']:
-                    yield port
-                    break
+    def get_ports(self, subnet_id, fields=None):
+        """Return ports with interface to subnet.
+
+        Ports are filtered by neutron server.
+
+        Args:
+            subnet_id (str): subnet id
+            fields (list, optional): port fields to retrieve. By default all
+                fields are retrieved.
+
+        Returns:
+            list: ports
+        """
+        kwargs = {'fixed_ips': 'subnet_id=' + subnet_id}
+        if fields:
+            kwargs['fields'] = list(fields)
+        return self.client.ports.find_all(**kwargs)
 
     def delete(self, subnet_id):
         """Delete subnet action.
 
         Subnet can't be deleted until it has active ports, so we delete such
-        ports before deleting subnet.
+        ports in parallel before deleting subnet.
         """
-        for port in self.get_ports(subnet_id):
-            self.client.ports.delete(port['id'])
+        ports = self.get_ports(subnet_id, fields=port_manager.DELETE_FIELDS)
+        self.client.ports.delete_many(ports)
         return super(SubnetManager, self).delete(subnet_id)
@@ -33,6 +33,7 @@ __all__ = sorted([  # sort for documentation
     'public_network',
     'create_port',
     'port',
+    'cidr_allocator',
     'create_subnet',
     'subnet',
     'create_router',
@@ -54,6 +55,7 @@ __all__ = sorted([  # sort for documentation
     'neutron_2_servers_diff_nets_with_floating',
     'neutron_2_servers_same_network',
     'neutron_2_servers_iperf_different_networks',
+    'agents_watcher',
     'get_agent_steps',
     'agent_steps',
     'reschedule_router_active_l3_agent',
@@ -19,14 +19,33 @@ Agents fixtures
 
 import pytest
 
+from stepler import config
 from stepler.neutron import steps
+from stepler.third_party import state_watcher
 
 __all__ = [
+    'agents_watcher',
     'get_agent_steps',
     'agent_steps',
 ]
 
 
+@pytest.fixture(scope="session")
+def agents_watcher():
+    """Session fixture to get watcher of neutron agents states.
+
+    Watcher polls states of agents subscribed by agent steps in background
+    and is stopped at the end of session.
+
+    Yields:
+        stepler.third_party.state_watcher.StateWatcher: states watcher
+    """
+    watcher = state_watcher.StateWatcher(
+        interval=config.NEUTRON_AGENTS_WATCHER_INTERVAL)
+    yield watcher
+    watcher.stop()
+
+
 @pytest.fixture(scope="session")
 def get_agent_steps(get_neutron_client):
     """Callable session fixture to get agent steps.
@@ -39,21 +58,26 @@ def get_agent_steps(get_neutron_client):
         function: function to get instantiated agent steps
     """
 
-    def _get_steps(**credentials):
-        return steps.AgentSteps(get_neutron_client(**credentials).agents)
+    def _get_steps(watcher=None, **credentials):
+        return steps.AgentSteps(get_neutron_client(**credentials).agents,
+                                watcher=watcher)
 
     return _get_steps
 
 
 @pytest.fixture
-def agent_steps(get_agent_steps):
+def agent_steps(get_agent_steps, agents_watcher):
     """Function fixture to get agent steps.
 
+    States subscribed by steps are unsubscribed after test.
+
     Args:
         get_agent_steps (function): function to get instantiated agent
             steps
+        agents_watcher (StateWatcher): watcher of neutron agents states
 
-    Returns:
+    Yields:
         stepler.neutron.steps.AgentSteps: instantiated agent steps
     """
-    return get_agent_steps()
+    yield get_agent_steps(watcher=agents_watcher)
+    agents_watcher.unsubscribe_all()
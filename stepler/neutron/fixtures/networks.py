@@ -88,18 +88,32 @@ def create_network(network_steps):
         network_steps.delete(network)
 
 
-@pytest.fixture
-def network(create_network):
+@pytest.yield_fixture
+def network(create_network, network_steps, resource_cache):
     """Function fixture to create network with default options before test.
 
+    If ``config.REUSE_NEUTRON_RESOURCES`` is set, network is reused by tests
+    and is deleted at the end of session.
+
     Args:
         create_network (function): function to create network
+        network_steps (object): instantiated network steps
+        resource_cache (ResourceCache): cache of resources reused by tests
 
-    Returns:
+    Yields:
         object: network
     """
-    network_name = next(generate_ids('network'))
-    return create_network(network_name)
+    if not config.REUSE_NEUTRON_RESOURCES:
+        yield create_network(next(generate_ids('network')))
+        return
+
+    def _create_network():
+        return network_steps.create(next(generate_ids('network')))
+
+    with resource_cache.use('network', {},
+                            create=_create_network,
+                            delete=network_steps.delete) as network:
+        yield network
 
 
 @pytest.fixture
@@ -112,5 +126,4 @@ def public_network(network_steps):
     Returns:
         dict: public network
     """
-    params = {'router:external': True, 'status': 'ACTIVE'}
-    return network_steps.get_network(**params)
+    return network_steps.get_public_network()
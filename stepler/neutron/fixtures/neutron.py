@@ -20,7 +20,10 @@ Neutron fixtures
 from neutronclient.v2_0.client import Client
 import pytest
 
+from stepler import config
 from stepler.neutron.client import client
+from stepler.third_party import resource_cache as _resource_cache
+from stepler.third_party import ttl_cache
 
 __all__ = [
     'neutron_client',
@@ -40,9 +43,12 @@ def get_neutron_client(get_session):
     Returns:
         function: function to get instantiated neutron client wrapper
     """
+    # wrappers share cache of lookups, which aren't changed by tests
+    read_cache = ttl_cache.TtlCache(config.NEUTRON_READ_CACHE_TTL)
+
     def _get_client():
         rest_client = Client(session=get_session())
-        return client.NeutronClient(rest_client)
+        return client.NeutronClient(rest_client, read_cache=read_cache)
 
     return _get_client
 
@@ -58,21 +64,44 @@ def neutron_client(get_neutron_client):
     return get_neutron_client()
 
 
-@pytest.fixture
-def net_subnet_router(network, subnet, router, add_router_interfaces):
+@pytest.yield_fixture
+def net_subnet_router(network, subnet, router, add_router_interfaces,
+                      router_steps, resource_cache):
     """Function fixture to create net, subnet, router and link them.
 
     It deletes all created resources after test.
 
+    If ``config.REUSE_NEUTRON_RESOURCES`` is set, linked resources are
+    reused by tests until test changes any of them.
+
     Args:
         network (obj): network object
         subnet (obj): subnet object
         router (obj): router object
         add_router_interfaces (function): function to add router interfaces to
             subnets
+        router_steps (object): instantiated router steps
+        resource_cache (ResourceCache): cache of resources reused by tests
 
-    Returns:
+    Yields:
         tuple: network, subnet, router objects
     """
-    add_router_interfaces(router, [subnet])
-    return network, subnet, router
+    if not config.REUSE_NEUTRON_RESOURCES:
+        add_router_interfaces(router, [subnet])
+        yield network, subnet, router
+        return
+
+    def _link():
+        router_steps.add_subnet_interface(router, subnet)
+        return network, subnet, router
+
+    def _unlink(resources):
+        # changed router is deleted with all its interfaces
+        if not _resource_cache.is_dirty(router):
+            router_steps.remove_subnet_interface(router, subnet)
+
+    with resource_cache.use('router_interface',
+                            {'router': router['id'], 'subnet': subnet['id']},
+                            create=_link,
+                            delete=_unlink) as resources:
+        yield resources
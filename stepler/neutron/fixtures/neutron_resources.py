@@ -80,8 +80,7 @@ def neutron_2_networks(
 
     subnet_2 = create_subnet(
         subnet_name=next(utils.generate_ids()),
-        network=network_2,
-        cidr='192.168.2.0/24')
+        network=network_2)
     routers = [router]
     if getattr(request, 'param', None) == 'different_routers':
         router_2 = create_router(next(utils.generate_ids()))
@@ -173,7 +172,7 @@ def neutron_2_servers_different_networks(
 @pytest.fixture
 def neutron_2_servers_diff_nets_with_floating(
         neutron_2_servers_different_networks,
-        nova_create_floating_ip,
+        nova_create_floating_ips,
         server_steps):
     """Function fixture to prepare environment with 2 servers.
 
@@ -185,7 +184,8 @@ def neutron_2_servers_diff_nets_with_floating(
     Args:
         neutron_2_servers_different_networks (obj): neutron networks,
             subnets, router(s) and servers resources AttrDict instance
-        nova_create_floating_ip (function): function to create floating IP
+        nova_create_floating_ips (function): function to create floating
+            IPs
         server_steps (obj): instantiated nova server steps
 
     Returns:
@@ -193,11 +193,8 @@ def neutron_2_servers_diff_nets_with_floating(
     """
     resources = attrdict.AttrDict(neutron_2_servers_different_networks.copy())
 
-    floating_ips = []
-    for server in resources.servers:
-        floating_ip = nova_create_floating_ip()
-        server_steps.attach_floating_ip(server, floating_ip)
-        floating_ips.append(floating_ip)
+    floating_ips = nova_create_floating_ips(len(resources.servers))
+    server_steps.attach_floating_ips(resources.servers, floating_ips)
 
     resources.floating_ips = floating_ips
 
@@ -93,25 +93,46 @@ def create_router(router_steps):
 
 
 @pytest.yield_fixture
-def router(request, router_steps, create_router, public_network):
+def router(request, router_steps, create_router, public_network,
+           resource_cache):
     """Fixture to create router with default options before test.
 
+    If ``config.REUSE_NEUTRON_RESOURCES`` is set, router with the same
+    options is reused by tests until test changes it (set/clear gateway,
+    add/remove interface) and is deleted at the end of session.
+
     Args:
         request (obj): py.test SubRequest
         router_steps (object): instantiated neutron steps
         create_router (function): function to create router with options
         public_network (dict): public network
+        resource_cache (ResourceCache): cache of resources reused by tests
 
-    Returns:
+    Yields:
         dict: router
     """
     router_params = dict()
     router_params.update(getattr(request, 'param', {}))
-    router_name = next(generate_ids('router'))
-    router = create_router(router_name, **router_params)
-    router_steps.set_gateway(router, public_network)
-    yield router
-    router_steps.clear_gateway(router)
+
+    if not config.REUSE_NEUTRON_RESOURCES:
+        router_name = next(generate_ids('router'))
+        router = create_router(router_name, **router_params)
+        router_steps.set_gateway(router, public_network)
+        yield router
+        router_steps.clear_gateway(router)
+        return
+
+    def _create_router():
+        router = router_steps.create(next(generate_ids('router')),
+                                     **router_params)
+        router_steps.set_gateway(router, public_network)
+        return router
+
+    spec = dict(router_params, gateway=public_network['id'])
+    with resource_cache.use('router', spec,
+                            create=_create_router,
+                            delete=router_steps.delete) as router:
+        yield router
 
 
 @pytest.fixture
@@ -17,12 +17,17 @@ Subnets fixtures
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
 import pytest
 
+from stepler import config
 from stepler.neutron import steps
+from stepler.third_party import cidr_allocator as _cidr_allocator
 from stepler.third_party.utils import generate_ids
 
 __all__ = [
+    'cidr_allocator',
     'create_subnet',
     'subnet',
     'subnet_steps',
@@ -62,22 +67,48 @@ def subnet_steps(get_subnet_steps):
     return get_subnet_steps()
 
 
+@pytest.fixture(scope='session')
+def cidr_allocator():
+    """Session fixture to get allocator of subnets CIDRs.
+
+    Allocator registry is placed to test reports folder, which is cleaned
+    before tests launching, so pytest-xdist workers of one tests launching
+    get non-overlapping CIDRs.
+
+    Returns:
+        stepler.third_party.cidr_allocator.CidrAllocator: allocator
+    """
+    return _cidr_allocator.CidrAllocator(
+        os.path.join(config.TEST_REPORTS_DIR, 'cidrs.json'),
+        pool=config.NEUTRON_CIDR_POOL,
+        prefix_len=config.NEUTRON_CIDR_PREFIX_LEN)
+
+
 @pytest.yield_fixture
-def create_subnet(subnet_steps):
+def create_subnet(subnet_steps, cidr_allocator):
     """Fixture to create subnet with options.
 
     Can be called several times during a test.
     After the test it destroys all created subnets.
 
+    If ``cidr`` isn't passed, it's allocated to not overlap with CIDRs of
+    existing subnets and subnets of parallel tests.
+
     Args:
         subnet_steps (object): instantiated neutron steps
+        cidr_allocator (CidrAllocator): allocator of subnets CIDRs
 
     Returns:
         function: function to create subnet as batch with options
     """
     subnets = []
+    allocated_cidrs = []
 
-    def _create_subnet(subnet_name, network, cidr):
+    def _create_subnet(subnet_name, network, cidr=None):
+        if cidr is None:
+            cidr = cidr_allocator.allocate(
+                used_cidrs=subnet_steps.get_cidrs(check=False))
+            allocated_cidrs.append(cidr)
         subnet = subnet_steps.create(subnet_name, network=network, cidr=cidr)
         subnets.append(subnet)
         return subnet
@@ -87,17 +118,43 @@ def create_subnet(subnet_steps):
     for subnet in subnets:
         subnet_steps.delete(subnet)
 
+    for cidr in allocated_cidrs:
+        cidr_allocator.release(cidr)
 
-@pytest.fixture
-def subnet(create_subnet, network):
+
+@pytest.yield_fixture
+def subnet(create_subnet, network, subnet_steps, cidr_allocator,
+           resource_cache):
     """Fixture to create subnet with default options before test.
 
+    If ``config.REUSE_NEUTRON_RESOURCES`` is set, subnet is reused by tests
+    with the same network and is deleted at the end of session.
+
     Args:
         create_subnet (function): function to create subnet with options
         network (dict): network
+        subnet_steps (object): instantiated neutron steps
+        cidr_allocator (CidrAllocator): allocator of subnets CIDRs
+        resource_cache (ResourceCache): cache of resources reused by tests
 
-    Returns:
+    Yields:
         dict: subnet
     """
-    subnet_name = next(generate_ids('subnet'))
-    return create_subnet(subnet_name, network, cidr='10.0.1.0/24')
+    if not config.REUSE_NEUTRON_RESOURCES:
+        yield create_subnet(next(generate_ids('subnet')), network)
+        return
+
+    def _create_subnet():
+        cidr = cidr_allocator.allocate(
+            used_cidrs=subnet_steps.get_cidrs(check=False))
+        return subnet_steps.create(next(generate_ids('subnet')),
+                                   network=network, cidr=cidr)
+
+    def _delete_subnet(subnet):
+        subnet_steps.delete(subnet)
+        cidr_allocator.release(subnet['cidr'])
+
+    with resource_cache.use('subnet', {'network': network['id']},
+                            create=_create_subnet,
+                            delete=_delete_subnet) as subnet:
+        yield subnet
@@ -18,7 +18,7 @@ Agent steps
 # limitations under the License.
 
 from hamcrest import (assert_that, empty, is_in, is_not, only_contains,
-                      has_entries)  # noqa H301
+                      has_entries, none)  # noqa H301
 
 from stepler import base
 from stepler import config
@@ -27,10 +27,47 @@ from stepler.third_party import waiter
 
 __all__ = ["AgentSteps"]
 
+AGENTS_KEY = 'agents'
+
 
 class AgentSteps(base.BaseSteps):
     """Agent steps."""
 
+    def __init__(self, client, watcher=None):
+        """Constructor.
+
+        Args:
+            client (object): neutron agents manager
+            watcher (object, optional): states watcher, for ex:
+                stepler.third_party.state_watcher.StateWatcher. If passed,
+                checks share states polled by watcher in background instead
+                of polling API themselves.
+        """
+        super(AgentSteps, self).__init__(client)
+        self._watcher = watcher
+
+    def _get_watch_params(self, network=None, router=None):
+        if network is not None:
+            network_id = network['id']
+            return (('dhcp', network_id),
+                    lambda: self._client.get_network_hosting_states(
+                        network_id))
+        if router is not None:
+            router_id = router['id']
+            return (('l3', router_id),
+                    lambda: self._client.get_router_hosting_states(router_id))
+        return AGENTS_KEY, self._client.get_alive_states
+
+    def _get_state(self, network=None, router=None):
+        """Get agents state from watcher if it's set, otherwise from API."""
+        key, poll = self._get_watch_params(network=network, router=router)
+        if self._watcher is None:
+            return poll()
+        self._watcher.subscribe(key, poll)
+        state = self._watcher.get_state(key)
+        waiter.expect_that(state, is_not(none()))
+        return state
+
     @steps_checker.step
     def get_agents(self, check=True, **kwargs):
         """Step to get agents by params in '**kwargs'.
@@ -66,12 +103,10 @@ class AgentSteps(base.BaseSteps):
         agents_ids = [agent['id'] for agent in agents]
 
         def _check_agents_alive():
-            agents = [
-                agent for agent in self.get_agents()
-                if agent['id'] in agents_ids
-            ]
-            return waiter.expect_that(agents, only_contains(
-                has_entries(alive=must_alive)))
+            alive_states = self._get_state()
+            return waiter.expect_that(
+                [alive_states.get(agent_id) for agent_id in agents_ids],
+                only_contains(must_alive))
 
         waiter.wait(_check_agents_alive, timeout_seconds=timeout)
 
@@ -117,13 +152,13 @@ class AgentSteps(base.BaseSteps):
             TimeoutExpired: if check failed after timeout
         """
         def _check_network_rescheduled():
-            dhcp_agents = self._client.get_dhcp_agents_for_network(
-                network['id'])
-            dhcp_agents_ids = [agent['id'] for agent in dhcp_agents]
+            dhcp_agents_ids = list(self._get_state(network=network))
             return waiter.expect_that(old_dhcp_agent['id'],
                                       is_not(is_in(dhcp_agents_ids)))
 
         waiter.wait(_check_network_rescheduled, timeout_seconds=timeout)
+        # cached DHCP host isn't actual after rescheduling
+        self._client.invalidate_dhcp_host(network['id'])
 
     @steps_checker.step
     def get_l3_agents_for_router(self, router, filter_attrs=None, check=True):
@@ -166,8 +201,7 @@ class AgentSteps(base.BaseSteps):
             TimeoutExpired: if check failed after timeout
         """
         def _check_router_rescheduled():
-            l3_agents = self._client.get_l3_agents_for_router(router['id'])
-            l3_agents_ids = [agent['id'] for agent in l3_agents]
+            l3_agents_ids = list(self._get_state(router=router))
             return waiter.expect_that(old_l3_agent['id'],
                                       is_not(is_in(l3_agents_ids)))
 
@@ -186,13 +220,75 @@ class AgentSteps(base.BaseSteps):
             TimeoutExpired: if check failed after timeout
         """
 
+        active_state = config.HA_STATE_ACTIVE_ATTRS['ha_state']
+
         def _check_router_rescheduled():
-            l3_agents = self.get_l3_agents_for_router(
-                router, filter_attrs=config.HA_STATE_ACTIVE_ATTRS, check=False)
-            l3_agents_ids = [agent['id'] for agent in l3_agents]
-            waiter.expect_that(l3_agents, is_not(empty()))
+            ha_states = self._get_state(router=router)
+            l3_agents_ids = [agent_id
+                             for agent_id, ha_state in ha_states.items()
+                             if ha_state == active_state]
+            waiter.expect_that(l3_agents_ids, is_not(empty()))
             waiter.expect_that(old_l3_agent['id'],
                                is_not(is_in(l3_agents_ids)))
-            return l3_agents
+            return l3_agents_ids
 
         waiter.wait(_check_router_rescheduled, timeout_seconds=timeout)
+
+    @steps_checker.step
+    def watch_states(self, networks=(), routers=(), check=True):
+        """Step to start background watching of agents states.
+
+        Aliveness of agents is watched always, hosting agents are watched
+        for passed networks and routers.
+
+        Args:
+            networks (list, optional): networks to watch their DHCP agents
+            routers (list, optional): routers to watch their L3 agents
+            check (bool, optional): flag whether to check step or not
+
+        Raises:
+            ValueError: if steps have no watcher
+            AssertionError: if any state isn't polled
+        """
+        if self._watcher is None:
+            raise ValueError("Agent steps are created without watcher")
+        params = [{}]
+        params += [{'network': network} for network in networks]
+        params += [{'router': router} for router in routers]
+        for kwargs in params:
+            self._watcher.subscribe(*self._get_watch_params(**kwargs))
+
+        if check:
+            for kwargs in params:
+                key, _ = self._get_watch_params(**kwargs)
+                assert_that(self._watcher.get_state(key), is_not(none()))
+
+    @steps_checker.step
+    def get_state_changes(self, network=None, router=None, check=True):
+        """Step to get changes of watched agents states.
+
+        Args:
+            network (dict, optional): network to get changes of its DHCP
+                agents
+            router (dict, optional): router to get changes of its L3 agents
+                (HA states and rescheduling)
+            check (bool, optional): flag whether to check step or not
+
+        Returns:
+            list: StateChange(s) with ``item`` as agent id. If network and
+                router aren't passed, changes of agents aliveness are
+                returned.
+
+        Raises:
+            ValueError: if steps have no watcher
+            AssertionError: if there are no changes
+        """
+        if self._watcher is None:
+            raise ValueError("Agent steps are created without watcher")
+        key, _ = self._get_watch_params(network=network, router=router)
+        changes = self._watcher.get_timeline(key)
+
+        if check:
+            assert_that(changes, is_not(empty()))
+
+        return changes
@@ -17,7 +17,8 @@ Network steps
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from hamcrest import assert_that, equal_to, has_entries  # noqa
+from hamcrest import (assert_that, equal_to, has_entries, has_length,
+                      is_not, empty)  # noqa H301
 
 from stepler import base
 from stepler.third_party import steps_checker
@@ -48,6 +49,25 @@ class NetworkSteps(base.BaseSteps):
 
         return network
 
+    @steps_checker.step
+    def create_many(self, network_names, check=True, **kwargs):
+        """Step to create networks with one request.
+
+        Args:
+            network_names (list): names of networks
+            check (bool): flag whether to check step or not
+            **kwargs: other arguments to pass to API
+
+        Returns:
+            list: networks
+        """
+        networks = self._client.create_many(network_names, **kwargs)
+
+        if check:
+            self.check_presence_many(networks)
+
+        return networks
+
     @steps_checker.step
     def delete(self, network, check=True):
         """Step to delete network.
@@ -79,6 +99,29 @@ class NetworkSteps(base.BaseSteps):
 
         waiter.wait(_check_network_presence, timeout_seconds=timeout)
 
+    @steps_checker.step
+    def check_presence_many(self, networks, must_present=True, timeout=0):
+        """Verify step to check networks are present.
+
+        Presence of all networks is checked with few requests.
+
+        Args:
+            networks (list): networks to check presence status
+            must_present (bool): flag whether networks must present or not
+            timeout (int): seconds to wait a result of check
+
+        Raises:
+            TimeoutExpired: if check failed after timeout
+        """
+        network_ids = {network['id'] for network in networks}
+        expected_ids = network_ids if must_present else set()
+
+        def _check_networks_presence():
+            present_ids = self._client.get_present_ids(network_ids)
+            return waiter.expect_that(present_ids, equal_to(expected_ids))
+
+        waiter.wait(_check_networks_presence, timeout_seconds=timeout)
+
     @steps_checker.step
     def get_network_by_name(self, name, **kwargs):
         """Step to get network by name.
@@ -113,6 +156,26 @@ class NetworkSteps(base.BaseSteps):
             assert_that(network, has_entries(kwargs))
         return network
 
+    @steps_checker.step
+    def get_public_network(self, check=True):
+        """Step to get active external network.
+
+        Args:
+            check (bool): flag whether to check step or not
+
+        Returns:
+            dict: public network
+
+        Raises:
+            LookupError: if public network is absent or isn't single
+            AssertionError: if check failed
+        """
+        network = self._client.get_public_network()
+
+        if check:
+            assert_that(network, has_entries({'router:external': True}))
+        return network
+
     @steps_checker.step
     def get_network_id_by_mac(self, mac):
         """Step to get network ID by server MAC.
@@ -122,14 +185,66 @@ class NetworkSteps(base.BaseSteps):
         Returns:
             string: network ID
         """
-        network_id = self._client.client.ports.find_all(
-            mac_address=mac)[0]['network_id']
-        return network_id
+        return self.get_network_ids_by_macs([mac])[mac]
+
+    @steps_checker.step
+    def get_network_ids_by_macs(self, macs, check=True):
+        """Step to get networks IDs by servers MACs with few requests.
+
+        Args:
+            macs (list): mac addresses
+            check (bool, optional): flag whether to check step or not
+
+        Returns:
+            dict: network IDs, keyed by mac address
+
+        Raises:
+            AssertionError: if network isn't found for any mac
+        """
+        network_ids = self._client.client.ports.get_network_ids_by_macs(macs)
+
+        if check:
+            assert_that(network_ids, has_length(len(set(macs))))
+
+        return network_ids
 
     @steps_checker.step
     def get_dhcp_host_by_network(self, network_id):
-        """Step to get DHCP host name by network ID."""
-        result = self._client._rest_client.list_dhcp_agent_hosting_networks(
-            network_id)
-        nodes = [node for node in result['agents'] if node['alive'] is True]
-        return nodes[0]['host']
+        """Step to get DHCP host name by network ID.
+
+        Host of alive DHCP agent is cached for short time, see
+        ``config.NEUTRON_DHCP_HOST_CACHE_TTL``.
+
+        Args:
+            network_id (str): network ID
+
+        Returns:
+            str: host name
+
+        Raises:
+            LookupError: if network has no alive DHCP agents
+        """
+        return self._client.client.agents.get_dhcp_host(network_id)
+
+    @steps_checker.step
+    def get_dhcp_hosts_by_networks(self, network_ids, check=True):
+        """Step to get DHCP hosts names of networks.
+
+        Args:
+            network_ids (list): networks IDs
+            check (bool, optional): flag whether to check step or not
+
+        Returns:
+            dict: host names, keyed by network ID
+
+        Raises:
+            LookupError: if any network has no alive DHCP agents
+            AssertionError: if hosts are empty
+        """
+        hosts = {network_id: self.get_dhcp_host_by_network(network_id)
+                 for network_id in set(network_ids)}
+
+        if check:
+            assert_that(hosts, is_not(empty()))
+
+        return hosts
@@ -45,6 +45,23 @@ class PortSteps(base.BaseSteps):
             self.check_presence(port)
         return port
 
+    @steps_checker.step
+    def create_many(self, networks, check=True):
+        """Step to create ports with one request.
+
+        Args:
+            networks (list): networks to create ports on, one per port
+            check (bool): flag whether to check step or not
+
+        Returns:
+            list: ports
+        """
+        ports = self._client.create_many(
+            [{'network_id': network['id']} for network in networks])
+        if check:
+            self.check_presence_many(ports)
+        return ports
+
     @steps_checker.step
     def delete(self, port, check=True):
         """Step to create port.
@@ -74,3 +91,26 @@ class PortSteps(base.BaseSteps):
             return waiter.expect_that(is_present, equal_to(must_present))
 
         waiter.wait(_check_port_presence, timeout_seconds=timeout)
+
+    @steps_checker.step
+    def check_presence_many(self, ports, must_present=True, timeout=0):
+        """Verify step to check ports are present.
+
+        Presence of all ports is checked with few requests.
+
+        Args:
+            ports (list): ports to check presence status
+            must_present (bool): flag whether ports must present or not
+            timeout (int): seconds to wait a result of check
+
+        Raises:
+            TimeoutExpired: if check failed after timeout
+        """
+        port_ids = {port['id'] for port in ports}
+        expected_ids = port_ids if must_present else set()
+
+        def _check_ports_presence():
+            present_ids = self._client.get_present_ids(port_ids)
+            return waiter.expect_that(present_ids, equal_to(expected_ids))
+
+        waiter.wait(_check_ports_presence, timeout_seconds=timeout)
@@ -21,6 +21,9 @@ from hamcrest import (assert_that, empty, equal_to,
                       has_entries, is_not)  # noqa H301
 
 from stepler import base
+from stepler import config
+from stepler.third_party import pagination
+from stepler.third_party import resource_cache
 from stepler.third_party import steps_checker
 from stepler.third_party import waiter
 
@@ -90,6 +93,7 @@ class RouterSteps(base.BaseSteps):
             router (dict): router
             network (dict): network
         """
+        resource_cache.mark_dirty(router)
         self._client.set_gateway(router_id=router['id'],
                                  network_id=network['id'])
         if check:
@@ -102,6 +106,7 @@ class RouterSteps(base.BaseSteps):
         Args:
             router (dict): router
         """
+        resource_cache.mark_dirty(router)
         self._client.clear_gateway(router_id=router['id'])
         if check:
             self.check_gateway_presence(router, must_present=False)
@@ -135,6 +140,7 @@ class RouterSteps(base.BaseSteps):
             router (dict): router
             subnet (dict): subnet
         """
+        resource_cache.mark_dirty(router)
         self._client.add_subnet_interface(router_id=router['id'],
                                           subnet_id=subnet['id'])
         if check:
@@ -148,6 +154,7 @@ class RouterSteps(base.BaseSteps):
             router (dict): router
             subnet (dict): subnet
         """
+        resource_cache.mark_dirty(router)
         self._client.remove_subnet_interface(router_id=router['id'],
                                              subnet_id=subnet['id'])
         if check:
@@ -195,16 +202,18 @@ class RouterSteps(base.BaseSteps):
         return self._client.find(**kwargs)
 
     @steps_checker.step
-    def get_routers(self, check=True):
+    def get_routers(self, limit=None, check=True):
         """Step to retrieve all routers in current project.
 
         Args:
+            limit (int|None): max count of routers to retrieve
             check (bool): flag whether to check step or not
 
         Returns:
             list: list of retrieved routers
         """
-        routers = self._client.list()
+        routers = pagination.take(
+            self._client.iter_all(page_size=config.LIST_PAGE_SIZE), limit)
 
         if check:
             assert_that(routers, is_not(empty()))
@@ -17,9 +17,10 @@ Subnet steps
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from hamcrest import equal_to
+from hamcrest import assert_that, empty, equal_to, is_not  # noqa H301
 
 from stepler import base
+from stepler import config
 from stepler.third_party import steps_checker
 from stepler.third_party import waiter
 
@@ -53,6 +54,54 @@ class SubnetSteps(base.BaseSteps):
 
         return subnet
 
+    @steps_checker.step
+    def create_many(self, subnet_names, networks, cidrs, check=True,
+                    **kwargs):
+        """Step to create subnets with one request.
+
+        Args:
+            subnet_names (list): subnet names
+            networks (list): networks to create subnets on, one per subnet
+            cidrs (list): cidrs for subnets, one per subnet
+            check (bool): flag whether to check step or not
+            **kwargs: other arguments to pass to API for each subnet
+
+        Returns:
+            list: subnets
+        """
+        subnets = self._client.create_many(
+            [dict(name=subnet_name, network_id=network['id'], cidr=cidr,
+                  **kwargs)
+             for subnet_name, network, cidr in zip(subnet_names, networks,
+                                                   cidrs)])
+
+        if check:
+            self.check_presence_many(subnets)
+
+        return subnets
+
+    @steps_checker.step
+    def get_cidrs(self, check=True):
+        """Step to get CIDRs of all available subnets.
+
+        Args:
+            check (bool): flag whether to check step or not
+
+        Returns:
+            list: CIDRs of subnets
+
+        Raises:
+            AssertionError: if no CIDRs are found
+        """
+        subnets = self._client.iter_all(page_size=config.LIST_PAGE_SIZE,
+                                        fields=['cidr'])
+        cidrs = [subnet['cidr'] for subnet in subnets]
+
+        if check:
+            assert_that(cidrs, is_not(empty()))
+
+        return cidrs
+
     @steps_checker.step
     def delete(self, subnet, check=True):
         """Step to delete subnet.
@@ -83,3 +132,26 @@ class SubnetSteps(base.BaseSteps):
             return waiter.expect_that(is_present, equal_to(must_present))
 
         waiter.wait(_check_subnet_presence, timeout_seconds=timeout)
+
+    @steps_checker.step
+    def check_presence_many(self, subnets, must_present=True, timeout=0):
+        """Verify step to check subnets are present.
+
+        Presence of all subnets is checked with few requests.
+
+        Args:
+            subnets (list): subnets to check presence status
+            must_present (bool): flag whether subnets must present or not
+            timeout (int): seconds to wait a result of check
+
+        Raises:
+            TimeoutExpired: if check failed after timeout
+        """
+        subnet_ids = {subnet['id'] for subnet in subnets}
+        expected_ids = subnet_ids if must_present else set()
+
+        def _check_subnets_presence():
+            present_ids = self._client.get_present_ids(subnet_ids)
+            return waiter.expect_that(present_ids, equal_to(expected_ids))
+
+        waiter.wait(_check_subnets_presence, timeout_seconds=timeout)
@@ -42,7 +42,9 @@ __all__ = sorted([  # sort for documentation
     'tiny_flavor',
 
     'nova_create_floating_ip',
+    'nova_create_floating_ips',
     'nova_floating_ip',
+    'nova_floating_ip_pool',
     'nova_floating_ip_steps',
 
     'host_steps',
@@ -73,6 +75,7 @@ __all__ = sorted([  # sort for documentation
     'create_servers_context',
     'get_server_steps',
     'get_ssh_proxy_cmd',
+    'get_ssh_proxy_cmds',
     'server',
     'server_steps',
     'live_migration_server',
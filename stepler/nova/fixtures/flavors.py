@@ -70,12 +70,12 @@ def create_flavor(flavor_steps):
         flavor_steps.delete_flavor(flavor)
 
 
-@pytest.fixture
-def flavor(request, create_flavor):
-    """Callable function fixture to create single ova flavor with options.
+@pytest.yield_fixture
+def flavor(request, flavor_steps, resource_cache):
+    """Function fixture to get single nova flavor with options.
 
-    Can be called several times during a test.
-    After the test it destroys all created nodes.
+    Flavor with the same options is reused by tests and is deleted at the
+    end of session. Flavor changed by test is deleted after test.
 
     Can be parametrized with dict of create_flavor arguments.
 
@@ -90,15 +90,23 @@ def flavor(request, create_flavor):
 
     Args:
         request (obj): py.test SubRequest
-        create_flavor (function): function to create flavor with options
+        flavor_steps (object): instantiated flavor steps
+        resource_cache (ResourceCache): cache of resources reused by tests
 
-    Returns:
-        function: function to create single flavor with options
+    Yields:
+        object: nova flavor
     """
     flavor_params = dict(ram=1024, vcpus=1, disk=5)
     flavor_params.update(getattr(request, 'param', {}))
-    flavor_name = next(generate_ids('flavor'))
-    return create_flavor(flavor_name, **flavor_params)
+
+    def _create_flavor():
+        flavor_name = next(generate_ids('flavor'))
+        return flavor_steps.create_flavor(flavor_name, **flavor_params)
+
+    with resource_cache.use('flavor', flavor_params,
+                            create=_create_flavor,
+                            delete=flavor_steps.delete_flavor) as flavor:
+        yield flavor
 
 
 @pytest.fixture
@@ -20,10 +20,13 @@ Floating IP fixtures
 import pytest
 
 from stepler.nova.steps import FloatingIpSteps
+from stepler.third_party import resource_pool
 
 __all__ = [
     'nova_create_floating_ip',
+    'nova_create_floating_ips',
     'nova_floating_ip',
+    'nova_floating_ip_pool',
     'nova_floating_ip_steps'
 ]
 
@@ -53,6 +56,52 @@ def nova_create_floating_ip(nova_floating_ip_steps):
         nova_floating_ip_steps.delete_floating_ip(floating_ip)
 
 
+@pytest.yield_fixture(scope='session')
+def nova_floating_ip_pool(get_nova_client):
+    """Session fixture to get pool of floating IPs reused across tests.
+
+    Floating IPs are created in bulk on demand, are detached when they are
+    returned to pool and are deleted at the end of session.
+
+    Args:
+        get_nova_client (function): function to get nova client
+
+    Yields:
+        stepler.third_party.resource_pool.ResourcePool: floating IPs pool
+    """
+    steps = FloatingIpSteps(get_nova_client())
+    pool = resource_pool.ResourcePool(create=steps.create_floating_ips,
+                                      delete=steps.delete_floating_ips,
+                                      reset=steps.detach_floating_ips)
+    yield pool
+    pool.clear()
+
+
+@pytest.yield_fixture
+def nova_create_floating_ips(nova_floating_ip_pool):
+    """Fixture to take several floating IPs from session pool.
+
+    Can be called several times during test. Floating IPs are returned to
+    pool after test.
+
+    Args:
+        nova_floating_ip_pool (ResourcePool): floating IPs pool
+
+    Yields:
+        function: function to get list of floating IPs by count
+    """
+    floating_ips = []
+
+    def _create_floating_ips(count):
+        new_floating_ips = nova_floating_ip_pool.acquire(count)
+        floating_ips.extend(new_floating_ips)
+        return new_floating_ips
+
+    yield _create_floating_ips
+
+    nova_floating_ip_pool.release(floating_ips)
+
+
 @pytest.fixture
 def nova_floating_ip(nova_create_floating_ip):
     """Fixture to create floating_ip with default options before test."""
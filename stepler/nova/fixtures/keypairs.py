@@ -22,6 +22,7 @@ import pytest
 from stepler import config
 from stepler.nova import steps
 from stepler.third_party import context
+from stepler.third_party import ssh
 
 __all__ = [
     'keypair',
@@ -83,14 +84,34 @@ def keypairs_cleanup(uncleanable):
     return _keypairs_cleanup
 
 
-@pytest.fixture
-def keypair(keypair_steps):
-    """Function fixture to create keypair with default options.
+@pytest.yield_fixture
+def keypair(keypair_steps, resource_cache, uncleanable):
+    """Function fixture to get keypair with default options.
+
+    Keypair is reused by tests and is deleted at the end of session. Its
+    key is generated locally and is imported to nova.
 
     Args:
         keypair_steps (object): instantiated keypair steps
+        resource_cache (ResourceCache): cache of resources reused by tests
+        uncleanable (AttrDict): data structure with skipped resources
 
-    Returns:
+    Yields:
         object: keypair
     """
-    return keypair_steps.create_keypairs()[0]
+    def _create_keypair():
+        private_key, public_key = ssh.generate_key_pair()
+        keypair = keypair_steps.create_keypairs(public_key=public_key)[0]
+        # imported keypair has no private key
+        keypair.private_key = private_key
+        uncleanable.keypair_ids.add(keypair.id)
+        return keypair
+
+    def _delete_keypair(keypair):
+        keypair_steps.delete_keypairs([keypair])
+        uncleanable.keypair_ids.discard(keypair.id)
+
+    with resource_cache.use('keypair', {},
+                            create=_create_keypair,
+                            delete=_delete_keypair) as keypair:
+        yield keypair
@@ -61,23 +61,20 @@ def create_security_group(security_group_steps):
         security_group_steps.delete_group(security_group)
 
 
-@pytest.fixture
-def security_group(create_security_group, security_group_steps):
-    """Function fixture to create security group before test.
+@pytest.yield_fixture
+def security_group(security_group_steps, resource_cache):
+    """Function fixture to get security group allowing ssh and ping.
 
-    Can be called several times during test.
-    After the test it destroys all created security groups
+    Security group is reused by tests and is deleted at the end of session.
+    Security group changed by test is deleted after test.
 
     Args:
-        create_security_group (object): instantiated security group
         security_group_steps (object): instantiated security groups steps
+        resource_cache (ResourceCache): cache of resources reused by tests
 
-    Returns:
+    Yields:
         object: security group
     """
-    group_name = next(generate_ids('security-group'))
-    group = create_security_group(group_name)
-
     rules = [
         {
             # ssh
@@ -94,6 +91,14 @@ def security_group(create_security_group, security_group_steps):
             'cidr': '0.0.0.0/0',
         }
     ]
-    security_group_steps.add_group_rules(group, rules)
 
-    return group
+    def _create_group():
+        group_name = next(generate_ids('security-group'))
+        group = security_group_steps.create_group(group_name)
+        security_group_steps.add_group_rules(group, rules)
+        return group
+
+    with resource_cache.use('security_group', rules,
+                            create=_create_group,
+                            delete=security_group_steps.delete_group) as group:
+        yield group
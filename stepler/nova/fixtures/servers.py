@@ -32,6 +32,7 @@ __all__ = [
     'create_servers_context',
     'get_server_steps',
     'get_ssh_proxy_cmd',
+    'get_ssh_proxy_cmds',
     'server',
     'server_steps',
     'live_migration_server',
@@ -61,6 +62,7 @@ def unexpected_servers_cleanup():
         _server_steps[0] = server_steps  # inject server steps for finalizer
         # check=False because in best case no servers will be present
         servers = server_steps.get_servers(name_prefix=config.STEPLER_PREFIX,
+                                           fields=config.CLEANUP_FIELDS,
                                            check=False)
         if SKIPPED_SERVERS:
             server_names = [server.name for server in SKIPPED_SERVERS]
@@ -69,8 +71,9 @@ def unexpected_servers_cleanup():
                 "SKIPPED_SERVERS contains servers {!r}. They will not be "
                 "removed in cleanup procedure.".format(server_names))
 
+            skipped_ids = {server.id for server in SKIPPED_SERVERS}
             servers = [server for server in servers
-                       if server not in SKIPPED_SERVERS]
+                       if server.id not in skipped_ids]
         if servers:
             server_steps.delete_servers(servers)
 
@@ -122,9 +125,10 @@ def servers_cleanup(uncleanable, get_server_steps):
     def _get_servers():
         # check=False because in best case no servers will be retrieved
         return server_steps.get_servers(
-            name_prefix=config.STEPLER_PREFIX, check=False)
+            name_prefix=config.STEPLER_PREFIX, fields=config.CLEANUP_FIELDS,
+            check=False)
 
-    server_ids_before = [server.id for server in _get_servers()]
+    server_ids_before = {server.id for server in _get_servers()}
 
     yield
 
@@ -233,34 +237,65 @@ def server(cirros_image,
 
 # TODO(schipiga): this fixture is rudiment of MOS. Will be changed in future.
 @pytest.fixture
-def get_ssh_proxy_cmd(network_steps,
-                      os_faults_steps,
-                      server_steps):
-    """Callable function fixture to get ssh proxy data of server.
+def get_ssh_proxy_cmds(network_steps,
+                       os_faults_steps,
+                       server_steps):
+    """Callable function fixture to get ssh proxy commands of servers.
+
+    Servers are reached through DHCP namespaces of their networks. Networks
+    of all servers are resolved with few ports requests, DHCP hosts are
+    cached for short time and nodes are looked up once per call.
 
     Args:
         network_steps (NetworkSteps): instantiated network steps
         os_faults_steps (OsFaultsSteps): initialized os-faults steps
         server_steps (ServerSteps): instantiated server steps
 
+    Returns:
+        function: function to get ssh proxy commands, keyed by server id
+    """
+    def _get_ssh_proxy_cmds(servers, ips=None):
+        ips = ips or {}
+        ips_info = {}
+        for server in servers:
+            # proxy command is actual for fixed IP only
+            server_ips = server_steps.get_ips(server, 'fixed')
+            ip = ips.get(server.id)
+            ips_info[server.id] = (server_ips[ip] if ip
+                                   else list(server_ips.values())[0])
+
+        net_ids = network_steps.get_network_ids_by_macs(
+            [ip_info['mac'] for ip_info in ips_info.values()])
+        dhcp_hosts = network_steps.get_dhcp_hosts_by_networks(
+            net_ids.values())
+        nodes = os_faults_steps.get_nodes(fqdns=set(dhcp_hosts.values()))
+        nodes_ips = {node.fqdn: node.ip for node in nodes}
+
+        proxy_cmds = {}
+        for server_id, ip_info in ips_info.items():
+            net_id = net_ids[ip_info['mac']]
+            proxy_cmds[server_id] = (
+                'ssh root@{} ip netns exec qdhcp-{} netcat {} 22'.format(
+                    nodes_ips[dhcp_hosts[net_id]], net_id, ip_info['ip']))
+
+        return proxy_cmds
+
+    return _get_ssh_proxy_cmds
+
+
+@pytest.fixture
+def get_ssh_proxy_cmd(get_ssh_proxy_cmds):
+    """Callable function fixture to get ssh proxy data of server.
+
+    Args:
+        get_ssh_proxy_cmds (function): function to get ssh proxy commands
+            of servers
+
     Returns:
         function: function to get ssh proxy command
     """
     def _get_ssh_proxy_cmd(server, ip=None):
-        # proxy command is actual for fixed IP only
-        server_ips = server_steps.get_ips(server, 'fixed')
-        ip_info = server_ips[ip] if ip else server_ips.values()[0]
-        server_ip = ip_info['ip']
-        server_mac = ip_info['mac']
-        net_id = network_steps.get_network_id_by_mac(server_mac)
-        dhcp_netns = "qdhcp-{}".format(net_id)
-        dhcp_host = network_steps.get_dhcp_host_by_network(net_id)
-        dhcp_server_ip = [
-            node.ip for node in os_faults_steps.get_node(fqdns=[dhcp_host])][0]
-        proxy_cmd = 'ssh root@{} ip netns exec {} netcat {} 22'.format(
-            dhcp_server_ip, dhcp_netns, server_ip)
-
-        return proxy_cmd
+        return get_ssh_proxy_cmds([server], ips={server.id: ip})[server.id]
 
     return _get_ssh_proxy_cmd
 
@@ -274,7 +309,7 @@ def live_migration_servers(request,
                            net_subnet_router,
                            sorted_hypervisors,
                            current_project,
-                           nova_create_floating_ip,
+                           nova_create_floating_ips,
                            cinder_quota_steps,
                            hypervisor_steps,
                            volume_steps,
@@ -304,7 +339,8 @@ def live_migration_servers(request,
         net_subnet_router (tuple): neutron network, subnet and router
         sorted_hypervisors (list): nova hypervisors list
         current_project (obj): current project
-        nova_create_floating_ip (function): function to create floating IP
+        nova_create_floating_ips (function): function to create floating
+            IPs
         cinder_quota_steps (obj): instantiated cinder quota steps
         hypervisor_steps (obj): instantiated hypervisor steps
         volume_steps (obj): instantiated volume steps
@@ -370,7 +406,9 @@ def live_migration_servers(request,
             server,
             config.USERDATA_DONE_MARKER,
             timeout=config.USERDATA_EXECUTING_TIMEOUT)
-        server_steps.attach_floating_ip(server, nova_create_floating_ip())
+
+    server_steps.attach_floating_ips(
+        servers, nova_create_floating_ips(len(servers)))
     return servers
 
 
@@ -21,6 +21,7 @@ from hamcrest import assert_that, empty, equal_to, has_entries, is_not  # noqa
 from novaclient import exceptions
 
 from stepler.base import BaseSteps
+from stepler.third_party import resource_cache
 from stepler.third_party import steps_checker
 from stepler.third_party import waiter
 
@@ -190,6 +191,7 @@ class FlavorSteps(BaseSteps):
         Raises:
             AssertionError: if check failed
         """
+        resource_cache.mark_dirty(flavor)
         flavor.set_keys(metadata)
 
         if check:
@@ -17,10 +17,14 @@ Floating IP steps
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from hamcrest import assert_that, empty, has_length  # noqa H301
 from waiting import wait
 
+from stepler import config
 from stepler.base import BaseSteps
 from stepler.third_party import steps_checker
+from stepler.third_party import utils
+from stepler.third_party import waiter
 
 __all__ = [
     'FloatingIpSteps'
@@ -63,3 +67,102 @@ class FloatingIpSteps(BaseSteps):
                 return not present
 
         wait(predicate, timeout_seconds=timeout)
+
+    @steps_checker.step
+    def create_floating_ips(self, count, check=True):
+        """Step to create several floating IPs concurrently.
+
+        Args:
+            count (int): count of floating IPs
+            check (bool, optional): flag whether to check step or not
+
+        Returns:
+            list: floating IPs
+
+        Raises:
+            AssertionError: if any floating IP isn't created
+        """
+        floating_ip_pools = self._client.floating_ip_pools.list()
+        assert floating_ip_pools
+        pool_name = floating_ip_pools[0].name
+
+        floating_ips = utils.map_parallel(
+            lambda _: self._client.floating_ips.create(pool=pool_name),
+            range(count), config.FLOATING_IP_THREADS)
+
+        if check:
+            assert_that(floating_ips, has_length(count))
+            self.check_floating_ips_presence(floating_ips)
+
+        return floating_ips
+
+    @steps_checker.step
+    def delete_floating_ips(self, floating_ips, check=True):
+        """Step to delete several floating IPs concurrently.
+
+        Args:
+            floating_ips (list): floating IPs
+            check (bool, optional): flag whether to check step or not
+
+        Raises:
+            AssertionError: if any floating IP isn't deleted
+        """
+        utils.map_parallel(self._client.floating_ips.delete, floating_ips,
+                           config.FLOATING_IP_THREADS)
+
+        if check:
+            self.check_floating_ips_presence(floating_ips, present=False)
+
+    @steps_checker.step
+    def detach_floating_ips(self, floating_ips, check=True):
+        """Step to detach floating IPs from their servers.
+
+        Floating IPs associations are retrieved with one list query, not
+        associated floating IPs are skipped.
+
+        Args:
+            floating_ips (list): floating IPs
+            check (bool, optional): flag whether to check step or not
+
+        Raises:
+            AssertionError: if any floating IP is still associated
+        """
+        ids = {floating_ip.id for floating_ip in floating_ips}
+        attached = [floating_ip
+                    for floating_ip in self._client.floating_ips.list()
+                    if floating_ip.id in ids and floating_ip.instance_id]
+        utils.map_parallel(
+            lambda floating_ip: self._client.servers.remove_floating_ip(
+                floating_ip.instance_id, floating_ip),
+            attached, config.FLOATING_IP_THREADS)
+
+        if check:
+            attached = [floating_ip
+                        for floating_ip in self._client.floating_ips.list()
+                        if floating_ip.id in ids and floating_ip.instance_id]
+            assert_that(attached, empty())
+
+    @steps_checker.step
+    def check_floating_ips_presence(self, floating_ips, present=True,
+                                    timeout=0):
+        """Verify step to check floating IPs presence with one list query.
+
+        Args:
+            floating_ips (list): floating IPs
+            present (bool, optional): flag whether floating IPs should be
+                present or absent
+            timeout (int, optional): seconds to wait a result of check
+
+        Raises:
+            TimeoutExpired: if check failed after timeout
+        """
+        ids = {floating_ip.id for floating_ip in floating_ips}
+        expected_count = len(ids) if present else 0
+
+        def _check_floating_ips_presence():
+            present_ids = [floating_ip.id
+                           for floating_ip in self._client.floating_ips.list()
+                           if floating_ip.id in ids]
+            return waiter.expect_that(present_ids, has_length(expected_count))
+
+        waiter.wait(_check_floating_ips_presence, timeout_seconds=timeout)
@@ -21,6 +21,7 @@ from hamcrest import assert_that, has_item, has_entries  # noqa
 from waiting import wait
 
 from stepler.base import BaseSteps
+from stepler.third_party import resource_cache
 from stepler.third_party import steps_checker
 
 __all__ = [
@@ -44,6 +45,7 @@ class SecurityGroupSteps(BaseSteps):
     @steps_checker.step
     def add_group_rules(self, group, rules, check=True):
         """Step to add rules to security group."""
+        resource_cache.mark_dirty(group)
         for rule in rules:
             self._client.security_group_rules.create(group.id, **rule)
 
@@ -21,12 +21,14 @@ import collections
 import contextlib
 import itertools
 import os
+import re
 import socket
 import time
 
 from hamcrest import (assert_that, calling, empty, equal_to, has_entries,
-                      has_item, has_properties, is_, is_in, is_not,
-                      less_than_or_equal_to, raises)  # noqa H301
+                      has_item, has_length, has_properties, is_, is_in,
+                      is_not, less_than, less_than_or_equal_to,
+                      raises)  # noqa H301
 
 from novaclient import exceptions as nova_exceptions
 import paramiko
@@ -36,7 +38,9 @@ from stepler import base
 from stepler import config
 from stepler.third_party import arping
 from stepler.third_party import chunk_serializer
+from stepler.third_party import downtime
 from stepler.third_party import iperf
+from stepler.third_party import pagination
 from stepler.third_party import ping
 from stepler.third_party import ssh
 from stepler.third_party import steps_checker
@@ -152,20 +156,33 @@ class ServerSteps(base.BaseSteps):
             self._hard_delete_servers(servers, check)
 
     @steps_checker.step
-    def get_servers(self, name_prefix=None, check=True):
+    def get_servers(self, name_prefix=None, limit=None, fields=None,
+                    check=True):
         """Step to retrieve servers from nova.
 
+        Servers are requested page by page and name prefix is filtered on
+        server side, so only required servers are fetched.
+
         Args:
             name_prefix (str): prefix of server names to get
+            limit (int|None): max count of servers to get
+            fields (tuple|None): if passed, servers are projected to
+                lightweight records with these fields only
             check (bool): flag whether to check step or not
         Returns:
             list: server list
         """
-        servers = self._client.list()
-
+        search_opts = {}
         if name_prefix:
-            servers = [server for server in servers
-                       if (server.name or '').startswith(name_prefix)]
+            # nova filters server names by regular expression
+            search_opts['name'] = '^' + re.escape(name_prefix)
+        servers = pagination.iter_pages(self._client.list,
+                                        config.LIST_PAGE_SIZE,
+                                        search_opts=search_opts)
+        servers = pagination.filter_by_name_prefix(servers, name_prefix)
+        if fields:
+            servers = pagination.project(servers, fields)
+        servers = pagination.take(servers, limit)
 
         if check:
             assert_that(servers, is_not(empty()))
@@ -208,7 +225,9 @@ class ServerSteps(base.BaseSteps):
         """
         if by_name:
             def predicate():
-                names = [s.name for s in self._client.list()]
+                search_opts = {'name': '^{}$'.format(re.escape(server.name))}
+                names = [s.name for s in
+                         self._client.list(search_opts=search_opts)]
                 return present == (server.name in names)
         else:
             def predicate():
@@ -332,6 +351,58 @@ class ServerSteps(base.BaseSteps):
                         has_item(floating_ip.ip),
                         "Floating IP not in a list of server's IPs.")
 
+    @steps_checker.step
+    def attach_floating_ips(self, servers, floating_ips, check=True):
+        """Step to attach floating IPs to servers concurrently.
+
+        Servers are refreshed with one list query.
+
+        Args:
+            servers (list): nova servers
+            floating_ips (list): floating IPs, one per server
+            check (bool, optional): flag whether to check step or not
+
+        Raises:
+            TimeoutExpired: if any floating IP isn't in server's IPs after
+                timeout
+        """
+        assert_that(floating_ips, has_length(len(servers)))
+        pairs = list(zip(servers, floating_ips))
+        utils.map_parallel(
+            lambda pair: self._client.add_floating_ip(*pair),
+            pairs, config.FLOATING_IP_THREADS)
+
+        if check:
+            def _check_floating_ips_attached():
+                self._refresh_servers(servers)
+                for server, floating_ip in pairs:
+                    floating_ips = self.get_ips(server, 'floating',
+                                                check=False).keys()
+                    waiter.expect_that(
+                        floating_ips, has_item(floating_ip.ip),
+                        "Floating IP not in a list of server's IPs.")
+                return True
+
+            waiter.wait(_check_floating_ips_attached,
+                        timeout_seconds=config.SERVER_UPDATE_TIMEOUT)
+
+    def _refresh_servers(self, servers):
+        """Refresh servers details with list query filtered by names."""
+        servers = {server.id: server for server in servers}
+        # nova filters server names by regular expression
+        names_re = '^({})$'.format('|'.join(
+            sorted({re.escape(server.name) for server in servers.values()})))
+        actual_servers = pagination.iter_pages(self._client.list,
+                                               config.LIST_PAGE_SIZE,
+                                               search_opts={'name': names_re})
+        refreshed_ids = set()
+        for actual_server in actual_servers:
+            if actual_server.id in servers:
+                servers[actual_server.id]._add_details(actual_server._info)
+                refreshed_ids.add(actual_server.id)
+                if refreshed_ids == set(servers):
+                    break
+
     @steps_checker.step
     def detach_floating_ip(self, server, floating_ip, check=True):
         # TODO(schipiga): expand documentation
@@ -790,6 +861,41 @@ class ServerSteps(base.BaseSteps):
                                    timeout=connect_restore_timeout)
         assert_that(result.loss, less_than_or_equal_to(max_loss))
 
+    @steps_checker.step
+    @contextlib.contextmanager
+    def check_downtime_context(self, ip_to_ping, max_outage, server_ssh=None,
+                               interval=config.DOWNTIME_PROBE_INTERVAL,
+                               connect_restore_timeout=0):
+        """Step to check that max connectivity outage inside CM is short.
+
+        Unlike ``check_ping_loss_context`` it measures duration of each
+        outage instead of total count of lost pings.
+
+        Args:
+            ip_to_ping (str): ip address to ping
+            max_outage (float): maximum allowed duration of single outage,
+                in seconds
+            server_ssh (obj, optional): instance of
+                stepler.third_party.ssh.SshClient. If None - probes will be
+                sent from local machine
+            interval (float, optional): interval between probes, in seconds
+            connect_restore_timeout (int, optional): time in seconds to wait
+                for connection to be restored before CM exit
+
+        Yields:
+            object: instance of DowntimeResult with outages intervals, which
+                are available after CM exit
+
+        Raises:
+            AssertionError: if any outage is longer than `max_outage`
+        """
+        with downtime.downtime_meter(ip_to_ping, remote=server_ssh,
+                                     interval=interval) as result:
+            yield result
+            self.check_ping_for_ip(ip_to_ping, remote_from=server_ssh,
+                                   timeout=connect_restore_timeout)
+        assert_that(result.max_outage, less_than(max_outage))
+
     @steps_checker.step
     @contextlib.contextmanager
     def check_no_ping_context(self, ip_to_ping, server_ssh=None):
@@ -1253,7 +1359,7 @@ class ServerSteps(base.BaseSteps):
         # it doesn't delete server really, just hides server and marks it as
         # trash for nova garbage collection after reclaim timeout.
         for server in servers:
-            server.delete()
+            self._client.delete(server)
 
         if check:
             for server in servers:
@@ -1266,7 +1372,7 @@ class ServerSteps(base.BaseSteps):
 
     def _hard_delete_servers(self, servers, check):
         for server in servers:
-            server.force_delete()  # delete server really
+            self._client.force_delete(server)  # delete server really
 
         if check:
             for server in servers:
@@ -24,6 +24,7 @@ from stepler import config
 from stepler.os_faults.steps import OsFaultsSteps
 from stepler import os_faults_config
 from stepler.third_party import context
+from stepler.third_party import ssh_executor
 
 __all__ = [
     'os_faults_client',
@@ -55,13 +56,24 @@ def os_faults_client():
 def os_faults_steps(os_faults_client):
     """Function fixture to get os_faults steps.
 
+    If ``OS_FAULTS_SSH_EXECUTOR`` is set, shell commands are executed on nodes
+    via persistent SSH sessions, which are closed at the end of session.
+
     Args:
         os_faults_client (object): instantiated os_faults client
 
-    Returns:
+    Yields:
         stepler.os_faults.steps.OsFaultsSteps: instantiated os_faults steps
     """
-    return OsFaultsSteps(os_faults_client)
+    node_executor = None
+    if os_faults_config.OS_FAULTS_SSH_EXECUTOR:
+        node_executor = ssh_executor.SshExecutor(
+            os_faults_client, timeout=config.SSH_CLIENT_TIMEOUT)
+
+    yield OsFaultsSteps(os_faults_client, node_executor=node_executor)
+
+    if node_executor:
+        node_executor.close()
 
 
 @pytest.fixture(scope='session')
@@ -18,18 +18,21 @@ os_faults steps
 # limitations under the License.
 
 import os
-import re
 import tempfile
 import time
 
 from hamcrest import (assert_that, empty, has_item, has_properties, is_not,
                       only_contains, has_items, has_length, is_, equal_to,
-                      contains_inanyorder, is_in)  # noqa H301
+                      contains_inanyorder, is_in, greater_than)  # noqa H301
 
 from stepler import base
 from stepler import config
+from stepler.third_party import log_cursor
 from stepler.third_party import network_checks
+from stepler.third_party import ovs_snapshot
 from stepler.third_party import steps_checker
+from stepler.third_party import task_batch
+from stepler.third_party import topology
 from stepler.third_party import utils
 from stepler.third_party import waiter
 
@@ -39,6 +42,35 @@ __all__ = ['OsFaultsSteps']
 class OsFaultsSteps(base.BaseSteps):
     """os-faults steps."""
 
+    def __init__(self, client, node_executor=None):
+        """Constructor.
+
+        Args:
+            client (object): os-faults client
+            node_executor (object, optional): executor of shell commands on
+                nodes, for ex: stepler.third_party.ssh_executor.SshExecutor.
+                If None - commands are executed as ansible tasks.
+        """
+        super(OsFaultsSteps, self).__init__(client)
+        self._node_executor = node_executor
+        if node_executor is None:
+            self._polling_time = config.POLLING_TIME
+        else:
+            self._polling_time = config.SSH_EXECUTOR_POLLING_TIME
+        self._topology = topology.Topology(client)
+
+    def invalidate_topology(self, service_names=None):
+        """Drop cached nodes and services placement.
+
+        It should be called after actions changing services placement, which
+        are not made by these steps.
+
+        Args:
+            service_names (list, optional): names of services to forget
+                placement of. If None - all cached data is dropped.
+        """
+        self._topology.invalidate(service_names=service_names)
+
     @steps_checker.step
     def get_nodes(self, fqdns=None, service_names=None, check=True):
         """Step to get nodes.
@@ -54,15 +86,14 @@ class OsFaultsSteps(base.BaseSteps):
         if service_names:
             service_fqdns = set()
             for service_name in service_names:
-                nodes = self._client.get_service(service_name).get_nodes()
-                for host in nodes.hosts:
-                    service_fqdns.add(host.fqdn)
+                service_fqdns |= self._topology.get_service_fqdns(
+                    service_name)
             if not fqdns:
                 fqdns = service_fqdns
             else:
                 fqdns = set(fqdns)
                 fqdns &= service_fqdns
-        nodes = self._client.get_nodes(fqdns=fqdns)
+        nodes = self._topology.get_nodes(fqdns=fqdns)
 
         if check:
             assert_that(nodes, is_not(empty()))
@@ -188,6 +219,7 @@ class OsFaultsSteps(base.BaseSteps):
             service = self._client.get_service(name=name)
             services.append(service)
             service.restart(nodes=nodes)
+        self._topology.invalidate(service_names=names)
         if check:
             # TODO(gdyuldin): make normal check
             assert_that(services, is_not(empty()))
@@ -206,6 +238,7 @@ class OsFaultsSteps(base.BaseSteps):
         """
         service = self._client.get_service(service_name)
         service.terminate(nodes)
+        self._topology.invalidate(service_names=[service_name])
         if check:
             self.check_service_state(
                 service_name,
@@ -227,6 +260,7 @@ class OsFaultsSteps(base.BaseSteps):
         """
         service = self._client.get_service(service_name)
         service.start(nodes)
+        self._topology.invalidate(service_names=[service_name])
         if check:
             self.check_service_state(
                 service_name,
@@ -340,7 +374,7 @@ class OsFaultsSteps(base.BaseSteps):
         Returns:
             str: path to backup file
         """
-        suffix = suffix or utils.generate_ids('backup', length=30)
+        suffix = suffix or next(utils.generate_ids('backup', length=30))
         backup_path = "{}.{}".format(file_path, suffix)
 
         task = {
@@ -403,6 +437,9 @@ class OsFaultsSteps(base.BaseSteps):
                        section=None, check=True):
         """Step to patch INI like file.
 
+        Backup and patching are executed with single ansible play. File isn't
+        patched on nodes where backup is failed.
+
         Args:
             nodes (obj): nodes hostnames to patch file on it
             file_path (str): path to ini file on remote host
@@ -414,9 +451,17 @@ class OsFaultsSteps(base.BaseSteps):
 
         Returns:
             str: path to original file
+
+        Raises:
+            AnsibleExecutionException: if backup or patching is failed
+            AssertionError: if file isn't patched
         """
-        backup_path = self.make_backup(nodes, file_path)
-        task = {
+        suffix = next(utils.generate_ids('backup', length=30))
+        backup_path = "{}.{}".format(file_path, suffix)
+        batch = task_batch.TaskBatch(nodes)
+        batch.add_shell('cp "{path}" "{backup_path}"'.format(
+            path=file_path, backup_path=backup_path), ignore_errors=False)
+        batch.add({
             'ini_file': {
                 'backup': False,
                 'dest': file_path,
@@ -424,8 +469,8 @@ class OsFaultsSteps(base.BaseSteps):
                 'option': option,
                 'value': value,
             }
-        }
-        nodes.run_task(task)
+        })
+        batch.run()
         if check:
             self.check_file_contains_line(
                 nodes, file_path, "{} = {}".format(option, value))
@@ -447,8 +492,12 @@ class OsFaultsSteps(base.BaseSteps):
         Returns:
             list: AnsibleExecutionRecord(s)
         """
-        task = {'shell': cmd}
-        result = nodes.run_task(task, raise_on_error=check)
+        if self._node_executor is None:
+            task = {'shell': cmd}
+            result = nodes.run_task(task, raise_on_error=check)
+        else:
+            result = self._node_executor.execute(nodes, cmd,
+                                                 raise_on_error=check)
 
         if check:
             assert_that(
@@ -543,7 +592,7 @@ class OsFaultsSteps(base.BaseSteps):
 
     @steps_checker.step
     def check_process_pid(self, node, process_name, expected_pid,
-                          check_parent=True):
+                          check_parent=True, timeout=0):
         """Step to check the process pid on a single node.
 
         Args:
@@ -552,13 +601,20 @@ class OsFaultsSteps(base.BaseSteps):
             expected_pid (int): expected pid
             check_parent (bool): flag which pid should be checked -
                 parent's or child's one.
+            timeout (int, optional): seconds to wait a result of check
 
         Raises:
-            AssertionError|AnsibleExecutionException: if command execution
-                failed or pid is not equal to expected one
+            AnsibleExecutionException: if command execution failed
+            TimeoutExpired: if pid is not equal to expected one after timeout
         """
-        pid = self.get_process_pid(node, process_name, get_parent=check_parent)
-        assert_that(pid, is_(expected_pid))
+        def _check_process_pid():
+            pid = self.get_process_pid(node, process_name,
+                                       get_parent=check_parent)
+            return waiter.expect_that(pid, is_(expected_pid))
+
+        waiter.wait(_check_process_pid,
+                    timeout_seconds=timeout,
+                    sleep_seconds=self._polling_time)
 
     @steps_checker.step
     def send_signal_to_process(self, node, pid, signal, delay=None,
@@ -619,11 +675,185 @@ class OsFaultsSteps(base.BaseSteps):
         assert_that(value, is_(expected_value))
 
     @steps_checker.step
-    def get_ovs_flows_cookies(self, node, check=True):
+    def get_log_cursor(self, node, file_name, check=True):
+        """Step to get cursor at the end of log file on a single node.
+
+        Args:
+            node (NodeCollection): node
+            file_name (str): name of log file
+            check (bool): flag whether check step or not
+
+        Raises:
+            AssertionError|AnsibleExecutionException: if command execution
+                failed in case of check=True
+
+        Returns:
+            LogCursor: cursor to read new log records from
+        """
+        cmd = log_cursor.get_cursor_cmd(file_name)
+        result = self.execute_cmd(node, cmd, check=check)
+        return log_cursor.parse_cursor(file_name,
+                                       result[0].payload['stdout'])
+
+    @steps_checker.step
+    def get_log_since_cursor(self, node, cursor, check=True):
+        """Step to get log content appended after cursor on a single node.
+
+        Only new bytes are read and they are transferred compressed.
+
+        Args:
+            node (NodeCollection): node
+            cursor (LogCursor): log cursor
+            check (bool): flag whether check step or not
+
+        Raises:
+            AssertionError|AnsibleExecutionException: if command execution
+                failed in case of check=True
+
+        Returns:
+            str: new log content
+        """
+        cmd = log_cursor.get_read_cmd(cursor)
+        result = self.execute_cmd(node, cmd, check=check)
+        return log_cursor.decode_output(result[0].payload['stdout'])
+
+    @steps_checker.step
+    def check_log_counts(self, node, cursor, expected_counts):
+        """Step to check numbers of lines matching patterns in new log records.
+
+        All patterns are checked against single read of log content appended
+        after cursor.
+
+        Args:
+            node (NodeCollection): node
+            cursor (LogCursor): log cursor
+            expected_counts (dict): expected count of lines matching pattern,
+                keyed by regular expression. ``None`` means that pattern must
+                be matched at least once.
+
+        Raises:
+            AssertionError|AnsibleExecutionException: if command execution
+                failed or real count of lines matching any pattern is not
+                equal to expected one
+        """
+        text = self.get_log_since_cursor(node, cursor)
+        counts = log_cursor.count_matches(text, list(expected_counts))
+        for pattern, expected_count in expected_counts.items():
+            message = "Count of {!r} in {}".format(pattern, cursor.file_name)
+            if expected_count is None:
+                assert_that(counts[pattern], greater_than(0), message)
+            else:
+                assert_that(counts[pattern], equal_to(expected_count),
+                            message)
+
+    def _get_snapshots(self, nodes, result, parse):
+        # ansible records are keyed by node ip
+        fqdns = {host.ip: host.fqdn for host in nodes.hosts}
+        return {fqdns.get(record.host, record.host): parse(
+            record.payload['stdout']) for record in result}
+
+    @steps_checker.step
+    def get_ovs_flows(self, nodes=None, bridge='br-int', check=True):
+        """Step to get snapshot of ovs flows from nodes.
+
+        Flows are dumped from all nodes with single command execution.
+
+        Args:
+            nodes (NodeCollection, optional): nodes to retrieve flows from.
+                All nodes by default.
+            bridge (str, optional): ovs bridge name
+            check (bool, optional): flag whether check step or not
+
+        Returns:
+            dict: frozensets of ovs_snapshot.Flow, keyed by node fqdn
+
+        Raises:
+            AssertionError: if any node has no flows
+        """
+        nodes = nodes or self.get_nodes()
+        result = self.execute_cmd(
+            nodes, ovs_snapshot.DUMP_FLOWS_CMD.format(bridge=bridge))
+        flows = self._get_snapshots(nodes, result, ovs_snapshot.parse_flows)
+
+        if check:
+            assert_that(flows.values(), only_contains(is_not(empty())))
+
+        return flows
+
+    @steps_checker.step
+    def get_ovs_ports(self, nodes=None, check=True):
+        """Step to get snapshot of ovs ports with their tags from nodes.
+
+        Args:
+            nodes (NodeCollection, optional): nodes to retrieve ports from.
+                All nodes by default.
+            check (bool, optional): flag whether check step or not
+
+        Returns:
+            dict: frozensets of ovs_snapshot.Port, keyed by node fqdn
+
+        Raises:
+            AssertionError: if ports snapshot is empty
+        """
+        nodes = nodes or self.get_nodes()
+        result = self.execute_cmd(nodes, ovs_snapshot.LIST_PORTS_CMD)
+        ports = self._get_snapshots(nodes, result, ovs_snapshot.parse_ports)
+
+        if check:
+            assert_that(ports, is_not(empty()))
+
+        return ports
+
+    @steps_checker.step
+    def check_ovs_flows_diff(self, old_flows, added=False, removed=False,
+                             ignore_fields=('cookie',), bridge='br-int',
+                             skip_transient=True):
+        """Step to check that ovs flows were added or removed on nodes.
+
+        Actual flows are dumped from nodes of ``old_flows`` and compared
+        with them.
+
+        Args:
+            old_flows (dict): snapshot from :meth:`get_ovs_flows`
+            added (bool, optional): whether flows should be added
+            removed (bool, optional): whether flows should be removed
+            ignore_fields (tuple, optional): flow fields to not compare.
+                Cookies are ignored by default as they are changed after
+                neutron OVS agent restart.
+            bridge (str, optional): ovs bridge name
+            skip_transient (bool, optional): flag whether to not compare
+                flows with timeouts (for ex. learned ones), which come and
+                go with traffic
+
+        Raises:
+            AssertionError: if flows changes don't match expected ones
+        """
+        nodes = self.get_nodes(fqdns=list(old_flows))
+        new_flows = self.get_ovs_flows(nodes, bridge=bridge, check=False)
+        assert_that(set(new_flows), equal_to(set(old_flows)))
+        for fqdn, flows in old_flows.items():
+            fresh_flows = new_flows[fqdn]
+            if skip_transient:
+                flows = [flow for flow in flows if not flow.transient]
+                fresh_flows = [flow for flow in fresh_flows
+                               if not flow.transient]
+            flows_diff = ovs_snapshot.diff(flows, fresh_flows,
+                                           ignore_fields=ignore_fields)
+            assert_that(bool(flows_diff.added), equal_to(added),
+                        'Flows added on {}: {}'.format(fqdn,
+                                                       flows_diff.added))
+            assert_that(bool(flows_diff.removed), equal_to(removed),
+                        'Flows removed on {}: {}'.format(
+                            fqdn, flows_diff.removed))
+
+    @steps_checker.step
+    def get_ovs_flows_cookies(self, node, flows=None, check=True):
         """Step to retrieve ovs flows cookies from node.
 
         Args:
             node (obj): NodeCollection to retrieve flows from
+            flows (dict, optional): already retrieved snapshot from
+                :meth:`get_ovs_flows` to get cookies from instead of node
             check (bool, optional): flag whether check step or not
 
         Returns:
@@ -632,11 +862,11 @@ class OsFaultsSteps(base.BaseSteps):
         Raises:
             AssertionError: if flows cookies has more than one value
         """
-        cmd = "ovs-ofctl dump-flows br-int"
-        result = self.execute_cmd(node, cmd)
-        stdout = result[0].payload['stdout']
-        cookies = re.findall(r'cookie=(?P<value>[^,]+)', stdout)
-        uniq_cookies = set(cookies)
+        if flows is None:
+            flows = self.get_ovs_flows(node, check=False)
+        uniq_cookies = {flow.cookie
+                        for host_flows in flows.values()
+                        for flow in host_flows}
         if check:
             assert_that(uniq_cookies, has_length(1))
         return uniq_cookies
@@ -673,31 +903,11 @@ class OsFaultsSteps(base.BaseSteps):
         Raises:
             AssertionError: if ovs-vsctl tags dict is empty
         """
-        def get_ports_tags_data(lines):
-            """Return ovs-vsctl tags in dict format."""
-            port_tags = {}
-            last_offset = 0
-            port = None
-            for line in lines[1:]:
-                line = line.rstrip()
-                key, val = line.split(None, 1)
-                offset = len(line) - len(line.lstrip())
-                if port is None:
-                    if key.lower() == 'port':
-                        port = val.strip('"')
-                        last_offset = offset
-                elif offset <= last_offset:
-                    port = None
-                elif key.lower() == 'tag:':
-                    port_tags[port] = val
-                    port = None
-            return port_tags
-
-        nodes = self.get_nodes()
-        result_records = self.execute_cmd(nodes, 'ovs-vsctl show')
+        ports = self.get_ovs_ports(check=False)
         ovs_vsctl_tags = {
-            record.host: get_ports_tags_data(record.payload['stdout_lines'])
-            for record in result_records}
+            host: {port.name: port.tag
+                   for port in host_ports if port.tag is not None}
+            for host, host_ports in ports.items()}
 
         if check:
             assert_that(ovs_vsctl_tags, is_not(empty()))
@@ -844,7 +1054,9 @@ class OsFaultsSteps(base.BaseSteps):
             return waiter.expect_that(
                 result, only_contains(has_properties(status=status)))
 
-        waiter.wait(_check_router_namespace_presence, timeout_seconds=timeout)
+        waiter.wait(_check_router_namespace_presence,
+                    timeout_seconds=timeout,
+                    sleep_seconds=self._polling_time)
 
     @steps_checker.step
     def delete_router_namespace(self, nodes, router, check=True):
@@ -930,6 +1142,7 @@ class OsFaultsSteps(base.BaseSteps):
                 off.
         """
         nodes.poweroff()
+        self._topology.invalidate()
         if check:
             self.check_nodes_tcp_availability(nodes, must_available=False)
 
@@ -942,6 +1155,7 @@ class OsFaultsSteps(base.BaseSteps):
             check (bool, optional): flag whether to check this step or not
         """
         nodes.reset()
+        self._topology.invalidate()
         if check:
             self.check_nodes_tcp_availability(nodes, must_available=False)
         if wait_reboot:
@@ -45,3 +45,7 @@ OS_FAULTS_DICT_CONFIG = {
         }
     }
 }
+
+# Execute shell commands on nodes via persistent SSH sessions instead of
+# ansible plays
+OS_FAULTS_SSH_EXECUTOR = bool(getenv('SSH_EXECUTOR', False))
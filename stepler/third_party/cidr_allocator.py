@@ -0,0 +1,147 @@
+"""
+--------------
+CIDR allocator
+--------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import os
+import socket
+import struct
+
+from stepler.third_party import process_mutex
+
+__all__ = [
+    'CidrAllocator',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _to_int(ip):
+    return struct.unpack('!I', socket.inet_aton(ip))[0]
+
+
+def _to_ip(value):
+    return socket.inet_ntoa(struct.pack('!I', value))
+
+
+def _get_range(cidr):
+    """Get first and last addresses of IPv4 CIDR as integers."""
+    ip, prefix_len = cidr.split('/')
+    size = 2 ** (32 - int(prefix_len))
+    start = _to_int(ip) // size * size
+    return start, start + size - 1
+
+
+def _is_ipv4(cidr):
+    return ':' not in cidr
+
+
+class CidrAllocator(object):
+    """Allocator of non-overlapping IPv4 CIDRs for subnets.
+
+    Allocated CIDRs are stored to JSON registry guarded with process mutex,
+    so pytest-xdist workers never get the same or overlapping CIDRs. CIDRs
+    already used in the cloud are skipped too.
+
+    Example:
+        >>> allocator = CidrAllocator('/tmp/cidrs.json', '10.0.0.0/16')
+        >>> allocator.allocate(used_cidrs=['10.0.0.0/24'])
+        '10.0.1.0/24'
+        >>> allocator.release('10.0.1.0/24')
+    """
+
+    def __init__(self, path, pool='10.0.0.0/16', prefix_len=24):
+        """Constructor.
+
+        Args:
+            path (str): path to registry file
+            pool (str, optional): IPv4 CIDR to allocate CIDRs from
+            prefix_len (int, optional): prefix length of allocated CIDRs
+        """
+        self._path = path
+        self._lock_path = path + '.lock'
+        self._pool = pool
+        self._prefix_len = prefix_len
+
+    def _read(self):
+        if not os.path.exists(self._path):
+            return []
+        with open(self._path) as f:
+            return json.load(f)
+
+    def _write(self, cidrs):
+        tmp_path = self._path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(cidrs, f, indent=2)
+        os.rename(tmp_path, self._path)
+
+    def allocate(self, used_cidrs=()):
+        """Allocate CIDR.
+
+        Args:
+            used_cidrs (list, optional): CIDRs which are already used in
+                cloud. IPv6 CIDRs are ignored.
+
+        Returns:
+            str: allocated CIDR
+
+        Raises:
+            LookupError: if pool has no free CIDRs
+        """
+        pool_start, pool_end = _get_range(self._pool)
+        size = 2 ** (32 - self._prefix_len)
+
+        with process_mutex.Lock(self._lock_path):
+            allocated = self._read()
+            busy = sorted(_get_range(cidr)
+                          for cidr in list(allocated) + list(used_cidrs)
+                          if _is_ipv4(cidr))
+
+            start = pool_start
+            for busy_start, busy_end in busy:
+                if start + size - 1 < busy_start:
+                    break
+                if busy_end >= start:
+                    # move to first aligned range after busy one
+                    start = (busy_end // size + 1) * size
+
+            if start + size - 1 > pool_end:
+                raise LookupError(
+                    'No free CIDRs /{} in {}'.format(self._prefix_len,
+                                                     self._pool))
+
+            cidr = '{}/{}'.format(_to_ip(start), self._prefix_len)
+            allocated.append(cidr)
+            self._write(allocated)
+
+        LOGGER.debug('Allocate CIDR {}'.format(cidr))
+        return cidr
+
+    def release(self, cidr):
+        """Release allocated CIDR.
+
+        Args:
+            cidr (str): allocated CIDR
+        """
+        with process_mutex.Lock(self._lock_path):
+            allocated = self._read()
+            if cidr in allocated:
+                allocated.remove(cidr)
+                self._write(allocated)
+        LOGGER.debug('Release CIDR {}'.format(cidr))
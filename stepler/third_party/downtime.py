@@ -0,0 +1,243 @@
+"""
+---------------------------
+Connectivity downtime meter
+---------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import contextlib
+import logging
+import os
+import re
+import signal
+import sys
+import tempfile
+
+if os.name == 'posix' and sys.version_info[0] < 3:
+    import subprocess32 as subprocess
+else:
+    import subprocess
+
+__all__ = [
+    'DowntimeResult',
+    'Outage',
+    'downtime_meter',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+# minimal probes interval of ping for not superuser, in seconds
+MIN_USER_INTERVAL = 0.2
+
+_reply_re = re.compile(
+    r'^\[(?P<ts>\d+\.\d+)\].*?icmp_seq=(?P<seq>\d+).*?time=(?P<rtt>[\d.]+)',
+    re.MULTILINE)
+_transmitted_count_re = re.compile(r'(?P<count>\d+)(?: packets transmitted)')
+
+# icmp_seq is 16-bit field, it wraps on long measurements with high rate
+_SEQ_MODULO = 2 ** 16
+
+
+class Outage(collections.namedtuple('Outage', ['start', 'end'])):
+    """Connectivity outage interval.
+
+    ``start`` and ``end`` are seconds from the first sent probe.
+    """
+
+    __slots__ = ()
+
+    @property
+    def duration(self):
+        return self.end - self.start
+
+
+def _get_send_times(stdout):
+    """Get send timestamps of answered probes, keyed by unwrapped icmp_seq.
+
+    ``ping -D`` prints reply receiving time, so probe sending time is the
+    receiving time without round trip time.
+    """
+    send_times = {}
+    offset = 0
+    last_seq = None
+    for match in _reply_re.finditer(stdout):
+        seq = int(match.group('seq')) + offset
+        if last_seq is not None and seq < last_seq - _SEQ_MODULO // 2:
+            offset += _SEQ_MODULO
+            seq += _SEQ_MODULO
+        last_seq = seq
+        send_time = float(match.group('ts')) - float(match.group('rtt')) / 1000
+        # DUP! replies must not override original reply
+        send_times.setdefault(seq, send_time)
+    return send_times
+
+
+def _parse(stdout, interval):
+    """Parse ``ping -D`` output to list of outages.
+
+    Sending time of lost probe is interpolated between the nearest answered
+    probes. Outage starts at sending time of the first lost probe and ends at
+    sending time of the next answered one. Leading and trailing losses are
+    bounded by virtual probes sent right before and after measurement.
+
+    Args:
+        stdout (str): ``ping -D`` output including statistics
+        interval (float): interval between probes, in seconds
+
+    Returns:
+        list: Outage instances
+
+    Raises:
+        ValueError: if output has no transmitted count
+    """
+    result = _transmitted_count_re.search(stdout)
+    if result is None:
+        raise ValueError(
+            'There is no transmitted count in `{}`'.format(stdout))
+    transmitted = int(result.group('count'))
+
+    send_times = _get_send_times(stdout)
+    if not send_times:
+        if not transmitted:
+            return []
+        return [Outage(0., transmitted * interval)]
+
+    first_seq = min(send_times)
+    last_seq = max(send_times)
+    origin = send_times[first_seq] - (first_seq - 1) * interval
+    send_times[0] = origin - interval
+    last_seq_after = max(transmitted, last_seq) + 1
+    send_times[last_seq_after] = (send_times[last_seq] +
+                                  (last_seq_after - last_seq) * interval)
+
+    outages = []
+    seqs = sorted(send_times)
+    for prev_seq, next_seq in zip(seqs, seqs[1:]):
+        if next_seq - prev_seq < 2:
+            continue
+        prev_time = send_times[prev_seq]
+        next_time = send_times[next_seq]
+        start = prev_time + (next_time - prev_time) / (next_seq - prev_seq)
+        outages.append(Outage(start - origin, next_time - origin))
+    return outages
+
+
+class DowntimeResult(object):
+    """Downtime meter result.
+
+    Useful for object-oriented access to connectivity outages.
+    """
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.stdout = ''
+
+    @property
+    def outages(self):
+        return _parse(self.stdout, self.interval)
+
+    @property
+    def max_outage(self):
+        return max([outage.duration for outage in self.outages] or [0.])
+
+    @property
+    def total_downtime(self):
+        return sum(outage.duration for outage in self.outages)
+
+
+def _prepare_cmd(ip, interval):
+    return ['ping', '-D', '-i', '{:.3f}'.format(interval), ip]
+
+
+def _is_superuser():
+    return os.name != 'posix' or os.geteuid() == 0
+
+
+@contextlib.contextmanager
+def _local_meter(ip, interval):
+    if interval < MIN_USER_INTERVAL and not _is_superuser():
+        LOGGER.warning('Probes interval {} s requires superuser privileges, '
+                       '{} s is used instead'.format(interval,
+                                                     MIN_USER_INTERVAL))
+        interval = MIN_USER_INTERVAL
+    cmd = _prepare_cmd(ip, interval)
+    p = subprocess.Popen(cmd,
+                         stdout=subprocess.PIPE,
+                         stderr=subprocess.PIPE,
+                         universal_newlines=True)
+    result = DowntimeResult(interval)
+    yield result
+    # ping sends probes until interruption, so exit before it is an error
+    exited = p.poll() is not None
+    if not exited:
+        p.send_signal(signal.SIGINT)
+    stdout, stderr = p.communicate()
+    if exited:
+        raise Exception(
+            'Command {!r} unexpectedly exit with code {} and message '
+            '{}'.format(cmd, p.returncode, stderr))
+    result.stdout = stdout
+
+
+@contextlib.contextmanager
+def _remote_meter(ip, interval, remote):
+    cmd = ' '.join(_prepare_cmd(ip, interval))
+    output_file = tempfile.mktemp()
+    # interval less than 200ms is allowed for superuser only
+    with remote.sudo():
+        pid = remote.background_call(cmd, stdout=output_file)
+    result = DowntimeResult(interval)
+    yield result
+    with remote.sudo():
+        remote.execute('kill -SIGINT {}'.format(pid))
+        remote.execute('while kill -0 {pid} 2> /dev/null; '
+                       'do sleep 0.1; done;'.format(pid=pid))
+        result.stdout = remote.check_call(
+            "cat {}".format(output_file)).stdout
+        remote.execute('rm {}'.format(output_file))
+
+
+def downtime_meter(ip, remote=None, interval=0.01):
+    """Non-blocking context manager to measure connectivity outages.
+
+    It sends timestamped ICMP probes with high rate (100 per second by
+    default) and yields result, which is filled with outages intervals after
+    CM will be exited.
+
+    Note:
+        Probes interval less than 200ms requires superuser privileges. Remote
+        probes are sent with sudo. Local probes are sent with 200ms interval
+        if stepler isn't launched by root.
+
+    Example:
+        >>> with downtime_meter('10.109.8.2') as result:
+        ...     some_action()
+        >>> print(result.max_outage)
+        0.23
+
+    Args:
+        ip (str): ip address to send probes to
+        remote (object, optional): instance of
+            stepler.third_party.ssh.SshClient. If None - probes will be sent
+            from local machine
+        interval (float, optional): interval between probes, in seconds
+
+    Returns:
+        contextmanager: context manager which yields DowntimeResult instance
+    """
+    if remote is None:
+        return _local_meter(ip, interval)
+    return _remote_meter(ip, interval, remote)
@@ -0,0 +1,147 @@
+"""
+-----------------------
+Environment facts cache
+-----------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import os
+import time
+
+from stepler.third_party import process_mutex
+
+__all__ = [
+    'FactsCache',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+
+class FactsCache(object):
+    """Cache of environment facts.
+
+    Each fact is calculated once and is kept in memory. If ``path`` is
+    passed, facts are also stored to JSON file under ``key`` (cloud
+    identifier), so next test sessions against the same cloud reuse them
+    while they are younger than ``ttl``.
+
+    Example:
+        >>> facts = FactsCache('/tmp/facts.json', key='http://keystone:5000')
+        >>> facts.get('computes_count', lambda: len(get_hypervisors()))
+        2
+        >>> facts.invalidate()
+    """
+
+    def __init__(self, path=None, key=None, ttl=None, facts=None):
+        """Constructor.
+
+        Args:
+            path (str, optional): path to file to persist facts to
+            key (str, optional): cloud identifier to store facts under
+            ttl (int, optional): lifetime of persisted facts, in seconds.
+                If None - persisted facts never expire.
+            facts (dict, optional): already known facts values
+        """
+        self._path = path
+        self._key = str(key)
+        self._ttl = ttl
+        self._facts = {}
+        if path:
+            self._facts.update(self._load())
+        if facts:
+            self._facts.update(facts)
+
+    def _read_file(self):
+        if not os.path.exists(self._path):
+            return {}
+        try:
+            with open(self._path) as f:
+                return json.load(f)
+        except ValueError:
+            LOGGER.warning('Facts file {} is corrupted'.format(self._path))
+            return {}
+
+    def _write_file(self, data):
+        tmp_path = self._path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        os.rename(tmp_path, self._path)
+
+    def _update_file(self, update):
+        with process_mutex.Lock(self._path + '.lock'):
+            data = self._read_file()
+            update(data)
+            self._write_file(data)
+
+    def _load(self):
+        with process_mutex.Lock(self._path + '.lock'):
+            facts = self._read_file().get(self._key, {})
+        now = time.time()
+        return {name: value for name, (timestamp, value) in facts.items()
+                if self._ttl is None or now - timestamp < self._ttl}
+
+    def _save(self, name, value):
+        def update(data):
+            data.setdefault(self._key, {})[name] = [time.time(), value]
+
+        self._update_file(update)
+
+    def get(self, name, calculate):
+        """Get fact value.
+
+        Args:
+            name (str): fact name
+            calculate (function): function without arguments to calculate
+                fact value if it isn't cached
+
+        Returns:
+            object: fact value
+        """
+        if name not in self._facts:
+            value = calculate()
+            self._facts[name] = value
+            if self._path:
+                self._save(name, value)
+        return self._facts[name]
+
+    def get_cached(self):
+        """Get already calculated facts.
+
+        Returns:
+            dict: facts values, keyed by fact name
+        """
+        return dict(self._facts)
+
+    def invalidate(self, names=None):
+        """Drop cached facts, including persisted ones.
+
+        Args:
+            names (list, optional): names of facts to drop. If None - all
+                facts are dropped.
+        """
+        if names is None:
+            names = list(self._facts)
+            if self._path:
+                self._update_file(lambda data: data.pop(self._key, None))
+        elif self._path:
+            def update(data):
+                for name in names:
+                    data.get(self._key, {}).pop(name, None)
+
+            self._update_file(update)
+        for name in names:
+            self._facts.pop(name, None)
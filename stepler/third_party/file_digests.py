@@ -0,0 +1,184 @@
+"""
+-------------------
+Cached file digests
+-------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import logging
+import os
+
+from stepler.third_party import process_mutex
+
+__all__ = [
+    'calculate_digests',
+    'get_digests',
+    'update_digests',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+CHUNK_SIZE = 4 * 1024 * 1024
+DEFAULT_ALGORITHMS = ('md5', 'sha256')
+INDEX_NAME = '.digests.json'
+
+# in-memory copy of sidecar indexes: {file real path: index entry}
+_entries = {}
+
+
+def calculate_digests(file_path, algorithms=DEFAULT_ALGORITHMS,
+                      chunk_size=CHUNK_SIZE):
+    """Calculate several digests of file reading it once.
+
+    Args:
+        file_path (str): path to file
+        algorithms (list, optional): names of hashlib algorithms
+        chunk_size (int, optional): size of read buffer (in bytes)
+
+    Returns:
+        dict: hex digests, keyed by algorithm name
+    """
+    hashes = [hashlib.new(algorithm) for algorithm in algorithms]
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    with open(file_path, 'rb') as f:
+        while True:
+            size = f.readinto(buf)
+            if not size:
+                break
+            for hash_ in hashes:
+                hash_.update(view[:size])
+    return {algorithm: hash_.hexdigest()
+            for algorithm, hash_ in zip(algorithms, hashes)}
+
+
+def _get_signature(file_path):
+    stat = os.stat(file_path)
+    return {'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'inode': stat.st_ino}
+
+
+def _get_index_path(file_path):
+    return os.path.join(os.path.dirname(file_path), INDEX_NAME)
+
+
+def _read_index(index_path):
+    if not os.path.exists(index_path):
+        return {}
+    try:
+        with open(index_path) as f:
+            return json.load(f)
+    except ValueError:
+        LOGGER.warning('Digests index {} is corrupted'.format(index_path))
+        return {}
+
+
+def _load_entry(file_path, signature):
+    entry = _entries.get(file_path)
+    if not entry or entry['signature'] != signature:
+        # index may be updated by another process
+        index = _read_index(_get_index_path(file_path))
+        entry = index.get(os.path.basename(file_path))
+    if not entry or entry['signature'] != signature:
+        return None
+    _entries[file_path] = entry
+    return entry
+
+
+def _save_entry(file_path, entry):
+    _entries[file_path] = entry
+    index_path = _get_index_path(file_path)
+    folder = os.path.dirname(file_path)
+    try:
+        with process_mutex.Lock(index_path + '.lock'):
+            index = _read_index(index_path)
+            # drop entries of removed files
+            index = {name: value for name, value in index.items()
+                     if os.path.exists(os.path.join(folder, name))}
+            index[os.path.basename(file_path)] = entry
+            tmp_path = index_path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(index, f, indent=2, sort_keys=True)
+            os.rename(tmp_path, index_path)
+    except (IOError, OSError) as e:
+        LOGGER.debug("Can't save digests of {}: {}".format(file_path, e))
+
+
+def update_digests(file_path, digests):
+    """Store already known digests of file to its sidecar index.
+
+    Args:
+        file_path (str): path to file
+        digests (dict): hex digests, keyed by algorithm name
+    """
+    file_path = os.path.realpath(file_path)
+    signature = _get_signature(file_path)
+    entry = _load_entry(file_path, signature)
+    if entry:
+        digests = dict(entry['digests'], **digests)
+    _save_entry(file_path, {'signature': signature, 'digests': digests})
+
+
+def get_digests(file_path, algorithms=DEFAULT_ALGORITHMS, persist=False):
+    """Get digests of file, calculating missing ones.
+
+    If ``persist`` is set, digests are cached in sidecar index
+    (``.digests.json`` in file folder) with file size, modification time and
+    inode, so unchanged file is not read again by next calls and next test
+    sessions. It should be used for files of managed folder only (like images
+    store), because index is written near file. Otherwise digests are always
+    calculated, so file rewritten in place is never missed.
+
+    Example:
+        >>> get_digests('/tmp/images/cirros.img', persist=True)
+        {'md5': 'ee1eca47dc88f4879d8a229cc70a07c6', 'sha256': 'a8dd75...'}
+
+    Args:
+        file_path (str): path to file
+        algorithms (list, optional): names of hashlib algorithms
+        persist (bool, optional): flag whether to use sidecar index
+
+    Returns:
+        dict: hex digests, keyed by algorithm name
+    """
+    if not persist:
+        return calculate_digests(file_path, algorithms)
+
+    file_path = os.path.realpath(file_path)
+    signature = _get_signature(file_path)
+    entry = _load_entry(file_path, signature)
+    if not entry:
+        entry = {'signature': signature, 'digests': {}}
+
+    missing = [algorithm for algorithm in algorithms
+               if algorithm not in entry['digests']]
+    if missing:
+        # calculate default digests together to not read file again later
+        for algorithm in DEFAULT_ALGORITHMS:
+            if (algorithm not in entry['digests'] and
+                    algorithm not in missing):
+                missing.append(algorithm)
+        LOGGER.debug('Calculate {} of {}'.format(', '.join(missing),
+                                                 file_path))
+        digests = calculate_digests(file_path, missing)
+        entry = {'signature': signature,
+                 'digests': dict(entry['digests'], **digests)}
+        _save_entry(file_path, entry)
+
+    return {algorithm: entry['digests'][algorithm]
+            for algorithm in algorithms}
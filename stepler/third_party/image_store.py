@@ -0,0 +1,329 @@
+"""
+-----------------------------
+Content-addressed image store
+-----------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import binascii
+import hashlib
+import json
+import logging
+from multiprocessing.pool import ThreadPool
+import os
+import re
+import threading
+
+import requests
+
+from stepler.third_party import file_digests
+from stepler.third_party import process_mutex
+
+__all__ = [
+    'ImageStore',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def _get_server_checksum(headers):
+    """Get checksum of content from HTTP headers, if they contain it."""
+    content_md5 = headers.get('Content-MD5')
+    if content_md5:
+        try:
+            return 'md5:' + binascii.hexlify(
+                base64.b64decode(content_md5)).decode('ascii')
+        except (TypeError, ValueError, binascii.Error):
+            pass
+    # S3 like storages and some mirrors use content md5 as strong ETag
+    etag = (headers.get('ETag') or '').strip('"').lower()
+    if re.match(r'^[0-9a-f]{32}$', etag):
+        return 'md5:' + etag
+    return None
+
+
+def _split(size, parts):
+    """Split ``size`` bytes to ``parts`` segments ``[start, end, done]``."""
+    part_size = -(-size // parts)  # ceil division
+    return [[start, min(start + part_size, size), 0]
+            for start in range(0, size, part_size)]
+
+
+class ImageStore(object):
+    """Local store of downloaded images addressed by content.
+
+    Each downloaded file is stored once under its sha256 in ``objects``
+    folder and is hard-linked to file with requested name, so the same
+    content downloaded by different URLs takes disk space once.
+
+    Download is made to partial file with segments progress saved near it.
+    If download is interrupted, next download continues it if server
+    supports range requests and file is not changed on server. Large files
+    are downloaded with several range requests in parallel.
+
+    Example:
+        >>> store = ImageStore('~/images')
+        >>> store.get('http://example.com/cirros.img',
+        ...           checksum='md5:ee1eca47dc88f4879d8a229cc70a07c6')
+        '~/images/cirros.img'
+    """
+
+    def __init__(self, path, threads=4, min_parallel_size=64 * 1024 * 1024,
+                 timeout=60):
+        """Constructor.
+
+        Args:
+            path (str): store folder
+            threads (int, optional): max count of parallel range requests
+            min_parallel_size (int, optional): minimal file size (in bytes)
+                to download it with parallel range requests
+            timeout (int, optional): HTTP requests timeout
+        """
+        self._path = path
+        self._threads = threads
+        self._min_parallel_size = min_parallel_size
+        self._timeout = timeout
+        for folder in ('objects', 'urls', 'partial'):
+            folder = os.path.join(path, folder)
+            if not os.path.isdir(folder):
+                os.makedirs(folder)
+
+    def _get_url_key(self, url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _read_json(self, path):
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except ValueError:
+            return None
+
+    def _write_json(self, path, data):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.rename(tmp_path, path)
+
+    def _get_object_path(self, sha256):
+        return os.path.join(self._path, 'objects', sha256)
+
+    def _link(self, object_path, name):
+        file_path = os.path.join(self._path, name)
+        if os.path.exists(file_path):
+            if os.path.samefile(file_path, object_path):
+                return file_path
+            os.remove(file_path)
+        os.link(object_path, file_path)
+        return file_path
+
+    def _is_fresh(self, url, url_meta):
+        headers = {}
+        if url_meta.get('etag'):
+            headers['If-None-Match'] = url_meta['etag']
+        if url_meta.get('last_modified'):
+            headers['If-Modified-Since'] = url_meta['last_modified']
+        if not headers:
+            return True
+        try:
+            response = requests.head(url, headers=headers,
+                                     allow_redirects=True,
+                                     timeout=self._timeout)
+        except requests.RequestException as e:
+            LOGGER.warning("Can't check freshness of {}: {}".format(url, e))
+            return True
+
+        if response.status_code == 304:
+            return True
+        if response.status_code != 200:
+            LOGGER.warning("Can't get fresh image. HTTP status code is "
+                           "{0.status_code}".format(response))
+            return True
+        return (response.headers.get('ETag') == url_meta.get('etag') and
+                response.headers.get('Last-Modified') ==
+                url_meta.get('last_modified'))
+
+    def _download_segment(self, url, part_path, segment, progress):
+        start, end, done = segment
+        if start + done >= end:
+            return
+        headers = {'Range': 'bytes={}-{}'.format(start + done, end - 1)}
+        response = requests.get(url, headers=headers, stream=True,
+                                timeout=self._timeout)
+        try:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise requests.HTTPError(
+                    'Server ignored range request for {}'.format(url))
+            with open(part_path, 'r+b') as f:
+                f.seek(start + done)
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    f.write(chunk)
+                    segment[2] += len(chunk)
+                    progress()
+        finally:
+            response.close()
+        if start + segment[2] < end:
+            raise requests.RequestException(
+                'Connection is broken while downloading {}'.format(url))
+
+    def _download_whole(self, url, part_path):
+        response = requests.get(url, stream=True, timeout=self._timeout)
+        try:
+            response.raise_for_status()
+            size = 0
+            with open(part_path, 'wb') as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    f.write(chunk)
+                    size += len(chunk)
+        finally:
+            response.close()
+        expected_size = response.headers.get('Content-Length')
+        if expected_size is not None and size < int(expected_size):
+            raise requests.RequestException(
+                'Connection is broken while downloading {}'.format(url))
+
+    def _download(self, url, part_path):
+        """Download URL content to partial file and return its headers."""
+        response = requests.head(url, allow_redirects=True,
+                                 timeout=self._timeout)
+        response.raise_for_status()
+        # download from the same mirror if URL is redirected
+        url = response.url
+        meta = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'checksum': _get_server_checksum(response.headers),
+        }
+        size = response.headers.get('Content-Length')
+        size = int(size) if size is not None else None
+        accept_ranges = response.headers.get('Accept-Ranges') == 'bytes'
+
+        if not (accept_ranges and size):
+            LOGGER.info('Download {} with single request'.format(url))
+            self._download_whole(url, part_path)
+            return meta
+
+        progress_path = part_path + '.json'
+        progress = self._read_json(progress_path)
+        if (progress and os.path.exists(part_path) and
+                progress['meta'] == meta and progress['size'] == size):
+            LOGGER.info('Resume download of {}'.format(url))
+            segments = progress['segments']
+        else:
+            parts = self._threads if size >= self._min_parallel_size else 1
+            segments = _split(size, parts)
+            with open(part_path, 'wb') as f:
+                f.truncate(size)
+
+        lock = threading.Lock()
+
+        def _save_progress():
+            with lock:
+                self._write_json(progress_path, {'meta': meta,
+                                                 'size': size,
+                                                 'segments': segments})
+
+        _save_progress()
+        LOGGER.info('Download {} with {} range request(s)'.format(
+            url, len(segments)))
+        pool = ThreadPool(len(segments))
+        try:
+            pool.map(lambda segment: self._download_segment(
+                url, part_path, segment, _save_progress), segments)
+        finally:
+            pool.close()
+            _save_progress()
+
+        os.remove(progress_path)
+        return meta
+
+    def get(self, url, name=None, checksum=None):
+        """Get local path of file by URL, downloading it if required.
+
+        Args:
+            url (str): URL of file location
+            name (str, optional): file name. By default it's taken from URL.
+            checksum (str, optional): expected checksum in format
+                ``<algorithm>:<hexdigest>``, for ex: ``md5:ee1eca...``. If
+                it's not passed, md5 from ``Content-MD5`` or ETag header of
+                server is checked, if server provides it.
+
+        Returns:
+            str: file path
+
+        Raises:
+            ValueError: if checksum of downloaded file mismatches
+        """
+        if not name:
+            name = url.rsplit('/')[-1]
+            keepcharacters = (' ', '.', '_', '-')
+            name = "".join(c for c in name
+                           if c.isalnum() or c in keepcharacters).rstrip()
+
+        key = self._get_url_key(url)
+        url_meta_path = os.path.join(self._path, 'urls', key + '.json')
+        part_path = os.path.join(self._path, 'partial', key)
+
+        with process_mutex.Lock(part_path + '.lock'):
+            url_meta = self._read_json(url_meta_path)
+            cached_path = None
+            if url_meta:
+                cached_path = self._get_object_path(url_meta['sha256'])
+                if not os.path.exists(cached_path):
+                    cached_path = None
+            if cached_path and self._is_fresh(url, url_meta):
+                LOGGER.info("Image file is up to date")
+                return self._link(cached_path, name)
+
+            try:
+                meta = self._download(url, part_path)
+            except requests.RequestException as e:
+                if not cached_path:
+                    raise
+                LOGGER.warning("Can't get fresh image: {}".format(e))
+                return self._link(cached_path, name)
+
+            checksum = checksum or meta.get('checksum')
+            algorithms = ['md5', 'sha256']
+            if checksum:
+                algorithm, expected = checksum.split(':', 1)
+                if algorithm not in algorithms:
+                    algorithms.append(algorithm)
+            digests = file_digests.calculate_digests(part_path, algorithms)
+            if checksum and digests[algorithm] != expected.lower():
+                os.remove(part_path)
+                raise ValueError(
+                    '{} checksum of {} is {}, but expected {}'.format(
+                        algorithm, url, digests[algorithm], expected))
+
+            meta['sha256'] = digests['sha256']
+            object_path = self._get_object_path(meta['sha256'])
+            if os.path.exists(object_path):
+                LOGGER.info('Image content is already stored')
+                os.remove(part_path)
+            else:
+                os.rename(part_path, object_path)
+            meta['url'] = url
+            self._write_json(url_meta_path, meta)
+            LOGGER.info("Image downloaded")
+
+            file_path = self._link(object_path, name)
+            file_digests.update_digests(file_path, digests)
+            return file_path
@@ -0,0 +1,129 @@
+"""
+-----------------
+Remote log cursor
+-----------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import collections
+import re
+import zlib
+
+from six import moves
+
+__all__ = [
+    'LogCursor',
+    'get_cursor_cmd',
+    'parse_cursor',
+    'get_read_cmd',
+    'decode_output',
+    'count_matches',
+]
+
+
+class LogCursor(collections.namedtuple('LogCursor',
+                                       ['file_name', 'offset', 'inode'])):
+    """Position in remote log file.
+
+    Cursor remembers file size (byte offset) and inode at the moment of its
+    creation. Reading from cursor transfers only bytes appended after it.
+    If file was rotated (inode is changed) or truncated, whole current file
+    is read.
+    """
+
+    __slots__ = ()
+
+
+def get_cursor_cmd(file_name):
+    """Get bash command to print file size and inode.
+
+    Args:
+        file_name (str): path to remote file
+
+    Returns:
+        str: bash command
+    """
+    return "stat -c '%s %i' {}".format(moves.shlex_quote(file_name))
+
+
+def parse_cursor(file_name, stdout):
+    """Make cursor from output of ``get_cursor_cmd`` command.
+
+    Args:
+        file_name (str): path to remote file
+        stdout (str): command output
+
+    Returns:
+        LogCursor: cursor at the end of file
+    """
+    offset, inode = stdout.split()
+    return LogCursor(file_name, int(offset), int(inode))
+
+
+def get_read_cmd(cursor):
+    """Get bash command to read file content appended after cursor.
+
+    Content is gzipped and base64 encoded to reduce transfer size.
+
+    Args:
+        cursor (LogCursor): log cursor
+
+    Returns:
+        str: bash command
+    """
+    file_name = moves.shlex_quote(cursor.file_name)
+    return ("set -- $(stat -c '%s %i' {file_name}); "
+            "if [ \"$2\" = '{inode}' ] && [ \"$1\" -ge {offset} ]; "
+            "then tail -c +{start} {file_name}; "
+            "else cat {file_name}; fi | gzip -c | base64 -w0").format(
+                file_name=file_name,
+                inode=cursor.inode,
+                offset=cursor.offset,
+                start=cursor.offset + 1)
+
+
+def decode_output(stdout):
+    """Decode output of ``get_read_cmd`` command.
+
+    Args:
+        stdout (str): command output
+
+    Returns:
+        str: file content appended after cursor
+    """
+    data = base64.b64decode(stdout.strip())
+    # 16 + MAX_WBITS means data with gzip header
+    data = zlib.decompress(data, 16 + zlib.MAX_WBITS)
+    return data.decode('utf-8', 'replace')
+
+
+def count_matches(text, patterns):
+    """Count lines matching each pattern, like ``grep -c`` does.
+
+    Args:
+        text (str): text to search in
+        patterns (list): regular expressions (strings or compiled ones)
+
+    Returns:
+        dict: count of matched lines, keyed by pattern
+    """
+    regexps = [(pattern, re.compile(pattern)) for pattern in patterns]
+    counts = dict.fromkeys(patterns, 0)
+    for line in text.splitlines():
+        for pattern, regexp in regexps:
+            if regexp.search(line):
+                counts[pattern] += 1
+    return counts
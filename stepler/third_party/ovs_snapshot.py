@@ -0,0 +1,148 @@
+"""
+-------------
+OVS snapshots
+-------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import csv
+import re
+
+__all__ = [
+    'DUMP_FLOWS_CMD',
+    'Diff',
+    'Flow',
+    'LIST_PORTS_CMD',
+    'Port',
+    'diff',
+    'parse_flows',
+    'parse_ports',
+]
+
+DUMP_FLOWS_CMD = 'ovs-ofctl dump-flows {bridge}'
+LIST_PORTS_CMD = ('ovs-vsctl --format=csv --data=bare --no-headings '
+                  '--columns=name,tag list Port')
+
+# OpenFlow default priority, it's omitted in dump
+DEFAULT_PRIORITY = 32768
+
+# flow fields changing in time, they aren't part of flow identity
+_STAT_FIELDS = frozenset(['duration', 'n_packets', 'n_bytes', 'idle_age',
+                          'hard_age', 'idle_timeout', 'hard_timeout',
+                          'importance'])
+# flows with these fields expire, for ex. flows added by learn() action
+_TIMEOUT_FIELDS = frozenset(['idle_timeout', 'hard_timeout'])
+
+Flow = collections.namedtuple(
+    'Flow', ['table', 'priority', 'match', 'actions', 'cookie', 'transient'])
+"""OpenFlow flow without statistics.
+
+``transient`` is True for flow with timeout, which comes and goes with
+traffic.
+"""
+
+Port = collections.namedtuple('Port', ['name', 'tag'])
+"""OVS port with its VLAN tag (None for untagged port)."""
+
+Diff = collections.namedtuple('Diff', ['added', 'removed'])
+"""Difference of two snapshots as sets of records."""
+
+
+def _parse_flow(line):
+    head, _, actions = line.strip().partition(' actions=')
+    table, priority, cookie = 0, DEFAULT_PRIORITY, None
+    transient = False
+    match = []
+    for token in re.split(r',\s*', head):
+        key, _, value = token.partition('=')
+        if key in _TIMEOUT_FIELDS and value not in ('', '0'):
+            transient = True
+        if key in _STAT_FIELDS:
+            continue
+        if key == 'cookie':
+            cookie = value
+        elif key == 'table':
+            table = int(value)
+        elif key == 'priority':
+            priority = int(value)
+        elif token:
+            match.append(token)
+    return Flow(table, priority, ','.join(match), actions, cookie, transient)
+
+
+def parse_flows(text):
+    """Parse output of ``ovs-ofctl dump-flows``.
+
+    Example:
+        >>> parse_flows(' cookie=0x9d4, duration=7.2s, table=0, n_packets=3,'
+        ...             ' n_bytes=180, idle_age=1, priority=10,arp,in_port=1'
+        ...             ' actions=resubmit(,24)')
+        frozenset([Flow(table=0, priority=10, match='arp,in_port=1',
+                        actions='resubmit(,24)', cookie='0x9d4',
+                        transient=False)])
+
+    Args:
+        text (str): command output
+
+    Returns:
+        frozenset: Flow(s)
+    """
+    return frozenset(_parse_flow(line) for line in text.splitlines()
+                     if ' actions=' in line)
+
+
+def parse_ports(text):
+    """Parse output of :const:`LIST_PORTS_CMD`.
+
+    Args:
+        text (str): command output
+
+    Returns:
+        frozenset: Port(s)
+    """
+    ports = set()
+    for row in csv.reader(text.splitlines()):
+        if not row:
+            continue
+        name, tag = row[0], row[1] if len(row) > 1 else ''
+        ports.add(Port(name, int(tag) if tag.strip() else None))
+    return frozenset(ports)
+
+
+def diff(old, new, ignore_fields=()):
+    """Get difference of two snapshots.
+
+    Example:
+        >>> diff(flows_before_restart, flows_after_restart,
+        ...      ignore_fields=('cookie',))
+        Diff(added=frozenset([]), removed=frozenset([Flow(...)]))
+
+    Args:
+        old (iterable): old records (Flow(s) or Port(s))
+        new (iterable): new records
+        ignore_fields (tuple, optional): names of records fields to not
+            compare, for ex. ``cookie`` which is changed after neutron OVS
+            agent restart
+
+    Returns:
+        Diff: added and removed records
+    """
+    if ignore_fields:
+        blank = dict.fromkeys(ignore_fields)
+        old = (record._replace(**blank) for record in old)
+        new = (record._replace(**blank) for record in new)
+    old, new = frozenset(old), frozenset(new)
+    return Diff(added=new - old, removed=old - new)
@@ -0,0 +1,180 @@
+"""
+----------------------
+Paginated list helpers
+----------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+
+__all__ = [
+    'Record',
+    'filter_by_name_prefix',
+    'get_record_class',
+    'iter_pages',
+    'project',
+    'take',
+]
+
+# record classes, keyed by fields tuple
+_record_classes = {}
+
+
+def _get_field(obj, field):
+    if isinstance(obj, dict):
+        return obj.get(field)
+    return getattr(obj, field, None)
+
+
+def _get_id(obj):
+    if isinstance(obj, dict):
+        return obj['id']
+    return obj.id
+
+
+def iter_pages(list_method, page_size, get_marker=_get_id, **kwargs):
+    """Iterate objects of API list call requesting them page by page.
+
+    Next page is requested only when previous one is consumed, so caller
+    can stop iteration early without fetching all objects. Iteration ends on
+    empty page only, because server may return less objects than requested
+    (for ex. nova and cinder cap page size with ``osapi_max_limit``).
+
+    Example:
+        >>> servers = iter_pages(nova_client.servers.list, 100,
+        ...                      search_opts={'name': '^stepler'})
+        >>> next(servers)
+        <Server: stepler-server-1>
+
+    Args:
+        list_method (function): API list call with ``marker`` and ``limit``
+            arguments
+        page_size (int): count of objects per request
+        get_marker (function, optional): function to get marker from last
+            object of page. By default object id is used.
+        **kwargs: additional arguments of ``list_method``
+
+    Yields:
+        object: listed object
+    """
+    marker = None
+    while True:
+        page = list(list_method(marker=marker, limit=page_size, **kwargs))
+        if not page:
+            return
+        for obj in page:
+            yield obj
+        marker = get_marker(page[-1])
+
+
+def filter_by_name_prefix(objs, name_prefix):
+    """Filter objects by name prefix lazily.
+
+    Args:
+        objs (iterable): objects with ``name`` attribute or key
+        name_prefix (str|None): name prefix. If None - all objects pass.
+
+    Yields:
+        object: object with name started with prefix
+    """
+    for obj in objs:
+        if name_prefix:
+            if not (_get_field(obj, 'name') or '').startswith(name_prefix):
+                continue
+        yield obj
+
+
+def take(objs, limit=None):
+    """Take first objects from iterable.
+
+    Args:
+        objs (iterable): objects
+        limit (int|None): max count of objects to take. If None - all
+            objects are taken.
+
+    Returns:
+        list: objects
+    """
+    return list(itertools.islice(objs, limit))
+
+
+class Record(object):
+    """Lightweight projection of API object with required fields only.
+
+    Unlike client resources it keeps neither manager nor raw response data,
+    so it's cheap to keep many records in memory. Use
+    :func:`get_record_class` to get record class with required fields.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, obj):
+        """Constructor.
+
+        Args:
+            obj (object): API object (resource or dict) to project
+        """
+        self.update(obj)
+
+    def update(self, obj):
+        """Update record fields from API object.
+
+        Args:
+            obj (object): API object (resource or dict)
+        """
+        for field in self.__slots__:
+            setattr(self, field, _get_field(obj, field))
+
+    def __repr__(self):
+        return '<Record {}>'.format(', '.join(
+            '{}={!r}'.format(field, getattr(self, field))
+            for field in self.__slots__))
+
+
+def get_record_class(fields):
+    """Get record class with ``__slots__`` for fields.
+
+    Args:
+        fields (tuple): names of fields
+
+    Returns:
+        type: subclass of :class:`Record`
+    """
+    fields = tuple(fields)
+    if fields not in _record_classes:
+        _record_classes[fields] = type('Record', (Record,),
+                                       {'__slots__': fields})
+    return _record_classes[fields]
+
+
+def project(objs, fields):
+    """Project API objects to records with required fields lazily.
+
+    Example:
+        >>> records = list(project(nova_client.servers.list(),
+        ...                        ('id', 'name', 'status')))
+        >>> records[0]
+        <Record id=u'3f2a...', name=u'stepler-server', status=u'ACTIVE'>
+
+    Args:
+        objs (iterable): API objects (resources or dicts)
+        fields (tuple): names of fields to keep
+
+    Yields:
+        Record: projected object
+    """
+    record_class = get_record_class(fields)
+    for obj in objs:
+        yield record_class(obj)
@@ -0,0 +1,183 @@
+"""
+--------------
+Resource cache
+--------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import json
+import logging
+import threading
+
+__all__ = [
+    'ResourceCache',
+    'is_dirty',
+    'mark_dirty',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+# ids of resources modified after creation
+_dirty_ids = set()
+_dirty_lock = threading.Lock()
+
+
+def _get_ids(resource):
+    if isinstance(resource, (tuple, list)):
+        return [id_ for item in resource for id_ in _get_ids(item)]
+    if isinstance(resource, dict):
+        return [resource['id']]
+    return [resource.id]
+
+
+def mark_dirty(resource):
+    """Mark resource as modified, so it isn't reused by next tests.
+
+    It should be called by steps which change resource.
+
+    Args:
+        resource (object): resource (object or dict with ``id``)
+    """
+    with _dirty_lock:
+        _dirty_ids.update(_get_ids(resource))
+
+
+def is_dirty(resource):
+    """Check whether resource is modified after creation.
+
+    Args:
+        resource (object): resource (object or dict with ``id``) or tuple
+            of resources. Tuple is dirty if any its resource is dirty.
+
+    Returns:
+        bool: whether resource is modified
+    """
+    with _dirty_lock:
+        return any(id_ in _dirty_ids for id_ in _get_ids(resource))
+
+
+def _mark_clean(resource):
+    with _dirty_lock:
+        _dirty_ids.difference_update(_get_ids(resource))
+
+
+class _Entry(object):
+
+    def __init__(self, resource, delete):
+        self.resource = resource
+        self.delete = delete
+        self.refs = 0
+
+
+class ResourceCache(object):
+    """Cache of resources reused by tests, keyed by resource spec.
+
+    Resource is created once for spec and is given to all tests requesting
+    the same spec. Cache counts references to resources: resource modified
+    by test (see :func:`mark_dirty`) is deleted when last test using it is
+    finished, and next test gets new one. Other resources are deleted when
+    cache is cleared at the end of session.
+
+    Resource may be a tuple of resources, for ex. network, subnet and router
+    linked together. Such resource is dirty if any its part is dirty.
+    Resources are deleted in reverse order of creation, so linking resource
+    is deleted before resources it links.
+
+    Example:
+        >>> cache = ResourceCache()
+        >>> with cache.use('flavor', {'ram': 1024, 'vcpus': 1, 'disk': 5},
+        ...                create=create_flavor,
+        ...                delete=delete_flavor) as flavor:
+        ...     pass
+        >>> cache.clear()
+    """
+
+    def __init__(self):
+        """Constructor."""
+        # actual entries, keyed by spec
+        self._entries = {}
+        # all not deleted entries in order of creation
+        self._created = []
+        self._lock = threading.RLock()
+
+    def _get_key(self, kind, spec):
+        return kind, json.dumps(spec, sort_keys=True)
+
+    def _delete(self, entry):
+        LOGGER.debug('Delete cached resource {!r}'.format(entry.resource))
+        self._created.remove(entry)
+        for key, actual_entry in list(self._entries.items()):
+            if actual_entry is entry:
+                del self._entries[key]
+        entry.delete(entry.resource)
+
+    def _delete_dirty(self):
+        for entry in reversed(self._created[:]):
+            if not entry.refs and is_dirty(entry.resource):
+                self._delete(entry)
+
+    def _acquire(self, key, create, delete):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and is_dirty(entry.resource):
+                del self._entries[key]
+                self._delete_dirty()
+                entry = None
+
+            if entry is None:
+                LOGGER.debug('Create cached resource {!r}'.format(key))
+                resource = create()
+                # resource may be changed by create function itself
+                _mark_clean(resource)
+                entry = _Entry(resource, delete)
+                self._entries[key] = entry
+                self._created.append(entry)
+
+            entry.refs += 1
+            return entry
+
+    def _release(self, entry):
+        with self._lock:
+            entry.refs -= 1
+            if not entry.refs and is_dirty(entry.resource):
+                self._delete_dirty()
+
+    @contextlib.contextmanager
+    def use(self, kind, spec, create, delete):
+        """Context manager to get cached resource or create it.
+
+        Args:
+            kind (str): kind of resource, for ex. ``flavor``
+            spec (object): JSON-serializable spec of resource. Resources of
+                the same kind with equal specs are interchangeable.
+            create (function): function without arguments to create resource
+            delete (function): function to delete resource
+
+        Yields:
+            object: resource
+        """
+        key = self._get_key(kind, spec)
+        entry = self._acquire(key, create, delete)
+        try:
+            yield entry.resource
+        finally:
+            self._release(entry)
+
+    def clear(self):
+        """Delete all cached resources."""
+        with self._lock:
+            for entry in reversed(self._created[:]):
+                self._delete(entry)
@@ -0,0 +1,103 @@
+"""
+-------------
+Resource pool
+-------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+
+__all__ = [
+    'ResourcePool',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+
+class ResourcePool(object):
+    """Thread-safe pool of resources reused across tests.
+
+    Resources are created in bulk when pool has not enough free ones, are
+    reset when they are released and are deleted when pool is cleared.
+
+    Example:
+        >>> pool = ResourcePool(create_floating_ips, delete_floating_ips,
+        ...                     reset=detach_floating_ips)
+        >>> floating_ips = pool.acquire(3)
+        >>> pool.release(floating_ips)
+        >>> pool.acquire(2)  # doesn't create new floating IPs
+        >>> pool.clear()
+    """
+
+    def __init__(self, create, delete, reset=None):
+        """Constructor.
+
+        Args:
+            create (function): function to create resources, it takes count
+                of resources and returns list of them
+            delete (function): function to delete list of resources
+            reset (function, optional): function to reset list of released
+                resources before their reuse
+        """
+        self._create = create
+        self._delete = delete
+        self._reset = reset
+        self._free = []
+        self._all = []
+        self._lock = threading.Lock()
+
+    def acquire(self, count):
+        """Take resources from pool, creating missing ones.
+
+        Args:
+            count (int): count of resources
+
+        Returns:
+            list: resources
+        """
+        with self._lock:
+            resources = self._free[:count]
+            del self._free[:count]
+
+        missing = count - len(resources)
+        if missing:
+            LOGGER.debug('Create {} resource(s) for pool'.format(missing))
+            created = self._create(missing)
+            with self._lock:
+                self._all.extend(created)
+            resources.extend(created)
+        return resources
+
+    def release(self, resources):
+        """Return resources to pool.
+
+        Args:
+            resources (list): resources acquired from pool
+        """
+        resources = list(resources)
+        if resources and self._reset:
+            self._reset(resources)
+        with self._lock:
+            self._free.extend(resources)
+
+    def clear(self):
+        """Delete all resources created by pool."""
+        with self._lock:
+            resources = self._all[:]
+            del self._all[:]
+            del self._free[:]
+        if resources:
+            self._delete(resources)
@@ -0,0 +1,130 @@
+"""
+-----------------------------------
+Resources shared among test workers
+-----------------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import json
+import logging
+import os
+
+from stepler.third_party import process_mutex
+
+__all__ = [
+    'SharedResources',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SharedResources(object):
+    """Registry of resources shared among pytest-xdist workers.
+
+    Registry is a JSON file guarded with process mutex. First worker creates
+    resource and stores its serialized data (ids) to registry, other workers
+    attach to resource by stored data. Registry counts references to
+    resource, and last detached worker deletes it.
+
+    Example:
+        >>> resources = SharedResources('/tmp/shared.json')
+        >>> with resources.share('cirros', create=create_image,
+        ...                      delete=delete_image,
+        ...                      dump=lambda image: image.id,
+        ...                      load=find_image) as image:
+        ...     pass
+    """
+
+    def __init__(self, path):
+        """Constructor.
+
+        Args:
+            path (str): path to registry file
+        """
+        self._path = path
+        self._lock_path = path + '.lock'
+
+    def _read(self):
+        if not os.path.exists(self._path):
+            return {}
+        with open(self._path) as f:
+            return json.load(f)
+
+    def _write(self, registry):
+        tmp_path = self._path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(registry, f, indent=2, sort_keys=True)
+        os.rename(tmp_path, self._path)
+
+    def _acquire(self, name, create, dump, load):
+        with process_mutex.Lock(self._lock_path):
+            registry = self._read()
+            entry = registry.get(name)
+
+            if entry:
+                resource = load(entry['data'])
+                if resource is not None:
+                    LOGGER.debug('Attach to shared resource {!r}'.format(name))
+                    entry['refs'] += 1
+                    self._write(registry)
+                    return resource
+                LOGGER.debug('Shared resource {!r} is lost'.format(name))
+
+            LOGGER.debug('Create shared resource {!r}'.format(name))
+            resource = create()
+            registry[name] = {'data': dump(resource), 'refs': 1}
+            self._write(registry)
+            return resource
+
+    def _release(self, name, resource, delete):
+        with process_mutex.Lock(self._lock_path):
+            registry = self._read()
+            entry = registry.get(name)
+
+            if entry:
+                entry['refs'] -= 1
+                if entry['refs'] > 0:
+                    LOGGER.debug(
+                        'Detach from shared resource {!r}'.format(name))
+                    self._write(registry)
+                    return
+                del registry[name]
+                self._write(registry)
+
+            LOGGER.debug('Delete shared resource {!r}'.format(name))
+            delete(resource)
+
+    @contextlib.contextmanager
+    def share(self, name, create, delete, dump, load):
+        """Context manager to create or attach to shared resource.
+
+        Args:
+            name (str): unique name of resource in registry
+            create (function): function without arguments to create resource
+            delete (function): function to delete resource
+            dump (function): function to get JSON-serializable data of
+                resource, which is enough to find it
+            load (function): function to find resource by its data. It should
+                return None if resource isn't found.
+
+        Yields:
+            object: shared resource
+        """
+        resource = self._acquire(name, create, dump, load)
+        try:
+            yield resource
+        finally:
+            self._release(name, resource, delete)
@@ -27,7 +27,8 @@ from six import moves
 
 
 __all__ = [
-    'SshClient'
+    'SshClient',
+    'generate_key_pair',
 ]
 
 LOGGER = logging.getLogger(__name__)
@@ -80,6 +81,22 @@ class CommandResult(object):
                             'is not empty:\n{0.stderr}'.format(self))
 
 
+def generate_key_pair(bits=2048):
+    """Generate RSA key pair locally.
+
+    Args:
+        bits (int, optional): key length
+
+    Returns:
+        tuple: private key in PEM format and public key in OpenSSH format
+    """
+    key = paramiko.RSAKey.generate(bits)
+    private_key = moves.StringIO()
+    key.write_private_key(private_key)
+    public_key = '{} {}'.format(key.get_name(), key.get_base64())
+    return private_key.getvalue(), public_key
+
+
 class SshClient(object):
     """SSH client."""
 
@@ -135,6 +152,12 @@ class SshClient(object):
         """Close ssh connection."""
         self._ssh.close()
 
+    @property
+    def is_connected(self):
+        """Whether ssh connection is established and active."""
+        transport = self._ssh.get_transport()
+        return transport is not None and transport.is_active()
+
     def __enter__(self):
         self.connect()
         return self
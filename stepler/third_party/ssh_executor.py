@@ -0,0 +1,211 @@
+"""
+-----------------------------
+Persistent SSH nodes executor
+-----------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from multiprocessing.pool import ThreadPool
+import re
+import threading
+
+from os_faults.ansible import executor
+
+from stepler.third_party import ssh
+
+__all__ = [
+    'SshExecutor',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+_proxy_cmd_re = re.compile(r'ProxyCommand="(?P<cmd>[^"]+)"')
+
+
+class SshExecutor(object):
+    """Executor of shell commands on cloud nodes via persistent SSH sessions.
+
+    Ansible play costs seconds even for trivial command, because of process
+    fork, inventory loading and module uploading. This executor keeps one SSH
+    connection per node and runs commands with milliseconds overhead.
+    Connection parameters are taken from os-faults ansible runner, so nodes
+    are reachable the same way as with ansible (including jump host).
+
+    Results have the same shape as results of ``NodeCollection.run_task``
+    with ``shell`` task.
+
+    Example:
+        >>> executor = SshExecutor(os_faults_client)
+        >>> executor.execute(nodes, 'hostname')
+        [AnsibleExecutionRecord(host='10.109.2.4', status='OK', ...)]
+        >>> executor.close()
+    """
+
+    def __init__(self, cloud_management, timeout=None):
+        """Constructor.
+
+        Args:
+            cloud_management (object): os-faults cloud management (client)
+            timeout (int, optional): SSH connection timeout
+        """
+        self._runner = cloud_management.cloud_executor
+        self._timeout = timeout
+        self._clients = {}
+        self._become = {}
+        # guards dicts of clients and host locks
+        self._lock = threading.Lock()
+        # connection to host is made under its own lock, so nodes are
+        # connected in parallel
+        self._host_locks = {}
+
+    def _get_connection_params(self, host):
+        options = self._runner.options
+        params = {
+            'username': options.remote_user,
+            'password': getattr(self._runner, 'passwords', {}).get(
+                'conn_pass'),
+            'private_key_file': options.private_key_file,
+            'ssh_common_args': options.ssh_common_args,
+            'become': options.become,
+        }
+        # per-node credentials are supported by newer os-faults only
+        build_host_vars = getattr(self._runner, '_build_host_vars',
+                                  lambda _: {})
+        host_vars = build_host_vars(host)
+        for key, var_name in (('username', 'ansible_user'),
+                              ('password', 'ansible_ssh_pass'),
+                              ('private_key_file',
+                               'ansible_ssh_private_key_file'),
+                              ('ssh_common_args', 'ansible_ssh_common_args'),
+                              ('become', 'ansible_become')):
+            if host_vars.get(var_name) is not None:
+                params[key] = host_vars[var_name]
+        return params
+
+    def _connect(self, host):
+        params = self._get_connection_params(host)
+        pkey = None
+        if params['private_key_file']:
+            with open(params['private_key_file']) as f:
+                pkey = f.read()
+        proxy_cmd = None
+        match = _proxy_cmd_re.search(params['ssh_common_args'] or '')
+        if match:
+            proxy_cmd = match.group('cmd').replace(
+                '%h', host.ip).replace('%p', '22')
+        client = ssh.SshClient(host.ip,
+                               username=params['username'],
+                               password=params['password'],
+                               pkey=pkey,
+                               timeout=self._timeout,
+                               proxy_cmd=proxy_cmd)
+        client.connect()
+        self._become[host.ip] = bool(params['become'])
+        return client
+
+    def _get_client(self, host):
+        with self._lock:
+            host_lock = self._host_locks.setdefault(host.ip,
+                                                    threading.Lock())
+        with host_lock:
+            with self._lock:
+                client = self._clients.get(host.ip)
+            if client is None or not client.is_connected:
+                if client is not None:
+                    client.close()
+                client = self._connect(host)
+                with self._lock:
+                    self._clients[host.ip] = client
+            return client
+
+    def _execute_on_host(self, host, cmd):
+        try:
+            client = self._get_client(host)
+            if self._become[host.ip]:
+                with client.sudo():
+                    result = client.execute(cmd)
+            else:
+                result = client.execute(cmd)
+        except Exception as e:
+            LOGGER.debug('Node {} is unreachable: {}'.format(host.ip, e))
+            with self._lock:
+                self._clients.pop(host.ip, None)
+            return executor.AnsibleExecutionRecord(
+                host=host.ip, status=executor.STATUS_UNREACHABLE,
+                task='shell', payload={'msg': str(e), 'unreachable': True})
+
+        stdout = result.stdout_bytes.decode('utf-8').rstrip('\n')
+        stderr = result.stderr_bytes.decode('utf-8').rstrip('\n')
+        payload = {
+            'cmd': cmd,
+            'rc': result.exit_code,
+            'stdout': stdout,
+            'stdout_lines': stdout.splitlines(),
+            'stderr': stderr,
+            'stderr_lines': stderr.splitlines(),
+        }
+        if result.is_ok:
+            status = executor.STATUS_OK
+        else:
+            status = executor.STATUS_FAILED
+        return executor.AnsibleExecutionRecord(
+            host=host.ip, status=status, task='shell', payload=payload)
+
+    def execute(self, nodes, cmd, raise_on_error=True):
+        """Execute shell command on nodes in parallel.
+
+        Args:
+            nodes (NodeCollection): nodes to execute command on them
+            cmd (str): bash command to execute
+            raise_on_error (bool): flag whether to raise exception if command
+                failed on any node
+
+        Returns:
+            list: AnsibleExecutionRecord(s)
+
+        Raises:
+            AnsibleExecutionException: if command is failed on any node and
+                raise_on_error is True
+        """
+        hosts = nodes.hosts
+        pool = ThreadPool(len(hosts) or 1)
+        try:
+            records = pool.map(lambda host: self._execute_on_host(host, cmd),
+                               hosts)
+        finally:
+            pool.close()
+
+        if raise_on_error:
+            errors = [r for r in records
+                      if r.status in (executor.STATUS_FAILED,
+                                      executor.STATUS_UNREACHABLE)]
+            if errors:
+                only_unreachable = all(
+                    r.status == executor.STATUS_UNREACHABLE for r in errors)
+                exception_class = (executor.AnsibleExecutionUnreachable
+                                   if only_unreachable
+                                   else executor.AnsibleExecutionException)
+                raise exception_class('Execution failed: {}'.format(
+                    ', '.join('(host: {}, status: {})'.format(r.host, r.status)
+                              for r in errors)))
+        return records
+
+    def close(self):
+        """Close all SSH connections."""
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
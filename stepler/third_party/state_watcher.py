@@ -0,0 +1,165 @@
+"""
+-------------
+State watcher
+-------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import logging
+import threading
+import time
+
+__all__ = [
+    'StateChange',
+    'StateWatcher',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+StateChange = collections.namedtuple(
+    'StateChange', ['timestamp', 'key', 'item', 'old', 'new'])
+"""Change of watched item value. ``old`` is None for appeared item and
+``new`` is None for disappeared one."""
+
+
+class StateWatcher(object):
+    """Background poller of states shared among subscribed checks.
+
+    Each subscription is a key and a function returning state as dict
+    ``{item: value}``. Watcher thread calls all subscribed functions once
+    per ``interval`` and records timeline of changed items, so several
+    checks of the same state don't repeat API requests and failover
+    moments are known with ``interval`` precision.
+
+    Example:
+        >>> watcher = StateWatcher(interval=1)
+        >>> watcher.subscribe('agents', get_agents_alive)
+        >>> watcher.get_state('agents')
+        {'agent-1': True, 'agent-2': True}
+        >>> # restart agent
+        >>> watcher.get_timeline('agents')
+        [StateChange(timestamp=..., key='agents', item='agent-1', old=True,
+                     new=False), ...]
+        >>> watcher.stop()
+    """
+
+    def __init__(self, interval):
+        """Constructor.
+
+        Args:
+            interval (float): polling interval, in seconds
+        """
+        self._interval = interval
+        self._polls = {}
+        self._states = {}
+        self._timeline = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def _update(self, key, state):
+        now = time.time()
+        with self._lock:
+            if key not in self._polls:
+                return
+            old_state = self._states.get(key)
+            self._states[key] = state
+            if old_state is None:
+                return
+            for item in set(old_state) | set(state):
+                old, new = old_state.get(item), state.get(item)
+                if old != new:
+                    change = StateChange(now, key, item, old, new)
+                    LOGGER.debug('State change: {}'.format(change))
+                    self._timeline.append(change)
+
+    def _poll(self, key, poll):
+        try:
+            state = poll()
+        except Exception as e:
+            LOGGER.debug("Can't poll state {!r}: {}".format(key, e))
+            return
+        self._update(key, state)
+
+    def _run(self):
+        while not self._stop_event.wait(self._interval):
+            with self._lock:
+                polls = list(self._polls.items())
+            for key, poll in polls:
+                self._poll(key, poll)
+
+    def subscribe(self, key, poll):
+        """Subscribe to state, if it isn't subscribed yet.
+
+        Initial state is polled immediately.
+
+        Args:
+            key (hashable): state key
+            poll (function): function without arguments to get state as
+                dict ``{item: value}``
+        """
+        with self._lock:
+            if key in self._polls:
+                return
+            self._polls[key] = poll
+        self._poll(key, poll)
+
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def unsubscribe_all(self):
+        """Unsubscribe from all states and drop their timeline."""
+        with self._lock:
+            self._polls.clear()
+            self._states.clear()
+            del self._timeline[:]
+
+    def get_state(self, key):
+        """Get last polled state.
+
+        Args:
+            key (hashable): state key
+
+        Returns:
+            dict|None: state or None if it's not polled successfully yet
+        """
+        with self._lock:
+            state = self._states.get(key)
+            return dict(state) if state is not None else None
+
+    def get_timeline(self, key=None):
+        """Get recorded state changes.
+
+        Args:
+            key (hashable, optional): state key. If None - changes of all
+                states are returned.
+
+        Returns:
+            list: StateChange(s) in order of detection
+        """
+        with self._lock:
+            return [change for change in self._timeline
+                    if key is None or change.key == key]
+
+    def stop(self):
+        """Stop watcher thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
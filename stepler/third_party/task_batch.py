@@ -0,0 +1,173 @@
+"""
+---------------------
+Ansible tasks batcher
+---------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import logging
+import uuid
+
+from os_faults.ansible import executor
+
+__all__ = [
+    'TaskBatch',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+ERROR_STATUSES = (executor.STATUS_FAILED, executor.STATUS_UNREACHABLE)
+
+
+class TaskBatch(object):
+    """Collector of ansible tasks to run them on nodes with single play.
+
+    Each ``nodes.run_task`` is a separate ansible play with its own
+    connections setup. Batch submits all collected tasks as one multi-task
+    play and splits its result to records per task. By default failed task
+    doesn't stop next ones. Task added with ``ignore_errors=False`` stops
+    execution of next tasks on nodes where it failed.
+
+    If cloud management driver doesn't provide ansible runner, tasks are
+    executed one by one with ``nodes.run_task``.
+
+    Example:
+        >>> batch = TaskBatch(nodes)
+        >>> batch.add_shell('cp /etc/foo.conf /etc/foo.conf.bak',
+        ...                 ignore_errors=False)
+        >>> batch.add({'ini_file': {'dest': '/etc/foo.conf', ...}})
+        >>> copy_result, patch_result = batch.run()
+    """
+
+    def __init__(self, nodes):
+        """Constructor.
+
+        Args:
+            nodes (NodeCollection): nodes to execute tasks on them
+        """
+        self._nodes = nodes
+        self._tasks = []
+        self._ignore_errors = []
+        self._prefix = 'stepler-batch-{}'.format(uuid.uuid4())
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def add(self, task, ignore_errors=True):
+        """Add ansible task to batch.
+
+        Args:
+            task (dict): ansible task, for ex: ``{'shell': 'ls /'}``
+            ignore_errors (bool): flag whether to execute next tasks if this
+                one is failed
+
+        Returns:
+            int: index of task result in result of ``run``
+        """
+        self._tasks.append(task)
+        self._ignore_errors.append(ignore_errors)
+        return len(self._tasks) - 1
+
+    def add_shell(self, cmd, ignore_errors=True):
+        """Add shell command to batch.
+
+        Args:
+            cmd (str): bash command to execute
+            ignore_errors (bool): flag whether to execute next tasks if this
+                command is failed
+
+        Returns:
+            int: index of command result in result of ``run``
+        """
+        return self.add({'shell': cmd}, ignore_errors=ignore_errors)
+
+    def _get_task_name(self, index):
+        return '{}-{}'.format(self._prefix, index)
+
+    def _build_play(self, runner):
+        tasks = []
+        for index, task in enumerate(self._tasks):
+            task = copy.deepcopy(task)
+            task['name'] = self._get_task_name(index)
+            task['ignore_errors'] = self._ignore_errors[index]
+            tasks.append(task)
+        hosts = self._nodes.hosts
+        play = {'hosts': [host.ip for host in hosts], 'tasks': tasks}
+        serial = getattr(runner, 'serial', None)
+        if serial:
+            play['serial'] = serial
+        build_host_vars = getattr(runner, '_build_host_vars', lambda _: {})
+        host_vars = {host.ip: build_host_vars(host) for host in hosts}
+        return play, host_vars
+
+    def _run_play(self, runner):
+        play, host_vars = self._build_play(runner)
+        LOGGER.debug('Run {} task(s) with single play on nodes: {}'.format(
+            len(self._tasks), self._nodes))
+        records = runner.run_playbook([play], host_vars)
+
+        results = [[] for _ in self._tasks]
+        names = {self._get_task_name(i): i for i in range(len(self._tasks))}
+        for record in records:
+            index = names.get(record.task)
+            if index is not None:
+                results[index].append(record)
+        return results
+
+    def _run_tasks(self):
+        results = [[] for _ in self._tasks]
+        for index, task in enumerate(self._tasks):
+            results[index] = self._nodes.run_task(task, raise_on_error=False)
+            if not self._ignore_errors[index] and any(
+                    record.status in ERROR_STATUSES
+                    for record in results[index]):
+                break
+        return results
+
+    def run(self, raise_on_error=True):
+        """Run collected tasks on nodes.
+
+        Args:
+            raise_on_error (bool): flag whether to raise exception if any task
+                failed on any node
+
+        Returns:
+            list: lists of AnsibleExecutionRecord(s), one list per task in
+                order of adding
+
+        Raises:
+            AnsibleExecutionException: if any task is failed and
+                raise_on_error is True
+        """
+        if not self._tasks:
+            return []
+
+        runner = getattr(self._nodes.cloud_management, 'cloud_executor', None)
+        if runner is not None and hasattr(runner, 'run_playbook'):
+            results = self._run_play(runner)
+        else:
+            results = self._run_tasks()
+
+        if raise_on_error:
+            errors = [record for task_records in results
+                      for record in task_records
+                      if record.status in ERROR_STATUSES]
+            if errors:
+                raise executor.AnsibleExecutionException(
+                    'Execution failed: {}'.format(', '.join(
+                        '(host: {}, status: {})'.format(r.host, r.status)
+                        for r in errors)))
+        return results
@@ -0,0 +1,126 @@
+"""
+--------------------
+Cloud topology cache
+--------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+__all__ = [
+    'Topology',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Topology(object):
+    """Cache of cloud nodes and services placement.
+
+    Each ``client.get_nodes()`` and ``service.get_nodes()`` call of os-faults
+    runs discovery on cloud nodes. Topology remembers discovered nodes and
+    FQDNs of nodes with running service until it's invalidated. It must be
+    invalidated after actions which change services placement, like service
+    stop or node reset.
+
+    Example:
+        >>> topology = Topology(os_faults_client)
+        >>> topology.get_service_fqdns('nova-api')
+        frozenset(['node-1.test.domain.local'])
+        >>> topology.invalidate(service_names=['nova-api'])
+    """
+
+    def __init__(self, client):
+        """Constructor.
+
+        Args:
+            client (object): os-faults client
+        """
+        self._client = client
+        self._nodes = None
+        self._service_fqdns = {}
+
+    def get_nodes(self, fqdns=None):
+        """Get cloud nodes.
+
+        Args:
+            fqdns (iterable, optional): nodes hostnames to filter
+
+        Returns:
+            NodeCollection: nodes
+        """
+        if self._nodes is None:
+            self._nodes = self._client.get_nodes()
+        nodes = self._nodes
+        if fqdns:
+            fqdns = set(fqdns)
+            nodes = nodes.filter(lambda host: host.fqdn in fqdns)
+        return nodes
+
+    def get_service_fqdns(self, service_name):
+        """Get FQDNs of nodes with running service.
+
+        Args:
+            service_name (str): name of service
+
+        Returns:
+            frozenset: nodes hostnames
+        """
+        if service_name not in self._service_fqdns:
+            nodes = self._client.get_service(service_name).get_nodes()
+            self._service_fqdns[service_name] = frozenset(
+                host.fqdn for host in nodes.hosts)
+        return self._service_fqdns[service_name]
+
+    def get_ip(self, fqdn):
+        """Get node IP by its FQDN.
+
+        Args:
+            fqdn (str): node hostname
+
+        Returns:
+            str|None: node ip
+        """
+        for host in self.get_nodes().hosts:
+            if host.fqdn == fqdn:
+                return host.ip
+
+    def get_service_names(self, fqdn):
+        """Get names of already discovered services running on node.
+
+        Args:
+            fqdn (str): node hostname
+
+        Returns:
+            list: services names
+        """
+        return sorted(name for name, fqdns in self._service_fqdns.items()
+                      if fqdn in fqdns)
+
+    def invalidate(self, service_names=None):
+        """Drop cached data.
+
+        Args:
+            service_names (list, optional): names of services to forget
+                placement of. If None - all cached data is dropped.
+        """
+        if service_names is None:
+            LOGGER.debug('Invalidate whole cloud topology')
+            self._nodes = None
+            self._service_fqdns.clear()
+        else:
+            LOGGER.debug('Invalidate topology of {}'.format(service_names))
+            for service_name in service_names:
+                self._service_fqdns.pop(service_name, None)
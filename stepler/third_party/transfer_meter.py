@@ -0,0 +1,182 @@
+"""
+-------------------------
+Data transfer speed meter
+-------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+import time
+
+__all__ = [
+    'TransferMeter',
+]
+
+LOGGER = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+class _FileReader(object):
+
+    def __init__(self, f, meter):
+        self._file = f
+        self._meter = meter
+
+    def read(self, size=-1):
+        chunk = self._file.read(size)
+        self._meter.update(len(chunk))
+        return chunk
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+
+class _ChunksReader(object):
+
+    def __init__(self, chunks, meter):
+        self._chunks = iter(chunks)
+        self._chunk = b''
+        self._offset = 0
+        self._meter = meter
+
+    def _next_chunk(self):
+        for chunk in self._chunks:
+            if chunk:
+                self._chunk, self._offset = chunk, 0
+                return True
+        return False
+
+    def read(self, size=-1):
+        parts = []
+        while size != 0:
+            if self._offset >= len(self._chunk) and not self._next_chunk():
+                break
+            end = (len(self._chunk) if size < 0
+                   else min(len(self._chunk), self._offset + size))
+            part = self._chunk[self._offset:end]
+            self._offset = end
+            parts.append(part)
+            if size > 0:
+                size -= len(part)
+        data = b''.join(parts)
+        self._meter.update(len(data))
+        return data
+
+
+class TransferMeter(object):
+    """Meter of transferred bytes count and speed.
+
+    It logs progress with ``log_interval`` (in seconds) and total speed at
+    the end of transfer.
+
+    Example:
+        >>> meter = TransferMeter('upload cirros')
+        >>> with open('cirros.img', 'rb') as f:
+        ...     client.images.upload(image_id, meter.wrap_file(f))
+        >>> meter.finish()
+        >>> meter.speed
+        104857600.0
+    """
+
+    def __init__(self, name, total=None, log_interval=10):
+        """Constructor.
+
+        Args:
+            name (str): transfer name for logging
+            total (int, optional): expected size of data (in bytes)
+            log_interval (int, optional): interval of progress logging
+                (in seconds)
+        """
+        self.name = name
+        self.total = total
+        self.transferred = 0
+        self._log_interval = log_interval
+        self._lock = threading.Lock()
+        self._start_time = None
+        self._end_time = None
+        self._logged_time = None
+
+    def update(self, size):
+        """Register transferred data.
+
+        Args:
+            size (int): size of transferred data (in bytes)
+        """
+        with self._lock:
+            now = time.time()
+            if self._start_time is None:
+                self._start_time = self._logged_time = now
+            self.transferred += size
+            if now - self._logged_time >= self._log_interval:
+                self._logged_time = now
+                LOGGER.debug(self._format_progress())
+
+    def finish(self):
+        """Register end of transfer and log its speed."""
+        self._end_time = time.time()
+        if self._start_time is None:
+            self._start_time = self._end_time
+        LOGGER.info('{}: {:.1f} MB in {:.1f} s, {:.1f} MB/s'.format(
+            self.name, float(self.transferred) / MB, self.duration,
+            self.speed / MB))
+
+    @property
+    def duration(self):
+        """Transfer duration (in seconds)."""
+        if self._start_time is None:
+            return 0.
+        return (self._end_time or time.time()) - self._start_time
+
+    @property
+    def speed(self):
+        """Average transfer speed (in bytes per second)."""
+        if not self.duration:
+            return 0.
+        return self.transferred / self.duration
+
+    def _format_progress(self):
+        progress = '{:.1f} MB'.format(float(self.transferred) / MB)
+        if self.total:
+            progress += ' of {:.1f} MB ({:.0%})'.format(
+                float(self.total) / MB, float(self.transferred) / self.total)
+        return '{}: {}, {:.1f} MB/s'.format(
+            self.name, progress, self.speed / MB)
+
+    def wrap_file(self, f):
+        """Wrap file-like object to meter data read from it.
+
+        Args:
+            f (file): file-like object
+
+        Returns:
+            object: file-like object
+        """
+        return _FileReader(f, self)
+
+    def wrap_chunks(self, chunks):
+        """Wrap iterable of data chunks to file-like object to meter them.
+
+        Clients uploading data (like glanceclient) read it from file-like
+        object with ``read(size)``.
+
+        Args:
+            chunks (iterable): data chunks
+
+        Returns:
+            object: file-like object
+        """
+        return _ChunksReader(chunks, self)
@@ -0,0 +1,87 @@
+"""
+------------------------
+In-memory cache with TTL
+------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+__all__ = [
+    'TtlCache',
+]
+
+
+class TtlCache(object):
+    """Thread-safe in-memory cache of values with limited lifetime.
+
+    It's intended for API lookups, which results aren't changed by tests,
+    to not repeat the same requests during ``ttl``.
+
+    Example:
+        >>> cache = TtlCache(ttl=60)
+        >>> cache.get('public_network', lambda: find_public_network())
+        {'id': '...', 'router:external': True, ...}
+    """
+
+    def __init__(self, ttl):
+        """Constructor.
+
+        Args:
+            ttl (int): lifetime of cached values, in seconds
+        """
+        self._ttl = ttl
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, calculate, ttl=None):
+        """Get cached value or calculate and cache it.
+
+        Args:
+            key (hashable): value key
+            calculate (function): function without arguments to calculate
+                value if it isn't cached or is expired
+            ttl (int, optional): lifetime of value, in seconds. By default
+                cache ``ttl`` is used.
+
+        Returns:
+            object: value
+        """
+        if ttl is None:
+            ttl = self._ttl
+        now = time.time()
+        with self._lock:
+            if key in self._values:
+                timestamp, value = self._values[key]
+                if now - timestamp < ttl:
+                    return value
+        value = calculate()
+        with self._lock:
+            self._values[key] = (time.time(), value)
+        return value
+
+    def invalidate(self, key=None):
+        """Drop cached values.
+
+        Args:
+            key (hashable, optional): key of value to drop. If None - all
+                values are dropped.
+        """
+        with self._lock:
+            if key is None:
+                self._values.clear()
+            else:
+                self._values.pop(key, None)
@@ -17,20 +17,22 @@ Utils
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import email.utils
+import binascii
 import hashlib
 import inspect
 import logging
+from multiprocessing.pool import ThreadPool
 import os
 import random
 import tempfile
 import uuid
 
 import attrdict
-import requests
 import six
 
 from stepler.third_party import context
+from stepler.third_party import file_digests
+from stepler.third_party import image_store
 
 
 if six.PY3:
@@ -38,17 +40,22 @@ if six.PY3:
 
 LOGGER = logging.getLogger(__name__)
 
+CHUNK_SIZE = 1024 * 1024
+
 __all__ = [
     'AttrDict',
     'generate_ids',
     'generate_files',
+    'generate_file_chunks',
     'generate_file_context',
     'generate_ips',
     'get_file_path',
     'get_size',
     'get_unwrapped_func',
     'is_iterable',
+    'map_parallel',
     'slugify',
+    'write_file',
 ]
 
 
@@ -133,7 +140,106 @@ def generate_ids(prefix=None, postfix=None, count=1, length=50,
         yield uid
 
 
-def generate_files(prefix=None, postfix=None, folder=None, count=1, size=1024):
+def generate_file_chunks(size, mode='random', seed=None,
+                         chunk_size=CHUNK_SIZE):
+    """Generate data chunks with bounded memory usage.
+
+    Arguments:
+        size (int): total size of data (in bytes).
+        mode (str): content mode:
+
+            * ``random`` - random bytes. If ``seed`` is passed, they are
+              reproducible: chunks are made of one block generated with
+              seeded PRNG, rotated by pseudorandom offsets. Otherwise
+              ``os.urandom`` is used;
+            * ``zero`` - zero bytes;
+            * ``pattern`` - repeated text pattern (well compressible).
+
+        seed (object|None): seed of PRNG for ``random`` mode.
+        chunk_size (int): max size of one chunk (in bytes).
+
+    Returns:
+        generator: data chunks (bytes).
+
+    Raises:
+        ValueError: if mode is unknown.
+    """
+    if mode == 'random' and seed is None:
+        _make_chunk = os.urandom
+
+    elif mode == 'random':
+        rnd = random.Random(seed)
+        # PRNG is too slow to generate all data, so seeded block is generated
+        # once and each chunk is the block rotated by seeded offset
+        block_size = min(size, chunk_size)
+        block = b''
+        if block_size:
+            block = binascii.unhexlify('{:0{}x}'.format(
+                rnd.getrandbits(block_size * 8), block_size * 2))
+
+        def _make_chunk(length):
+            offset = rnd.randrange(block_size)
+            return (block[offset:] + block[:offset])[:length]
+
+    elif mode == 'zero':
+        zero_chunk = b'\0' * min(size, chunk_size)
+        _make_chunk = lambda length: zero_chunk[:length]
+
+    elif mode == 'pattern':
+        pattern = b'stepler test data 0123456789\n'
+        pattern_chunk = pattern * (min(size, chunk_size) // len(pattern) + 1)
+        _make_chunk = lambda length: pattern_chunk[:length]
+
+    else:
+        raise ValueError('Unknown content mode: {!r}'.format(mode))
+
+    size_rest = size
+    while size_rest > 0:
+        length = min(size_rest, chunk_size)
+        yield _make_chunk(length)
+        size_rest -= length
+
+
+def write_file(file_path, size, mode='random', seed=None, checksum=None):
+    """Write file with generated content.
+
+    File is written by chunks, so memory usage doesn't depend on file size.
+    For ``sparse`` mode file is just truncated to required size without data
+    writing, so it's zero-filled and doesn't take disk space.
+
+    Arguments:
+        file_path (str): path to file.
+        size (int): size of file (in bytes).
+        mode (str): content mode, ``sparse`` or one of modes of
+            ``generate_file_chunks``.
+        seed (object|None): seed of PRNG for ``random`` mode.
+        checksum (str|None): name of hash algorithm (md5, sha256, etc) to
+            calculate file checksum during writing.
+
+    Returns:
+        str|None: hex digest of file content if checksum is requested.
+    """
+    digest = hashlib.new(checksum) if checksum else None
+
+    with open(file_path, 'wb') as f:
+        if mode == 'sparse':
+            f.truncate(size)
+            chunks = generate_file_chunks(size, mode='zero') if digest else []
+        else:
+            chunks = generate_file_chunks(size, mode=mode, seed=seed)
+
+        for chunk in chunks:
+            if mode != 'sparse':
+                f.write(chunk)
+            if digest:
+                digest.update(chunk)
+
+    if digest:
+        return digest.hexdigest()
+
+
+def generate_files(prefix=None, postfix=None, folder=None, count=1, size=1024,
+                   mode='random', seed=None):
     """Generate files with unique names.
 
     Arguments:
@@ -142,6 +248,10 @@ def generate_files(prefix=None, postfix=None, folder=None, count=1, size=1024):
         folder (str|None): folder to create unique files.
         count (int): count of unique ids.
         size (int): size of unique files.
+        mode (str): content mode, see ``write_file``.
+        seed (int|None): seed of PRNG for ``random`` mode. Files get seeds
+            ``seed``, ``seed + 1``, etc, so their content is different but
+            reproducible.
 
     Returns:
         generator: files with unique names.
@@ -150,23 +260,16 @@ def generate_files(prefix=None, postfix=None, folder=None, count=1, size=1024):
     if not os.path.isdir(folder):
         os.makedirs(folder)
 
-    size_1gb = 1024 * 1024 * 1024
-
-    for uid in generate_ids(prefix, postfix, count):
+    for i, uid in enumerate(generate_ids(prefix, postfix, count)):
         file_path = os.path.join(folder, uid)
-
-        # file is generated by adding new parts, max size of one part = 1 Gb
-        size_rest = size
-        while size_rest > 0:
-            with open(file_path, 'ab') as f:
-                f.write(os.urandom(min(size_rest, size_1gb)))
-            size_rest -= size_1gb
-
+        file_seed = seed + i if seed is not None else None
+        write_file(file_path, size, mode=mode, seed=file_seed)
         yield file_path
 
 
 @context.context
-def generate_file_context(prefix=None, postfix=None, folder=None, size=1024):
+def generate_file_context(prefix=None, postfix=None, folder=None, size=1024,
+                          mode='random', seed=None):
     """Context manager to generate file with unique name and delete it later.
 
     Useful for large files.
@@ -176,12 +279,15 @@ def generate_file_context(prefix=None, postfix=None, folder=None, size=1024):
         postfix (str|None): postfix of unique id
         folder (str|None): folder to create unique file
         size (int): size of unique file (in bytes)
+        mode (str): content mode, see ``write_file``
+        seed (int|None): seed of PRNG for ``random`` mode
 
     Yields:
         str: file path.
     """
     file_path = next(generate_files(prefix=prefix, postfix=postfix,
-                                    folder=folder, size=size))
+                                    folder=folder, size=size, mode=mode,
+                                    seed=seed))
     yield file_path
 
     os.remove(file_path)
@@ -206,13 +312,18 @@ def generate_ips(ip_start=1, ip_end=254, count=1):
             [str(random.randint(ip_start, ip_end)) for _ in range(4)])
 
 
-# TODO(schipiga): copied from mos-integration-tests, need refactor.
-def get_file_path(url, name=None):
+def get_file_path(url, name=None, checksum=None):
     """Download file by URL to local cached storage.
 
+    Files are stored in content-addressed store, see
+    ``stepler.third_party.image_store.ImageStore``.
+
     Arguments:
         url (str): URL of file location.
         name (str|None): file name.
+        checksum (str|None): expected checksum in format
+            ``<algorithm>:<hexdigest>``. By default it's taken from
+            ``config.IMAGE_CHECKSUMS``.
 
     Returns:
         str: file path of downloaded file.
@@ -221,48 +332,19 @@ def get_file_path(url, name=None):
     # configured values. We hack it for usability.
     from stepler import config
 
-    def _get_file_name(url):
-        keepcharacters = (' ', '.', '_', '-')
-        filename = url.rsplit('/')[-1]
-        return "".join(c for c in filename
-                       if c.isalnum() or c in keepcharacters).rstrip()
-
     if os.path.isfile(url):
         return url
 
-    if not os.path.exists(config.TEST_IMAGE_PATH):
-        try:
-            os.makedirs(config.TEST_IMAGE_PATH)
-        except Exception as e:
-            LOGGER.warning("Can't make dir for files: {}".format(e))
-            return None
-
-    if not name:
-        name = _get_file_name(url)
-
-    file_path = os.path.join(config.TEST_IMAGE_PATH, name)
-    headers = {}
-    if os.path.exists(file_path):
-        file_date = os.path.getmtime(file_path)
-        headers['If-Modified-Since'] = email.utils.formatdate(file_date,
-                                                              usegmt=True)
-
-    response = requests.get(url, stream=True, headers=headers)
-
-    if response.status_code == 304:
-        LOGGER.info("Image file is up to date")
-    elif response.status_code == 200:
-        LOGGER.info("Start downloading image")
-        with open(file_path, 'wb') as f:
-            for chunk in response.iter_content(65536):
-                f.write(chunk)
-        LOGGER.info("Image downloaded")
-    else:
-        LOGGER.warning("Can't get fresh image. HTTP status code is "
-                       "{0.status_code}".format(response))
+    try:
+        store = image_store.ImageStore(
+            config.TEST_IMAGE_PATH,
+            threads=config.IMAGE_DOWNLOAD_THREADS)
+    except Exception as e:
+        LOGGER.warning("Can't make dir for files: {}".format(e))
+        return None
 
-    response.close()
-    return file_path
+    return store.get(url, name=name,
+                     checksum=checksum or config.IMAGE_CHECKSUMS.get(url))
 
 
 def get_unwrapped_func(func):
@@ -312,6 +394,27 @@ def is_iterable(obj):
         return False
 
 
+def map_parallel(func, items, threads):
+    """Call function for each item in parallel threads.
+
+    Args:
+        func (function): function with one argument
+        items (iterable): items to pass to function
+        threads (int): max count of threads
+
+    Returns:
+        list: function results in order of items
+    """
+    items = list(items)
+    if len(items) < 2:
+        return [func(item) for item in items]
+    pool = ThreadPool(min(len(items), threads))
+    try:
+        return pool.map(func, items)
+    finally:
+        pool.close()
+
+
 def slugify(string):
     """Replace non-alphanumeric symbols to underscore in string.
 
@@ -370,18 +473,24 @@ class AttrDict(attrdict.AttrDict):
         self.update(updated_fields)
 
 
-def get_md5sum(file_path, size=4096):
+def get_md5sum(file_path):
     """Get md5 hash sum of file.
 
+    Hash sum of file of images store is cached until file is changed, see
+    ``stepler.third_party.file_digests.get_digests``. Other files are hashed
+    on each call.
+
     Args:
         file_path (str): path to file
-        size (int): chunk size to read content
 
     Returns:
         str: md5 hash sum of file
     """
-    hash_md5 = hashlib.md5()
-    with open(file_path, 'rb') as file:
-        for chunk in iter(lambda: file.read(size), b""):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
+    # TODO(schipiga): thirdparty module should know nothing about stepler
+    # configured values. We hack it for usability.
+    from stepler import config
+
+    store_path = os.path.join(os.path.realpath(config.TEST_IMAGE_PATH), '')
+    persist = os.path.realpath(file_path).startswith(store_path)
+    return file_digests.get_digests(file_path, ['md5'],
+                                    persist=persist)['md5']
@@ -0,0 +1,82 @@
+"""
+---------------------
+Glance steps v2 tests
+---------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from hamcrest import assert_that, equal_to  # noqa H301
+import mock
+import pytest
+
+pytest.importorskip('glanceclient')
+
+from stepler.glance.steps import v2  # noqa E402
+
+# glanceclient reads uploaded data with this chunk size
+CHUNKSIZE = 65536
+
+
+def test_upload_image_chunks():
+    uploaded = []
+
+    def upload(image_id, image_data):
+        # glanceclient reads file-like data by chunks
+        while True:
+            chunk = image_data.read(CHUNKSIZE)
+            if not chunk:
+                break
+            uploaded.append(chunk)
+
+    client = mock.Mock()
+    client.images.upload.side_effect = upload
+    image = mock.Mock(id='image-id')
+    image.name = 'stepler-image'
+    chunks = [b'a' * 100000, b'b' * 30000, b'c' * 7]
+
+    meter = v2.GlanceStepsV2(client)._upload_image(
+        image, image_chunks=lambda: iter(chunks))
+
+    assert_that(b''.join(uploaded), equal_to(b''.join(chunks)))
+    assert_that(meter.transferred, equal_to(130007))
+
+
+def _make_images(count):
+    return [mock.Mock(id='image-{}'.format(i), owner='project-id',
+                      status='active') for i in range(count)]
+
+
+def test_check_few_images_status():
+    images = _make_images(2)
+    client = mock.Mock()
+    client.images.get.side_effect = {image.id: image
+                                     for image in images}.get
+
+    v2.GlanceStepsV2(client).check_images_status(images, 'active')
+
+    assert client.images.get.call_count == 2
+    assert not client.images.list.called
+
+
+def test_check_many_images_status():
+    images = _make_images(v2.MAX_IMAGES_TO_GET + 1)
+    client = mock.Mock()
+    client.images.list.return_value = images + _make_images(1)
+
+    v2.GlanceStepsV2(client).check_images_status(images, 'active')
+
+    assert not client.images.get.called
+    assert_that(client.images.list.call_args[1]['filters'],
+                equal_to({'owner': 'project-id'}))
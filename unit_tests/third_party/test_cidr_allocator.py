@@ -0,0 +1,58 @@
+"""
+--------------------
+CIDR allocator tests
+--------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from hamcrest import assert_that, calling, equal_to, raises  # noqa H301
+import pytest
+
+from stepler.third_party import cidr_allocator
+
+
+@pytest.fixture
+def allocator(tmpdir):
+    return cidr_allocator.CidrAllocator(str(tmpdir.join('cidrs.json')),
+                                        pool='10.0.0.0/22')
+
+
+def test_allocations_do_not_overlap(tmpdir, allocator):
+    other_allocator = cidr_allocator.CidrAllocator(
+        str(tmpdir.join('cidrs.json')), pool='10.0.0.0/22')
+
+    assert_that(allocator.allocate(), equal_to('10.0.0.0/24'))
+    assert_that(other_allocator.allocate(), equal_to('10.0.1.0/24'))
+
+
+def test_used_cidrs_are_skipped(allocator):
+    cidr = allocator.allocate(used_cidrs=['10.0.0.128/25', '10.0.1.0/23',
+                                          '192.168.0.0/24', 'fd00::/64'])
+
+    assert_that(cidr, equal_to('10.0.2.0/24'))
+
+
+def test_release(allocator):
+    cidr = allocator.allocate()
+    allocator.release(cidr)
+
+    assert_that(allocator.allocate(), equal_to(cidr))
+
+
+def test_pool_is_exhausted(allocator):
+    for _ in range(4):
+        allocator.allocate()
+
+    assert_that(calling(allocator.allocate), raises(LookupError))
@@ -0,0 +1,124 @@
+"""
+-------------------------------
+Downtime meter helper unittests
+-------------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from hamcrest import (assert_that, calling, close_to, contains, empty,
+                      equal_to, has_properties, raises)  # noqa H301
+import mock
+
+from stepler.third_party import downtime
+
+REPLY = ('[{ts:.6f}] 64 bytes from 10.0.0.1: icmp_seq={seq} ttl=64 '
+         'time={rtt} ms')
+SUMMARY = """
+--- 10.0.0.1 ping statistics ---
+{transmitted} packets transmitted, {received} received, 0% packet loss, time 1ms
+"""  # noqa
+
+
+def _make_output(seqs, transmitted, interval=0.1, start=1000., rtt=1.0):
+    lines = ['PING 10.0.0.1 (10.0.0.1) 56(84) bytes of data.']
+    for seq in seqs:
+        ts = start + (seq - 1) * interval + rtt / 1000
+        lines.append(REPLY.format(ts=ts, seq=seq % 2 ** 16, rtt=rtt))
+    lines.append(SUMMARY.format(transmitted=transmitted, received=len(seqs)))
+    return '\n'.join(lines)
+
+
+def test_no_outages():
+    output = _make_output(range(1, 11), transmitted=10)
+    assert_that(downtime._parse(output, 0.1), empty())
+
+
+def test_outage_in_the_middle():
+    seqs = [1, 2, 3, 7, 8]
+    output = _make_output(seqs, transmitted=8)
+    result = downtime._parse(output, 0.1)
+    assert_that(result, contains(
+        has_properties(start=close_to(0.3, 1e-6),
+                       end=close_to(0.6, 1e-6),
+                       duration=close_to(0.3, 1e-6))))
+
+
+def test_leading_and_trailing_outages():
+    seqs = [3, 4, 5]
+    output = _make_output(seqs, transmitted=7)
+    result = downtime._parse(output, 0.1)
+    assert_that(result, contains(
+        has_properties(start=close_to(0., 1e-6),
+                       end=close_to(0.2, 1e-6)),
+        has_properties(start=close_to(0.5, 1e-6),
+                       end=close_to(0.7, 1e-6))))
+
+
+def test_no_replies():
+    output = _make_output([], transmitted=5)
+    result = downtime._parse(output, 0.1)
+    assert_that(result, contains(
+        has_properties(duration=close_to(0.5, 1e-6))))
+
+
+def test_icmp_seq_wrapping():
+    seqs = list(range(65530, 65540)) + list(range(65545, 65550))
+    output = _make_output(seqs, transmitted=65549, interval=0.01,
+                          start=0.)
+    result = downtime._parse(output, 0.01)
+    assert_that(result[-1], has_properties(duration=close_to(0.05, 1e-6)))
+
+
+def test_duplicated_replies():
+    output = _make_output([1, 2, 2, 3], transmitted=3)
+    assert_that(downtime._parse(output, 0.1), empty())
+
+
+def test_max_outage():
+    result = downtime.DowntimeResult(0.1)
+    result.stdout = _make_output([1, 4, 5, 10], transmitted=10)
+    assert_that(result.max_outage, close_to(0.4, 1e-6))
+    assert_that(result.total_downtime, close_to(0.6, 1e-6))
+
+
+def test_without_statistics():
+    assert_that(calling(downtime._parse).with_args('', 0.1),
+                raises(ValueError))
+
+
+def test_local_interval_is_clamped_for_user():
+    with mock.patch.object(downtime, '_is_superuser', return_value=False), \
+            mock.patch.object(downtime.subprocess, 'Popen') as popen:
+        popen.return_value.poll.return_value = None
+        popen.return_value.communicate.return_value = (
+            _make_output([1], transmitted=1), '')
+        with downtime.downtime_meter('10.0.0.1', interval=0.01) as result:
+            pass
+
+    assert_that(popen.call_args[0][0], contains(
+        'ping', '-D', '-i', '0.200', '10.0.0.1'))
+    assert_that(result.interval, equal_to(downtime.MIN_USER_INTERVAL))
+
+
+def test_local_ping_unexpected_exit():
+    with mock.patch.object(downtime.subprocess, 'Popen') as popen:
+        popen.return_value.poll.return_value = 2
+        popen.return_value.returncode = 2
+        popen.return_value.communicate.return_value = ('', 'ping: error')
+        meter = downtime.downtime_meter('10.0.0.1', interval=0.5)
+
+        meter.__enter__()
+        assert_that(calling(meter.__exit__).with_args(None, None, None),
+                    raises(Exception, 'ping: error'))
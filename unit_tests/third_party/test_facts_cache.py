@@ -0,0 +1,86 @@
+"""
+-----------------------------
+Environment facts cache tests
+-----------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from hamcrest import assert_that, equal_to  # noqa H301
+import mock
+
+from stepler.third_party import facts_cache
+
+
+def test_fact_calculated_once():
+    calculate = mock.Mock(return_value=3)
+    facts = facts_cache.FactsCache()
+
+    for _ in range(3):
+        assert_that(facts.get('computes_count', calculate), equal_to(3))
+    assert calculate.call_count == 1
+
+
+def test_falsy_fact_cached():
+    calculate = mock.Mock(return_value=None)
+    facts = facts_cache.FactsCache()
+
+    facts.get('ceph_enabled', calculate)
+    facts.get('ceph_enabled', calculate)
+    assert calculate.call_count == 1
+
+
+def test_persisted_facts(tmpdir):
+    path = str(tmpdir.join('facts.json'))
+    facts_cache.FactsCache(path, key='cloud-1').get('dvr', lambda: True)
+
+    calculate = mock.Mock(return_value=False)
+    assert_that(facts_cache.FactsCache(path, key='cloud-1').get(
+        'dvr', calculate), equal_to(True))
+    assert_that(facts_cache.FactsCache(path, key='cloud-2').get(
+        'dvr', calculate), equal_to(False))
+    assert calculate.call_count == 1
+
+
+def test_persisted_facts_expired(tmpdir):
+    path = str(tmpdir.join('facts.json'))
+    with mock.patch.object(facts_cache.time, 'time', return_value=1000):
+        facts_cache.FactsCache(path, key='cloud').get('dvr', lambda: True)
+
+    with mock.patch.object(facts_cache.time, 'time', return_value=1100):
+        facts = facts_cache.FactsCache(path, key='cloud', ttl=60)
+    assert_that(facts.get('dvr', lambda: False), equal_to(False))
+
+
+def test_invalidate(tmpdir):
+    path = str(tmpdir.join('facts.json'))
+    facts = facts_cache.FactsCache(path, key='cloud')
+    facts.get('dvr', lambda: True)
+    facts.get('l3_ha', lambda: True)
+
+    facts.invalidate(names=['dvr'])
+    assert_that(facts.get('dvr', lambda: False), equal_to(False))
+    assert_that(facts.get('l3_ha', lambda: False), equal_to(True))
+
+    facts.invalidate()
+    facts = facts_cache.FactsCache(path, key='cloud')
+    assert_that(facts.get('l3_ha', lambda: False), equal_to(False))
+
+
+def test_known_facts(tmpdir):
+    path = str(tmpdir.join('facts.json'))
+    facts_cache.FactsCache(path, key='cloud').get('dvr', lambda: True)
+
+    facts = facts_cache.FactsCache(path, key='cloud', facts={'vlan': False})
+    assert_that(facts.get_cached(), equal_to({'dvr': True, 'vlan': False}))
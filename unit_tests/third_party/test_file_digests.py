@@ -0,0 +1,106 @@
+"""
+------------------
+File digests tests
+------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import os
+
+from hamcrest import assert_that, equal_to, has_entries  # noqa H301
+import mock
+import pytest
+
+from stepler.third_party import file_digests
+
+CONTENT = os.urandom(10 * 1024)
+
+
+@pytest.fixture
+def file_path(tmpdir):
+    path = tmpdir.join('cirros.img')
+    path.write(CONTENT, mode='wb')
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def clear_entries():
+    file_digests._entries.clear()
+
+
+def test_calculate_digests(file_path):
+    digests = file_digests.calculate_digests(file_path, ['md5', 'sha1'],
+                                             chunk_size=1000)
+
+    assert_that(digests, equal_to({
+        'md5': hashlib.md5(CONTENT).hexdigest(),
+        'sha1': hashlib.sha1(CONTENT).hexdigest()}))
+
+
+def test_digests_are_cached(file_path):
+    file_digests.get_digests(file_path, ['md5'], persist=True)
+    file_digests._entries.clear()
+
+    with mock.patch.object(file_digests, 'calculate_digests') as calculate:
+        digests = file_digests.get_digests(file_path, persist=True)
+
+    assert not calculate.called
+    assert_that(digests, has_entries(
+        md5=hashlib.md5(CONTENT).hexdigest(),
+        sha256=hashlib.sha256(CONTENT).hexdigest()))
+
+
+def test_digests_are_not_cached_by_default(file_path):
+    file_digests.get_digests(file_path)
+
+    assert_that(os.listdir(os.path.dirname(file_path)),
+                equal_to(['cirros.img']))
+    with mock.patch.object(file_digests, 'calculate_digests') as calculate:
+        file_digests.get_digests(file_path)
+    assert calculate.called
+
+
+def test_removed_files_are_pruned(file_path, tmpdir):
+    other_path = str(tmpdir.join('other.img'))
+    with open(other_path, 'wb') as f:
+        f.write(CONTENT)
+    file_digests.get_digests(other_path, ['md5'], persist=True)
+    os.remove(other_path)
+
+    file_digests.get_digests(file_path, ['md5'], persist=True)
+
+    with open(file_digests._get_index_path(file_path)) as f:
+        assert_that(list(json.load(f)), equal_to(['cirros.img']))
+
+
+def test_changed_file_is_hashed_again(file_path):
+    file_digests.get_digests(file_path, persist=True)
+    with open(file_path, 'ab') as f:
+        f.write(b'tail')
+
+    digests = file_digests.get_digests(file_path, ['md5'], persist=True)
+
+    assert_that(digests['md5'],
+                equal_to(hashlib.md5(CONTENT + b'tail').hexdigest()))
+
+
+def test_update_digests(file_path):
+    file_digests.update_digests(file_path, {'md5': 'known'})
+
+    digests = file_digests.get_digests(file_path, ['md5'], persist=True)
+
+    assert_that(digests['md5'], equal_to('known'))
@@ -0,0 +1,162 @@
+"""
+-----------------
+Image store tests
+-----------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import hashlib
+import os
+import re
+import threading
+
+from hamcrest import (assert_that, calling, equal_to, has_length,
+                      raises)  # noqa H301
+import pytest
+import requests
+from six.moves import BaseHTTPServer
+
+from stepler.third_party import image_store
+
+CONTENT = os.urandom(100 * 1024)
+
+
+class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    def log_message(self, *args):
+        pass
+
+    def _send_headers(self):
+        content = self.server.files[self.path]
+        match = re.match(r'bytes=(\d+)-(\d+)', self.headers.get('Range', ''))
+        if match:
+            start, end = int(match.group(1)), int(match.group(2)) + 1
+            self.send_response(206)
+        else:
+            start, end = 0, len(content)
+            self.send_response(200)
+        self.send_header('Content-Length', str(end - start))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('ETag', hashlib.md5(content).hexdigest())
+        self.end_headers()
+        return content[start:end]
+
+    def do_HEAD(self):
+        if self.headers.get('If-None-Match') == hashlib.md5(
+                self.server.files[self.path]).hexdigest():
+            self.send_response(304)
+            self.end_headers()
+            return
+        self._send_headers()
+
+    def do_GET(self):
+        self.server.gets.append(self.headers.get('Range'))
+        content = self._send_headers()
+        if self.server.corrupt:
+            content = b'\0' + content[1:]
+        if self.server.fail_after is not None:
+            content = content[:self.server.fail_after]
+        self.wfile.write(content)
+
+
+@pytest.yield_fixture
+def server():
+    server = BaseHTTPServer.HTTPServer(('127.0.0.1', 0), Handler)
+    server.files = {'/cirros.img': CONTENT, '/mirror/cirros.img': CONTENT}
+    server.gets = []
+    server.fail_after = None
+    server.corrupt = False
+    server.url = 'http://127.0.0.1:{}'.format(server.server_port)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def test_parallel_download(tmpdir, server):
+    store = image_store.ImageStore(str(tmpdir), threads=4,
+                                   min_parallel_size=1024)
+    path = store.get(server.url + '/cirros.img')
+
+    assert_that(path, equal_to(str(tmpdir.join('cirros.img'))))
+    assert_that(_read(path), equal_to(CONTENT))
+    assert_that(server.gets, has_length(4))
+
+
+def test_cached_file_is_not_downloaded(tmpdir, server):
+    store = image_store.ImageStore(str(tmpdir))
+    store.get(server.url + '/cirros.img')
+    store.get(server.url + '/cirros.img')
+
+    assert_that(server.gets, has_length(1))
+
+
+def test_same_content_stored_once(tmpdir, server):
+    store = image_store.ImageStore(str(tmpdir))
+    path_1 = store.get(server.url + '/cirros.img')
+    path_2 = store.get(server.url + '/mirror/cirros.img', name='mirror.img')
+
+    assert os.path.samefile(path_1, path_2)
+    assert_that(os.listdir(str(tmpdir.join('objects'))), has_length(1))
+
+
+def test_resume_download(tmpdir, server):
+    store = image_store.ImageStore(str(tmpdir))
+    server.fail_after = 1000
+    assert_that(calling(store.get).with_args(server.url + '/cirros.img'),
+                raises(requests.RequestException))
+
+    server.fail_after = None
+    path = store.get(server.url + '/cirros.img')
+
+    assert_that(_read(path), equal_to(CONTENT))
+    assert_that(server.gets[-1],
+                equal_to('bytes=1000-{}'.format(len(CONTENT) - 1)))
+
+
+def test_checksum_mismatch(tmpdir, server):
+    store = image_store.ImageStore(str(tmpdir))
+    url = server.url + '/cirros.img'
+
+    assert_that(calling(store.get).with_args(url, checksum='md5:00'),
+                raises(ValueError))
+    path = store.get(url, checksum='md5:' + hashlib.md5(CONTENT).hexdigest())
+    assert_that(_read(path), equal_to(CONTENT))
+
+
+def test_checksum_from_server_etag(tmpdir, server):
+    store = image_store.ImageStore(str(tmpdir))
+    server.corrupt = True
+
+    assert_that(calling(store.get).with_args(server.url + '/cirros.img'),
+                raises(ValueError))
+
+
+def test_checksum_from_content_md5():
+    content_md5 = base64.b64encode(hashlib.md5(CONTENT).digest())
+
+    assert_that(image_store._get_server_checksum({
+        'Content-MD5': content_md5, 'ETag': '"5d8-4f3a"'}),
+        equal_to('md5:' + hashlib.md5(CONTENT).hexdigest()))
+    assert_that(image_store._get_server_checksum({'ETag': '"5d8-4f3a"'}),
+                equal_to(None))
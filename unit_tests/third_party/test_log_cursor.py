@@ -0,0 +1,73 @@
+"""
+-----------------------
+Remote log cursor tests
+-----------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+
+from hamcrest import assert_that, equal_to, has_properties  # noqa H301
+
+from stepler.third_party import log_cursor
+
+LOG = """2016-11-10 10:00:00.001 INFO neutron Received SIGHUP
+2016-11-10 10:00:00.002 ERROR neutron Something wrong
+2016-11-10 10:00:00.003 TRACE neutron Traceback
+2016-11-10 10:00:00.004 ERROR neutron Something wrong again
+"""
+
+
+def _run(cmd):
+    return subprocess.check_output(cmd, shell=True).decode('utf-8')
+
+
+def test_parse_cursor():
+    cursor = log_cursor.parse_cursor('/var/log/foo.log', '1024 42\n')
+    assert_that(cursor, has_properties(file_name='/var/log/foo.log',
+                                       offset=1024, inode=42))
+
+
+def test_read_appended_content(tmpdir):
+    log_file = tmpdir.join('foo.log')
+    log_file.write('old record\n')
+    cursor = log_cursor.parse_cursor(
+        str(log_file), _run(log_cursor.get_cursor_cmd(str(log_file))))
+    log_file.write(LOG, mode='a')
+
+    output = _run(log_cursor.get_read_cmd(cursor))
+    assert_that(log_cursor.decode_output(output), equal_to(LOG))
+
+
+def test_read_rotated_file(tmpdir):
+    log_file = tmpdir.join('foo.log')
+    log_file.write('old record\n' * 100)
+    cursor = log_cursor.parse_cursor(
+        str(log_file), _run(log_cursor.get_cursor_cmd(str(log_file))))
+    log_file.remove()
+    log_file.write(LOG)
+
+    output = _run(log_cursor.get_read_cmd(cursor))
+    assert_that(log_cursor.decode_output(output), equal_to(LOG))
+
+
+def test_count_matches():
+    counts = log_cursor.count_matches(
+        LOG, ['ERROR', 'TRACE', 'SIGHUP', 'CRITICAL', r'wrong\b.*again'])
+    assert_that(counts, equal_to({'ERROR': 2,
+                                  'TRACE': 1,
+                                  'SIGHUP': 1,
+                                  'CRITICAL': 0,
+                                  r'wrong\b.*again': 1}))
@@ -0,0 +1,91 @@
+"""
+-------------------
+OVS snapshots tests
+-------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from hamcrest import assert_that, empty, equal_to  # noqa H301
+
+from stepler.third_party import ovs_snapshot
+
+FLOWS_DUMP = """NXST_FLOW reply (xid=0x4):
+ cookie=0x9d4, duration=7.2s, table=0, n_packets=3, n_bytes=180, \
+idle_age=1, priority=10,arp,in_port=1 actions=resubmit(,24)
+ cookie=0x9d4, duration=7.3s, table=23, n_packets=0, n_bytes=0, \
+idle_age=7, actions=drop
+ cookie=0x9d4, duration=2.1s, table=20, n_packets=1, n_bytes=60, \
+hard_timeout=300, idle_age=2, priority=1,vlan_tci=0x0001/0x0fff,\
+dl_dst=fa:16:3e:00:00:01 actions=output:2
+"""
+
+FLOWS_DUMP_AFTER_RESTART = """NXST_FLOW reply (xid=0x4):
+ cookie=0xa11, duration=1.2s, table=0, n_packets=0, n_bytes=0, \
+idle_age=1, priority=10,arp,in_port=1 actions=resubmit(,24)
+"""
+
+PORTS_LIST = """br-int,
+qvo1a2b,1
+"tap 3c",4095
+"""
+
+
+def test_parse_flows():
+    flows = ovs_snapshot.parse_flows(FLOWS_DUMP)
+
+    assert_that(flows, equal_to({
+        ovs_snapshot.Flow(table=0, priority=10, match='arp,in_port=1',
+                          actions='resubmit(,24)', cookie='0x9d4',
+                          transient=False),
+        ovs_snapshot.Flow(table=23, priority=ovs_snapshot.DEFAULT_PRIORITY,
+                          match='', actions='drop', cookie='0x9d4',
+                          transient=False),
+        ovs_snapshot.Flow(table=20, priority=1,
+                          match='vlan_tci=0x0001/0x0fff,'
+                                'dl_dst=fa:16:3e:00:00:01',
+                          actions='output:2', cookie='0x9d4',
+                          transient=True),
+    }))
+
+
+def test_parse_ports():
+    ports = ovs_snapshot.parse_ports(PORTS_LIST)
+
+    assert_that(ports, equal_to({
+        ovs_snapshot.Port('br-int', None),
+        ovs_snapshot.Port('qvo1a2b', 1),
+        ovs_snapshot.Port('tap 3c', 4095),
+    }))
+
+
+def test_diff_ignores_fields():
+    old = ovs_snapshot.parse_flows(FLOWS_DUMP)
+    new = ovs_snapshot.parse_flows(FLOWS_DUMP_AFTER_RESTART)
+
+    flows_diff = ovs_snapshot.diff(old, new, ignore_fields=('cookie',))
+
+    assert_that(flows_diff.added, empty())
+    assert_that(sorted(flow.actions for flow in flows_diff.removed),
+                equal_to(['drop', 'output:2']))
+
+
+def test_diff_all_fields():
+    old = ovs_snapshot.parse_flows(FLOWS_DUMP)
+    new = ovs_snapshot.parse_flows(FLOWS_DUMP_AFTER_RESTART)
+
+    flows_diff = ovs_snapshot.diff(old, new)
+
+    assert_that(flows_diff.added, equal_to(new))
+    assert_that(flows_diff.removed, equal_to(old))
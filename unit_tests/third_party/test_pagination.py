@@ -0,0 +1,84 @@
+"""
+----------------
+Pagination tests
+----------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from hamcrest import assert_that, equal_to  # noqa H301
+import mock
+
+from stepler.third_party import pagination
+
+OBJECTS = [{'id': i, 'name': 'stepler-{}'.format(i) if i % 2 else None}
+           for i in range(10)]
+
+
+def _list(marker=None, limit=None, **kwargs):
+    start = 0 if marker is None else marker + 1
+    return OBJECTS[start:start + limit]
+
+
+def test_iter_all_pages():
+    list_method = mock.Mock(side_effect=_list)
+    objs = list(pagination.iter_pages(list_method, 4, search_opts={}))
+
+    assert_that(objs, equal_to(OBJECTS))
+    assert_that(list_method.call_args_list, equal_to([
+        mock.call(marker=None, limit=4, search_opts={}),
+        mock.call(marker=3, limit=4, search_opts={}),
+        mock.call(marker=7, limit=4, search_opts={}),
+        mock.call(marker=9, limit=4, search_opts={})]))
+
+
+def test_iter_pages_capped_by_server():
+
+    def _list_capped(marker=None, limit=None):
+        return _list(marker=marker, limit=min(limit, 3))
+
+    objs = list(pagination.iter_pages(_list_capped, 4))
+
+    assert_that(objs, equal_to(OBJECTS))
+
+
+def test_stop_early():
+    list_method = mock.Mock(side_effect=_list)
+    objs = pagination.take(pagination.iter_pages(list_method, 4), 3)
+
+    assert_that(objs, equal_to(OBJECTS[:3]))
+    assert_that(list_method.call_count, equal_to(1))
+
+
+def test_filter_by_name_prefix():
+    objs = pagination.take(
+        pagination.filter_by_name_prefix(OBJECTS, 'stepler-'), limit=2)
+
+    assert_that(objs, equal_to([OBJECTS[1], OBJECTS[3]]))
+
+
+def test_project():
+    server = mock.Mock(id='1', status='ACTIVE')
+    server.name = 'stepler-server'
+    records = list(pagination.project([server, OBJECTS[1]],
+                                      ('id', 'name', 'status')))
+
+    assert_that([(record.id, record.name, record.status)
+                 for record in records],
+                equal_to([('1', 'stepler-server', 'ACTIVE'),
+                          (1, 'stepler-1', None)]))
+    assert not hasattr(records[0], '__dict__')
+    assert_that(type(records[0]),
+                equal_to(pagination.get_record_class(['id', 'name',
+                                                      'status'])))
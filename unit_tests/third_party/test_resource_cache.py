@@ -0,0 +1,100 @@
+"""
+--------------------
+Resource cache tests
+--------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+
+from hamcrest import assert_that, equal_to, is_not  # noqa H301
+import mock
+import pytest
+
+from stepler.third_party import resource_cache
+
+
+@pytest.fixture
+def create():
+    counter = itertools.count()
+    return mock.Mock(side_effect=lambda: {'id': next(counter)})
+
+
+def test_resource_is_reused_for_same_spec(create):
+    cache = resource_cache.ResourceCache()
+    delete = mock.Mock()
+
+    with cache.use('flavor', {'ram': 1024, 'vcpus': 1}, create,
+                   delete) as first:
+        pass
+    with cache.use('flavor', {'vcpus': 1, 'ram': 1024}, create,
+                   delete) as second:
+        pass
+
+    assert_that(second, equal_to(first))
+    assert_that(delete.called, equal_to(False))
+
+    cache.clear()
+    delete.assert_called_once_with(first)
+
+
+def test_resource_is_not_reused_for_other_spec(create):
+    cache = resource_cache.ResourceCache()
+
+    with cache.use('flavor', {'ram': 1024}, create, mock.Mock()) as first:
+        with cache.use('flavor', {'ram': 2048}, create,
+                       mock.Mock()) as second:
+            assert_that(second, is_not(equal_to(first)))
+
+
+def test_dirty_resource_is_deleted_after_last_use(create):
+    cache = resource_cache.ResourceCache()
+    delete = mock.Mock()
+
+    with cache.use('flavor', {}, create, delete) as first:
+        with cache.use('flavor', {}, create, delete):
+            resource_cache.mark_dirty(first)
+        assert_that(delete.called, equal_to(False))
+    delete.assert_called_once_with(first)
+
+    with cache.use('flavor', {}, create, delete) as second:
+        assert_that(second, is_not(equal_to(first)))
+        assert_that(resource_cache.is_dirty(second), equal_to(False))
+
+
+def test_resource_changed_by_create_is_clean(create):
+    cache = resource_cache.ResourceCache()
+
+    def _create():
+        resource = create()
+        resource_cache.mark_dirty(resource)
+        return resource
+
+    with cache.use('security_group', [], _create, mock.Mock()) as resource:
+        assert_that(resource_cache.is_dirty(resource), equal_to(False))
+
+
+def test_linking_resource_is_deleted_before_linked_one(create):
+    cache = resource_cache.ResourceCache()
+    deleted = []
+
+    with cache.use('router', {}, create, deleted.append) as router:
+        with cache.use('router_interface', {}, lambda: (router,),
+                       deleted.append) as link:
+            pass
+    with cache.use('router', {}, create, deleted.append) as router:
+        resource_cache.mark_dirty(router)
+
+    assert_that(deleted, equal_to([link, router]))
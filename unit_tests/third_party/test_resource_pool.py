@@ -0,0 +1,66 @@
+"""
+-------------------
+Resource pool tests
+-------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+
+from hamcrest import assert_that, contains_inanyorder, equal_to  # noqa H301
+import mock
+
+from stepler.third_party import resource_pool
+
+
+def _get_pool():
+    counter = itertools.count()
+    create = mock.Mock(
+        side_effect=lambda count: [next(counter) for _ in range(count)])
+    return resource_pool.ResourcePool(create, delete=mock.Mock(),
+                                      reset=mock.Mock())
+
+
+def test_released_resources_are_reused():
+    pool = _get_pool()
+
+    pool.release(pool.acquire(2))
+    resources = pool.acquire(3)
+
+    assert_that(resources, equal_to([0, 1, 2]))
+    assert_that(pool._create.call_args_list,
+                equal_to([mock.call(2), mock.call(1)]))
+    pool._reset.assert_called_once_with([0, 1])
+
+
+def test_clear_deletes_all_resources():
+    pool = _get_pool()
+    pool.release(pool.acquire(2))
+    pool.acquire(1)
+
+    pool.clear()
+
+    pool._delete.assert_called_once_with([0, 1])
+    assert_that(pool.acquire(1), equal_to([2]))
+
+
+def test_free_resources_are_not_shared():
+    pool = _get_pool()
+    pool.release(pool.acquire(2))
+
+    first = pool.acquire(1)
+    second = pool.acquire(2)
+
+    assert_that(first + second, contains_inanyorder(0, 1, 2))
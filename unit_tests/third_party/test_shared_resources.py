@@ -0,0 +1,72 @@
+"""
+----------------------
+Shared resources tests
+----------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from hamcrest import assert_that, equal_to, is_  # noqa H301
+import mock
+import pytest
+
+from stepler.third_party import shared_resources
+
+
+@pytest.fixture
+def cloud():
+    cloud = mock.Mock(images=set())
+
+    def create():
+        image_id = 'image-{}'.format(cloud.create.call_count)
+        cloud.images.add(image_id)
+        return image_id
+
+    cloud.create.side_effect = create
+    cloud.delete.side_effect = cloud.images.discard
+    return cloud
+
+
+def _share(registry, cloud):
+    return registry.share(
+        'image', create=cloud.create, delete=cloud.delete,
+        dump=lambda image_id: image_id,
+        load=lambda image_id: image_id if image_id in cloud.images else None)
+
+
+def test_resource_created_once(tmpdir, cloud):
+    path = str(tmpdir.join('shared.json'))
+    worker_1 = shared_resources.SharedResources(path)
+    worker_2 = shared_resources.SharedResources(path)
+
+    with _share(worker_1, cloud) as image_1:
+        with _share(worker_2, cloud) as image_2:
+            assert_that(image_2, equal_to(image_1))
+        assert_that(cloud.delete.called, is_(False))
+
+    assert_that(cloud.create.call_count, equal_to(1))
+    cloud.delete.assert_called_once_with(image_1)
+
+
+def test_lost_resource_recreated(tmpdir, cloud):
+    path = str(tmpdir.join('shared.json'))
+    worker_1 = shared_resources.SharedResources(path)
+    worker_2 = shared_resources.SharedResources(path)
+
+    with _share(worker_1, cloud) as image_1:
+        cloud.images.clear()  # environment was reverted
+        with _share(worker_2, cloud) as image_2:
+            assert_that(image_2, equal_to('image-2'))
+        cloud.delete.assert_called_once_with(image_2)
+    assert_that(image_1, equal_to('image-1'))
@@ -0,0 +1,144 @@
+"""
+-----------------------------
+Persistent SSH executor tests
+-----------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+from hamcrest import (assert_that, calling, contains, has_entries,
+                      has_properties, raises)  # noqa H301
+import mock
+import pytest
+
+executor = pytest.importorskip('os_faults.ansible.executor')
+
+from stepler.third_party import ssh  # noqa E402
+from stepler.third_party import ssh_executor  # noqa E402
+
+
+def _make_result(exit_code, stdout):
+    result = ssh.CommandResult()
+    result.exit_code = exit_code
+    result.stdout_bytes = stdout
+    return result
+
+
+@pytest.fixture
+def cloud_management():
+    cloud_management = mock.Mock()
+    cloud_management.cloud_executor = mock.Mock(
+        spec=['options', 'passwords'],
+        options=mock.Mock(
+            remote_user='root',
+            private_key_file=None,
+            become=False,
+            ssh_common_args='-o ProxyCommand="ssh -W %h:%p root@10.0.0.2"'),
+        passwords={'conn_pass': None})
+    return cloud_management
+
+
+@pytest.fixture
+def ssh_client_cls():
+    with mock.patch.object(ssh_executor.ssh, 'SshClient') as ssh_client_cls:
+        yield ssh_client_cls
+
+
+@pytest.fixture
+def nodes():
+    return mock.Mock(hosts=[mock.Mock(ip='10.0.0.3'),
+                            mock.Mock(ip='10.0.0.4')])
+
+
+def test_execute_returns_ansible_like_records(cloud_management,
+                                              ssh_client_cls, nodes):
+    client = ssh_client_cls.return_value
+    client.execute.return_value = _make_result(0, 'foo\nbar\n')
+
+    records = ssh_executor.SshExecutor(cloud_management).execute(nodes, 'ls')
+
+    assert_that(records, contains(
+        has_properties(host='10.0.0.3', status=executor.STATUS_OK,
+                       payload=has_entries(stdout='foo\nbar',
+                                           stdout_lines=['foo', 'bar'],
+                                           rc=0)),
+        has_properties(host='10.0.0.4', status=executor.STATUS_OK)))
+    ssh_client_cls.assert_any_call(
+        '10.0.0.3', username='root', password=None, pkey=None, timeout=None,
+        proxy_cmd='ssh -W 10.0.0.3:22 root@10.0.0.2')
+
+
+def test_connections_are_reused(cloud_management, ssh_client_cls, nodes):
+    # mocks aren't thread-safe, so each host gets its own client
+    clients = {}
+
+    def _make_client(ip, **kwargs):
+        client = clients[ip] = mock.Mock(is_connected=True)
+        client.execute.return_value = _make_result(0, '')
+        return client
+
+    ssh_client_cls.side_effect = _make_client
+
+    node_executor = ssh_executor.SshExecutor(cloud_management)
+    for _ in range(3):
+        node_executor.execute(nodes, 'true')
+
+    assert ssh_client_cls.call_count == 2
+    assert all(client.execute.call_count == 3
+               for client in clients.values())
+
+
+def test_failed_command(cloud_management, ssh_client_cls, nodes):
+    client = ssh_client_cls.return_value
+    client.execute.return_value = _make_result(1, '')
+
+    node_executor = ssh_executor.SshExecutor(cloud_management)
+    records = node_executor.execute(nodes, 'false', raise_on_error=False)
+    assert_that(records[0], has_properties(status=executor.STATUS_FAILED))
+    assert_that(calling(node_executor.execute).with_args(nodes, 'false'),
+                raises(executor.AnsibleExecutionException))
+
+
+def test_unreachable_node(cloud_management, ssh_client_cls, nodes):
+    ssh_client_cls.return_value.connect.side_effect = Exception('timeout')
+
+    node_executor = ssh_executor.SshExecutor(cloud_management)
+    records = node_executor.execute(nodes, 'true', raise_on_error=False)
+    assert_that(records[0],
+                has_properties(status=executor.STATUS_UNREACHABLE))
+    assert_that(calling(node_executor.execute).with_args(nodes, 'true'),
+                raises(executor.AnsibleExecutionUnreachable))
+
+
+def test_nodes_are_connected_in_parallel(cloud_management, ssh_client_cls,
+                                         nodes):
+    both_connecting = threading.Event()
+    connecting = []
+    waited = []
+
+    def connect():
+        connecting.append(True)
+        if len(connecting) == len(nodes.hosts):
+            both_connecting.set()
+        waited.append(both_connecting.wait(5))
+
+    client = ssh_client_cls.return_value
+    client.connect.side_effect = connect
+    client.execute.return_value = _make_result(0, '')
+
+    ssh_executor.SshExecutor(cloud_management).execute(nodes, 'ls')
+
+    assert_that(waited, contains(True, True))
@@ -0,0 +1,76 @@
+"""
+-------------------
+State watcher tests
+-------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from hamcrest import (assert_that, contains, equal_to, has_properties,
+                      none)  # noqa H301
+import mock
+import pytest
+
+from stepler.third_party import state_watcher
+from stepler.third_party import waiter
+
+
+@pytest.fixture
+def watcher():
+    watcher = state_watcher.StateWatcher(interval=0.01)
+    yield watcher
+    watcher.stop()
+
+
+def test_initial_state_is_polled_on_subscribe(watcher):
+    poll = mock.Mock(return_value={'agent-1': True})
+
+    watcher.subscribe('agents', poll)
+    watcher.subscribe('agents', poll)
+
+    assert_that(watcher.get_state('agents'), equal_to({'agent-1': True}))
+    assert_that(watcher.get_state('other'), none())
+
+
+def test_changes_are_recorded(watcher):
+    states = iter([{'agent-1': True, 'agent-2': True}])
+    watcher.subscribe('agents', lambda: next(states, {'agent-1': False,
+                                                      'agent-2': True}))
+
+    def _check_changed():
+        return waiter.expect_that(watcher.get_timeline('agents'),
+                                  contains(has_properties(key='agents',
+                                                          item='agent-1',
+                                                          old=True,
+                                                          new=False)))
+
+    waiter.wait(_check_changed, timeout_seconds=5)
+    assert_that(watcher.get_timeline('other'), equal_to([]))
+
+
+def test_poll_errors_are_ignored(watcher):
+    poll = mock.Mock(side_effect=Exception('Service unavailable'))
+
+    watcher.subscribe('agents', poll)
+    waiter.wait(lambda: poll.call_count > 1, timeout_seconds=5)
+
+    assert_that(watcher.get_state('agents'), none())
+
+
+def test_unsubscribe_all(watcher):
+    watcher.subscribe('agents', lambda: {'agent-1': True})
+
+    watcher.unsubscribe_all()
+
+    assert_that(watcher.get_state('agents'), none())
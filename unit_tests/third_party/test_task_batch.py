@@ -0,0 +1,134 @@
+"""
+---------------------------
+Ansible tasks batcher tests
+---------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from hamcrest import (assert_that, calling, contains, empty, has_entries,
+                      has_length, has_properties, raises)  # noqa H301
+import mock
+import pytest
+
+executor = pytest.importorskip('os_faults.ansible.executor')
+
+from stepler.third_party import task_batch  # noqa E402
+
+HOSTS = [mock.Mock(ip='10.0.0.1'), mock.Mock(ip='10.0.0.2')]
+
+
+def _make_nodes(statuses):
+    """Make nodes mock, which runner returns records with passed statuses."""
+
+    def run_playbook(playbook, host_vars):
+        records = []
+        for task, status in zip(playbook[0]['tasks'], statuses):
+            for host in playbook[0]['hosts']:
+                records.append(executor.AnsibleExecutionRecord(
+                    host=host, status=status, task=task['name'],
+                    payload={'stdout': task.get('shell', '')}))
+        return records
+
+    nodes = mock.Mock(hosts=HOSTS)
+    nodes.cloud_management.cloud_executor = mock.Mock(
+        spec=['run_playbook', 'serial'], serial=10)
+    nodes.cloud_management.cloud_executor.run_playbook.side_effect = (
+        run_playbook)
+    return nodes
+
+
+def test_tasks_run_with_single_play():
+    nodes = _make_nodes([executor.STATUS_OK] * 2)
+    batch = task_batch.TaskBatch(nodes)
+    batch.add_shell('ls /')
+    batch.add({'ini_file': {'dest': '/etc/foo.conf'}})
+    results = batch.run()
+
+    runner = nodes.cloud_management.cloud_executor
+    assert runner.run_playbook.call_count == 1
+    playbook = runner.run_playbook.call_args[0][0]
+    assert_that(playbook, contains(has_entries(
+        hosts=['10.0.0.1', '10.0.0.2'],
+        serial=10,
+        tasks=contains(
+            has_entries(shell='ls /', ignore_errors=True),
+            has_entries(ini_file={'dest': '/etc/foo.conf'})))))
+    assert_that(results, contains(has_length(2), has_length(2)))
+    assert_that(results[0][0], has_properties(
+        status=executor.STATUS_OK, payload={'stdout': 'ls /'}))
+    assert not nodes.run_task.called
+
+
+def test_failed_task_raises():
+    nodes = _make_nodes([executor.STATUS_OK, executor.STATUS_FAILED])
+    batch = task_batch.TaskBatch(nodes)
+    batch.add_shell('true')
+    batch.add_shell('false')
+    assert_that(calling(batch.run),
+                raises(executor.AnsibleExecutionException))
+
+
+def test_failed_task_without_raise():
+    nodes = _make_nodes([executor.STATUS_FAILED, executor.STATUS_OK])
+    batch = task_batch.TaskBatch(nodes)
+    batch.add_shell('false')
+    batch.add_shell('true')
+    results = batch.run(raise_on_error=False)
+    assert_that(results[0][0], has_properties(status=executor.STATUS_FAILED))
+    assert_that(results[1][0], has_properties(status=executor.STATUS_OK))
+
+
+def test_not_ignored_task_errors():
+    nodes = _make_nodes([executor.STATUS_OK])
+    batch = task_batch.TaskBatch(nodes)
+    batch.add_shell('cp /etc/foo.conf /tmp/foo.conf', ignore_errors=False)
+    batch.add_shell('true')
+    batch.run()
+
+    playbook = nodes.cloud_management.cloud_executor.run_playbook.call_args[
+        0][0]
+    assert_that(playbook[0]['tasks'], contains(
+        has_entries(ignore_errors=False), has_entries(ignore_errors=True)))
+
+
+def test_fallback_stops_after_not_ignored_failure():
+    nodes = mock.Mock(hosts=HOSTS)
+    nodes.cloud_management = mock.Mock(spec=[])
+    nodes.run_task.return_value = [
+        executor.AnsibleExecutionRecord(host='10.0.0.1',
+                                        status=executor.STATUS_FAILED,
+                                        task=None, payload={})]
+    batch = task_batch.TaskBatch(nodes)
+    batch.add_shell('cp /etc/foo.conf /tmp/foo.conf', ignore_errors=False)
+    batch.add_shell('true')
+    results = batch.run(raise_on_error=False)
+    assert nodes.run_task.call_count == 1
+    assert_that(results, contains(has_length(1), empty()))
+
+
+def test_fallback_without_ansible_runner():
+    nodes = mock.Mock(hosts=HOSTS)
+    nodes.cloud_management = mock.Mock(spec=[])
+    nodes.run_task.return_value = []
+    batch = task_batch.TaskBatch(nodes)
+    batch.add_shell('ls /')
+    batch.add_shell('ls /tmp')
+    batch.run()
+    assert nodes.run_task.call_count == 2
+
+
+def test_empty_batch():
+    nodes = _make_nodes([])
+    assert_that(task_batch.TaskBatch(nodes).run(), empty())
@@ -0,0 +1,93 @@
+"""
+--------------------------
+Cloud topology cache tests
+--------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from hamcrest import assert_that, contains, equal_to  # noqa H301
+import mock
+import pytest
+
+from stepler.third_party import topology
+
+
+def _make_nodes(*fqdns):
+    hosts = [mock.Mock(fqdn=fqdn, ip='10.0.0.{}'.format(i))
+             for i, fqdn in enumerate(fqdns, 1)]
+    nodes = mock.Mock(hosts=hosts)
+    nodes.filter.side_effect = lambda fn: _make_nodes(
+        *[host.fqdn for host in hosts if fn(host)])
+    return nodes
+
+
+@pytest.fixture
+def client():
+    client = mock.Mock()
+    client.get_nodes.return_value = _make_nodes('node-1', 'node-2', 'node-3')
+    services = {'nova-api': _make_nodes('node-1'),
+                'nova-compute': _make_nodes('node-2', 'node-3')}
+    client.get_service.side_effect = lambda name: mock.Mock(
+        get_nodes=mock.Mock(return_value=services[name]))
+    return client
+
+
+def test_nodes_discovered_once(client):
+    cache = topology.Topology(client)
+    for _ in range(3):
+        nodes = cache.get_nodes(fqdns=['node-2'])
+
+    assert_that([host.fqdn for host in nodes.hosts], contains('node-2'))
+    assert_that(cache.get_ip('node-3'), equal_to('10.0.0.3'))
+    assert client.get_nodes.call_count == 1
+
+
+def test_services_discovered_once(client):
+    cache = topology.Topology(client)
+    for _ in range(3):
+        fqdns = cache.get_service_fqdns('nova-compute')
+    cache.get_service_fqdns('nova-api')
+
+    assert_that(fqdns, equal_to({'node-2', 'node-3'}))
+    assert_that(cache.get_service_names('node-1'), contains('nova-api'))
+    assert client.get_service.call_count == 2
+
+
+def test_invalidate_services(client):
+    cache = topology.Topology(client)
+    cache.get_nodes()
+    cache.get_service_fqdns('nova-api')
+    cache.get_service_fqdns('nova-compute')
+
+    cache.invalidate(service_names=['nova-api'])
+    cache.get_nodes()
+    cache.get_service_fqdns('nova-api')
+    cache.get_service_fqdns('nova-compute')
+
+    assert client.get_nodes.call_count == 1
+    assert client.get_service.call_count == 3
+
+
+def test_invalidate_all(client):
+    cache = topology.Topology(client)
+    cache.get_nodes()
+    cache.get_service_fqdns('nova-api')
+
+    cache.invalidate()
+    cache.get_nodes()
+    cache.get_service_fqdns('nova-api')
+
+    assert client.get_nodes.call_count == 2
+    assert client.get_service.call_count == 2
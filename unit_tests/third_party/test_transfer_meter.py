@@ -0,0 +1,59 @@
+"""
+-------------------------------
+Data transfer speed meter tests
+-------------------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+
+from hamcrest import assert_that, close_to, equal_to  # noqa H301
+import mock
+
+from stepler.third_party import transfer_meter
+
+
+def test_wrap_file():
+    meter = transfer_meter.TransferMeter('upload')
+    f = meter.wrap_file(io.BytesIO(b'x' * 100))
+
+    assert_that(f.read(60), equal_to(b'x' * 60))
+    assert_that(f.read(), equal_to(b'x' * 40))
+    assert_that(f.tell(), equal_to(100))
+    assert_that(meter.transferred, equal_to(100))
+
+
+def test_wrap_chunks():
+    meter = transfer_meter.TransferMeter('upload')
+    f = meter.wrap_chunks(iter([b'a' * 10, b'', b'b' * 20]))
+
+    assert_that(f.read(4), equal_to(b'a' * 4))
+    assert_that(f.read(16), equal_to(b'a' * 6 + b'b' * 10))
+    assert_that(f.read(), equal_to(b'b' * 10))
+    assert_that(f.read(4), equal_to(b''))
+    assert_that(meter.transferred, equal_to(30))
+
+
+def test_speed():
+    meter = transfer_meter.TransferMeter('upload', total=300)
+    with mock.patch.object(transfer_meter.time, 'time') as time:
+        time.return_value = 10.
+        meter.update(100)
+        time.return_value = 12.
+        meter.update(200)
+        meter.finish()
+
+    assert_that(meter.duration, close_to(2., 1e-6))
+    assert_that(meter.speed, close_to(150., 1e-6))
@@ -0,0 +1,63 @@
+"""
+---------------
+TTL cache tests
+---------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from hamcrest import assert_that, equal_to  # noqa H301
+import mock
+
+from stepler.third_party import ttl_cache
+
+
+def test_value_is_cached():
+    cache = ttl_cache.TtlCache(ttl=60)
+    calculate = mock.Mock(return_value='network')
+
+    assert_that(cache.get('public', calculate), equal_to('network'))
+    assert_that(cache.get('public', calculate), equal_to('network'))
+    assert_that(calculate.call_count, equal_to(1))
+
+
+def test_value_is_expired():
+    cache = ttl_cache.TtlCache(ttl=60)
+    calculate = mock.Mock(side_effect=['old', 'new'])
+
+    with mock.patch('time.time', return_value=1000):
+        cache.get('public', calculate)
+    with mock.patch('time.time', return_value=1061):
+        assert_that(cache.get('public', calculate), equal_to('new'))
+
+
+def test_value_ttl_overrides_default():
+    cache = ttl_cache.TtlCache(ttl=60)
+    calculate = mock.Mock(side_effect=['old', 'new'])
+
+    with mock.patch('time.time', return_value=1000):
+        cache.get('dhcp_host', calculate, ttl=10)
+    with mock.patch('time.time', return_value=1011):
+        assert_that(cache.get('dhcp_host', calculate, ttl=10),
+                    equal_to('new'))
+
+
+def test_invalidate():
+    cache = ttl_cache.TtlCache(ttl=60)
+    calculate = mock.Mock(side_effect=['old', 'new'])
+
+    cache.get('public', calculate)
+    cache.invalidate('public')
+
+    assert_that(cache.get('public', calculate), equal_to('new'))
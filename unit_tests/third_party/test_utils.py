@@ -0,0 +1,99 @@
+"""
+------------------
+Utils module tests
+------------------
+"""
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+
+from hamcrest import (assert_that, calling, equal_to, has_length, is_not,
+                      less_than_or_equal_to, raises)  # noqa H301
+import pytest
+
+from stepler.third_party import utils
+
+
+def _read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+@pytest.mark.parametrize('mode', ['random', 'zero', 'pattern'])
+def test_chunks_are_bounded(mode):
+    chunks = list(utils.generate_file_chunks(10 * 1024 + 1, mode=mode,
+                                             seed=1, chunk_size=1024))
+
+    assert_that(sum(len(chunk) for chunk in chunks), equal_to(10 * 1024 + 1))
+    assert_that(max(len(chunk) for chunk in chunks),
+                less_than_or_equal_to(1024))
+
+
+def test_unknown_mode():
+    assert_that(calling(list).with_args(
+        utils.generate_file_chunks(10, mode='unknown')), raises(ValueError))
+
+
+def test_seeded_random_is_reproducible(tmpdir):
+    path = str(tmpdir.join('file'))
+    digest_1 = utils.write_file(path, 3000, seed=42, checksum='md5')
+    digest_2 = utils.write_file(path, 3000, seed=42, checksum='md5')
+    digest_3 = utils.write_file(path, 3000, seed=43, checksum='md5')
+
+    assert_that(digest_1, equal_to(digest_2))
+    assert_that(digest_1, is_not(equal_to(digest_3)))
+    assert_that(digest_3, equal_to(hashlib.md5(_read(path)).hexdigest()))
+
+
+def test_seeded_random_chunks_differ():
+    chunks = list(utils.generate_file_chunks(4 * 1024, seed=42,
+                                             chunk_size=1024))
+
+    assert_that(set(chunks), has_length(4))
+
+
+def test_sparse_file(tmpdir):
+    path = str(tmpdir.join('file'))
+    digest = utils.write_file(path, 10 * 1024 * 1024, mode='sparse',
+                              checksum='sha256')
+
+    assert_that(os.path.getsize(path), equal_to(10 * 1024 * 1024))
+    assert_that(digest, equal_to(
+        hashlib.sha256(b'\0' * 10 * 1024 * 1024).hexdigest()))
+
+
+def test_generate_files(tmpdir):
+    paths = list(utils.generate_files(folder=str(tmpdir), count=2, size=100,
+                                      mode='pattern'))
+
+    assert_that([os.path.getsize(path) for path in paths],
+                equal_to([100, 100]))
+    assert_that(_read(paths[0]), equal_to(_read(paths[1])))
+
+
+def test_map_parallel_keeps_order():
+    results = utils.map_parallel(lambda x: x * 2, range(10), threads=3)
+
+    assert_that(results, equal_to([x * 2 for x in range(10)]))
+
+
+def test_md5sum_leaves_no_files(tmpdir):
+    path = tmpdir.join('file.bin')
+    path.write(b'content', mode='wb')
+
+    assert_that(utils.get_md5sum(str(path)),
+                equal_to(hashlib.md5(b'content').hexdigest()))
+    assert_that(tmpdir.listdir(), equal_to([path]))